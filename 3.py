@@ -1,226 +1,400 @@
 import streamlit as st
-import folium
-# from folium.plugins import MarkerCluster # (참고) 클러스터 기능은 현재 제거된 상태입니다.
-from streamlit_folium import st_folium
-import pandas as pd
 import webbrowser # (참고) 서버 환경에서는 직접 사용되지 않습니다.
 
+import dataset_watcher
+import map_layers
+import metrics
+import name_search
+import navigation
+import univ_cache
+import univ_store
+
 # --- 1. 데이터 로드 (캐시 사용으로 성능 향상) ---
-@st.cache_data
-def load_data(file_path):
+def build_store(file_path):
+    """엑셀(또는 변환해 둔 캐시 파일)을 읽어 대학 정보 저장소 생성 (형식이 틀리면 SchemaError)"""
+    df, version = univ_cache.load_versioned(file_path)
+    return univ_store.UniversityStore(df, version=version)
+
+
+def page_base_map(store, mode=None, remote=False):
+    """
+    페이지가 쓰는 기본 지도 (map_layers.base_map 캐시)
+    st.cache_resource는 키워드로 넘긴 인자와 기본값을 다른 키로 보므로,
+    미리 만들기(warm_store)와 페이지가 같은 항목을 쓰도록 호출을 이 함수 하나로 모음
+    """
+    return map_layers.base_map(store.version, DEFAULT_CENTER, DEFAULT_ZOOM, store, mode=mode, remote=remote)
+
+
+def warm_store(store):
+    """새 버전의 기본 지도를 미리 만들어 둠 (감시 스레드에서, 첫 화면 요청이 기다리지 않도록)"""
+    page_base_map(store)
+
+
+@st.cache_resource
+def get_watcher(file_path):
+    """
+    대학 정보 감시자 (프로세스당 하나, 모든 세션이 공유)
+    엑셀 파일이 바뀌면 백그라운드에서 새 저장소를 만들고 검사가 끝난 뒤에만 바꿉니다.
+    """
+    watcher = dataset_watcher.DatasetWatcher(file_path, load=build_store, warm=warm_store)
+    watcher.load_initial()
+    return watcher.start()
+
+
+def use_version(version):
+    """'새 목록 보기' 버튼 콜백"""
+    st.session_state[VERSION_KEY] = version
+
+
+def load_store(file_path):
+    """
+    이 세션이 쓰는 대학 정보 저장소
+    링크 URL, 버튼 문구, 팝업 HTML과 대학명 색인이 미리 계산되어 있습니다.
+    데이터가 바뀌어도 세션은 처음 본 버전을 계속 쓰고(검색 결과/선택이 갑자기 바뀌지 않도록),
+    새 버전이 있다는 안내에서 직접 바꿀 수 있습니다.
+    """
     try:
-        # 엑셀 파일 로드 시 dtype을 string으로 지정하여 URL 등이 숫자로 변환되는 것을 방지
-        # (주의) '홈페이지주소 ' 컬럼명에 공백이 포함된 것을 확인하고 dtype에 반영
-        return pd.read_excel(file_path, dtype={'홈페이지주소 ': str, '대학 및 입시정보': str})
+        watcher = get_watcher(file_path)
     except FileNotFoundError:
         st.error(f"'{file_path}' 파일을 찾을 수 없습니다. 엑셀 파일이 코드와 같은 폴더에 있는지 확인하세요.")
         return None
+    except univ_cache.SchemaError as e:
+        st.error(f"엑셀 파일 형식이 올바르지 않습니다: {e}")
+        return None
     except Exception as e:
         st.error(f"데이터 로드 중 오류 발생: {e}")
         return None
 
-# (중요) 사용자가 업로드한 파일명 '대학원본.xlsx'로 수정
-sb = load_data('대학원본.xlsx')
+    latest = watcher.current()
+    store = watcher.get(st.session_state.get(VERSION_KEY))
+    if store is None:
+        # 처음 방문했거나 보던 버전이 오래되어 버려진 경우
+        store = latest
+        st.session_state[VERSION_KEY] = store.version
+    elif store is not latest:
+        st.info("대학 정보가 새로 바뀌었습니다. 지금 보고 있는 목록은 이전 버전입니다.")
+        st.button("새 목록 보기", key="university.reload", on_click=use_version, args=(latest.version,))
+    return store
 
-if sb is None:
-    st.stop()
+# (중요) 사용자가 업로드한 파일명 '대학원본.xlsx'로 수정
+DATA_FILE = '대학원본.xlsx'
 
-# --- 2. 초기값 및 세션 상태 설정 ---
-DEFAULT_CENTER = [37.5665, 126.9780] # 서울 시청 중심
+# --- 2. 초기값 설정 ---
+DEFAULT_CENTER = (37.5665, 126.9780) # 서울 시청 중심
 DEFAULT_ZOOM = 11
 
-if 'selected_name' not in st.session_state:
-    st.session_state.selected_name = None
-
-# --- 3. 검색 기능 (지도보다 위로 이동) ---
-st.divider() 
-st.header("대학교 검색")
-
-search_term = st.text_input(
-    "대학명을 2글자 이상 입력하세요:",
-    placeholder="예: 서울, 경북, 한양"
-)
-
-selected_name = None  
-
-if len(search_term) >= 2:
-    mask = sb['대학명'].str.contains(search_term, case=False, na=False)
-    filtered_df = sb[mask]
-
-    if not filtered_df.empty:
-        university_names = filtered_df['대학명'].unique().tolist()
-        
-        st.write(f"'{search_term}' 검색 결과 (총 {len(university_names)}개):")
-        
-        col1, col2 = st.columns([3, 1]) 
-
-        with col1:
-            default_index = None
-            if st.session_state.selected_name in university_names:
-                default_index = university_names.index(st.session_state.selected_name)
-
-            selected_name = st.selectbox(
-                "selectbox_label", 
-                options=university_names,
-                index=default_index, 
-                placeholder="목록에서 학교를 선택하세요.",
-                label_visibility="collapsed" 
-            )
-
-        # --- [수정된 부분: 버튼 로직 변경 (Fallback 기능 추가)] ---
-        with col2:
-            current_selection = st.session_state.selected_name
-            
-            if current_selection:
-                try:
-                    school_data = sb[sb['대학명'] == current_selection].iloc[0]
-                    url_info = school_data['대학 및 입시정보']
-                    url_home = school_data['홈페이지주소 '] # (주의) 컬럼명에 공백 포함
-                    
-                    final_url = None
-                    button_label = "정보 없음"
-                    is_disabled = True
-                    help_text = "선택된 학교의 정보 URL이 없습니다."
-
-                    # 1. '대학 및 입시정보' URL 확인 (http로 시작하는지)
-                    if not pd.isna(url_info) and str(url_info).strip().startswith('http'):
-                        # 입시 정보 URL이 있음
-                        final_url = str(url_info).strip()
-                        button_label = "대학 및 입시정보"
-                        is_disabled = False
-                        help_text = f"{current_selection} 입시 정보로 이동합니다."
-                    
-                    # 2. (Fallback) '홈페이지주소 ' URL 확인 (단순히 비어있지 않은지)
-                    elif not pd.isna(url_home) and str(url_home).strip(): # Check if not NaN and not an empty string
-                        # 홈페이지 URL만 있음
-                        home_url_stripped = str(url_home).strip()
-                        
-                        # http(s)://가 없으면 붙여줌
-                        if not home_url_stripped.startswith('http'):
-                            final_url = f"https://{home_url_stripped}"
-                        else:
-                            final_url = home_url_stripped
-                            
-                        button_label = "홈페이지" # 버튼 레이블 변경
-                        is_disabled = False
-                        help_text = f"{current_selection} 홈페이지로 이동합니다."
-                    
-                    # 3. 둘 다 유효한 URL이 없는 경우 (위의 if/elif를 통과 못함)
-                    # final_url = None, button_label = "정보 없음" 등이 유지됨
-
-
-                    # 4. 최종 URL 상태에 따라 버튼 표시
-                    if final_url and not is_disabled:
+MAP_KEY = "main_map"
+MAP_WIDTH, MAP_HEIGHT = 1000, 600
+
+SEARCH_KEY = "university.search"
+SELECT_KEY = "university.select"
+FACET_KEY_PREFIX = "university.facet."
+VERSION_KEY = "university.version"
+
+NEARBY_COUNT = 5     # 가까운 대학 목록 개수
+NEARBY_RADIUS_KM = 10
+
+
+def initialize_session_state():
+    """세션 상태 초기화"""
+    if 'selected_name' not in st.session_state:
+        st.session_state.selected_name = None
+
+
+def facet_selection(store):
+    """조건 필터 위젯에서 고른 값 {열: 값 tuple}"""
+    return {column: tuple(st.session_state.get(FACET_KEY_PREFIX + column, ()))
+            for column in store.facets.columns}
+
+
+def search_names(store, search_term):
+    """
+    검색어와 조건 필터에 맞는 대학명 목록, 오타 검색 여부, 목록이 잘렸는지
+    목록은 조건 필터를 적용한 뒤 앞 name_search.RESULT_LIMIT개까지 (선택 상자에 수만 개를 보내지 않도록)
+    검색어가 2글자 미만이면 빈 목록 (검색어 없이 조건만 고른 경우에는 조건에 맞는 목록)
+    """
+    limit = name_search.RESULT_LIMIT
+    allowed = store.filter_names(facet_selection(store))
+    if len(search_term) < 2:
+        if allowed is not None and not search_term:
+            return list(allowed[:limit]), False, len(allowed) > limit
+        return [], False, False
+    # 하나 더 받아서 잘렸는지 확인
+    matches = store.search(search_term, limit + 1, None if allowed is None else set(allowed))
+    return list(matches.names[:limit]), matches.fuzzy, len(matches.names) > limit
+
+
+def count_label(names, truncated):
+    """결과 개수 문구 (잘렸으면 더 좁히라는 안내)"""
+    if truncated:
+        return f"앞 {len(names)}개만 표시, 검색어나 조건을 더 입력하세요"
+    return f"총 {len(names)}개"
+
+
+# --- 3. 검색/선택 콜백 (스크립트 실행 전에 selected_name을 맞춰 두므로 st.rerun()이 필요 없음) ---
+def on_search_change(store):
+    """검색어가 바뀌면 새 검색 결과에 없는 선택을 해제 (1글자 입력 중에는 유지)"""
+    selected = st.session_state.get('selected_name')
+    search_term = st.session_state[SEARCH_KEY]
+    if len(search_term) == 1 or selected is None:
+        return
+    if selected not in search_names(store, search_term)[0]:
+        st.session_state.selected_name = None
+
+
+def on_filter_change(store):
+    """조건이 바뀌면 조건에 맞지 않게 된 선택을 해제"""
+    selected = st.session_state.get('selected_name')
+    allowed = store.filter_names(facet_selection(store))
+    if selected is not None and allowed is not None and selected not in allowed:
+        st.session_state.selected_name = None
+
+
+def on_select_change():
+    """목록에서 고른 학교를 selected_name에 반영"""
+    st.session_state.selected_name = st.session_state[SELECT_KEY]
+
+
+def select_school(store, name):
+    """
+    가까운 대학 목록이나 지도에서 고른 학교로 검색어와 선택을 함께 바꿈 (검색 결과 목록에 그 학교가 나오도록)
+    지도 조각 안의 콜백이므로 검색 영역까지 다시 그리도록 전체 앱을 실행합니다.
+    """
+    st.session_state[SEARCH_KEY] = name
+    st.session_state.pop(SELECT_KEY, None)
+    st.session_state.selected_name = name
+    allowed = store.filter_names(facet_selection(store))
+    if allowed is not None and name not in allowed:
+        # 조건 필터에 걸리는 학교면 조건을 풀어 목록에 나오게 함
+        for column in store.facets.columns:
+            st.session_state[FACET_KEY_PREFIX + column] = []
+    navigation.rerun_app()
+
+
+def on_map_change(store):
+    """지도에서 학교 점을 클릭하면 그 학교를 선택 (툴팁이 학교명, 묶음 원 등 학교가 아닌 점은 무시)"""
+    state = st.session_state.get(MAP_KEY) or {}
+    name = (state.get("last_object_clicked_tooltip") or "").strip()
+    if store.get(name) is None or name == st.session_state.get('selected_name'):
+        return
+    select_school(store, name)
+
+
+# --- 4. 검색 기능 (지도보다 위로 이동) ---
+def show_filter_section(store, selection):
+    """지역/설립유형/대학 유형 조건 필터 (값 옆 숫자는 나머지 조건을 적용했을 때의 학교 수)"""
+    if not store.facets.columns:
+        return
+    counts = store.facets.counts(selection)
+    with st.expander("조건으로 찾기 (지역 · 설립유형 · 대학 유형)", expanded=store.facets.active(selection)):
+        for column, container in zip(store.facets.columns, st.columns(len(store.facets.columns))):
+            with container:
+                st.multiselect(
+                    column,
+                    options=store.facets.values[column],
+                    format_func=lambda value, column=column: f"{value} ({counts[column][value]})",
+                    placeholder="전체",
+                    key=FACET_KEY_PREFIX + column,
+                    on_change=on_filter_change,
+                    args=(store,)
+                )
+        rows = store.facets.rows(selection)
+        if rows is not None:
+            st.caption(f"조건에 맞는 학교 {len(rows)}곳")
+
+
+@metrics.timed("university.show_search_section")
+def show_search_section(store):
+    """대학교 검색창, 검색 결과 목록, 정보 버튼 표시"""
+    st.divider() 
+    st.header("대학교 검색")
+
+    search_term = st.text_input(
+        "대학명을 2글자 이상 입력하세요:",
+        placeholder="예: 서울, 한양, ㅎㅇ, 이화여대",
+        key=SEARCH_KEY,
+        on_change=on_search_change,
+        args=(store,)
+    )
+
+    selection = facet_selection(store)
+    show_filter_section(store, selection)
+
+    if len(search_term) >= 2 or (store.facets.active(selection) and not search_term):
+        university_names, fuzzy, truncated = search_names(store, search_term)
+
+        if university_names:
+            count = count_label(university_names, truncated)
+            if not search_term:
+                st.write(f"조건에 맞는 학교 ({count}):")
+            elif fuzzy:
+                st.write(f"'{search_term}'와(과) 일치하는 이름이 없어 비슷한 이름을 찾았습니다 ({count}):")
+            else:
+                st.write(f"'{search_term}' 검색 결과 ({count}):")
+
+            col1, col2 = st.columns([3, 1]) 
+
+            with col1:
+                default_index = None
+                if st.session_state.selected_name in university_names:
+                    default_index = university_names.index(st.session_state.selected_name)
+
+                st.selectbox(
+                    "selectbox_label", 
+                    options=university_names,
+                    index=default_index, 
+                    placeholder="목록에서 학교를 선택하세요.",
+                    label_visibility="collapsed",
+                    key=SELECT_KEY,
+                    on_change=on_select_change
+                )
+
+            # --- [수정된 부분: 버튼 로직 변경 (Fallback 기능 추가)] ---
+            # 입시정보 URL -> 홈페이지 URL 순서의 최종 URL과 문구는 저장소에 미리 계산되어 있음
+            with col2:
+                current_selection = st.session_state.selected_name
+
+                if current_selection:
+                    school = store.get(current_selection)
+
+                    if school is None:
+                        st.button("정보 오류", use_container_width=True, disabled=True,
+                                  help=f"정보 조회 오류: {current_selection}")
+                    elif school.final_url:
                         st.link_button(
-                            button_label, 
-                            final_url,
+                            school.button_label, 
+                            school.final_url,
                             use_container_width=True
                         )
                     else:
                         st.button(
-                            button_label, 
+                            school.button_label, 
                             use_container_width=True, 
                             disabled=True, 
-                            help=help_text
+                            help=school.help_text
                         )
-                        
-                except Exception as e:
-                    st.button("정보 오류", use_container_width=True, disabled=True, help=f"정보 조회 오류: {e}")
-            else:
-                st.button(
-                    "대학 및 입시정보", 
-                    use_container_width=True, 
-                    disabled=True,
-                    help="먼저 검색 목록에서 학교를 선택하세요."
-                )
-        # --- [수정된 부분 끝] ---
+                else:
+                    st.button(
+                        "대학 및 입시정보", 
+                        use_container_width=True, 
+                        disabled=True,
+                        help="먼저 검색 목록에서 학교를 선택하세요."
+                    )
+            # --- [수정된 부분 끝] ---
 
-        if selected_name != st.session_state.selected_name:
-            st.session_state.selected_name = selected_name
-            st.rerun() 
-            
-    else:
-        st.warning("검색 결과가 없습니다.")
-        if st.session_state.selected_name is not None:
-            st.session_state.selected_name = None
-            st.rerun()
-
-elif len(search_term) == 1:
-    st.info("검색어를 2글자 이상 입력해 주세요.(00대학교면 00을 입력)")
-else:
-    st.info("지도에서 학교명을 클릭하거나 검색창에 대학교 이름을 입력해 주세요.")
-    if st.session_state.selected_name is not None:
-        st.session_state.selected_name = None
-        st.rerun()
-
-# --- 4. 지도 표시 (검색 기능 아래로 이동) ---
-
-if st.session_state.selected_name:
-    school_data = sb[sb['대학명'] == st.session_state.selected_name].iloc[0]
-    map_center = [school_data['위도'], school_data['경도']]
-    map_zoom = 15 
-else:
-    map_center = DEFAULT_CENTER
-    map_zoom = DEFAULT_ZOOM
-
-m = folium.Map(location=map_center, zoom_start=map_zoom)
-
-# 4-3. 마커 추가 (팝업 기능 추가)
-for i in sb.index:
-    name = sb.loc[i, '대학명']
-    lat = sb.loc[i, '위도']
-    lon = sb.loc[i, '경도']
-    
-    # --- [수정된 부분: 마커 클릭 시 URL 팝업 (Fallback 기능 추가)] ---
-    # 1. 해당 학교의 URL 가져오기
-    url_info = sb.loc[i, '대학 및 입시정보']
-    url_home = sb.loc[i, '홈페이지주소 '] # (주의) 컬럼명에 공백 포함
-    
-    final_url = None
-    link_text = "정보 링크 없음"
-    
-    # 2. URL 우선순위 결정
-    # 2-1. '대학 및 입시정보' URL 확인 (http로 시작하는지)
-    if not pd.isna(url_info) and str(url_info).strip().startswith('http'):
-        final_url = str(url_info).strip()
-        link_text = "대학 및 입시정보 열기"
-    
-    # 2-2. (Fallback) '홈페이지주소 ' URL 확인 (단순히 비어있지 않은지)
-    elif not pd.isna(url_home) and str(url_home).strip():
-        home_url_stripped = str(url_home).strip()
-        
-        # http(s)://가 없으면 붙여줌
-        if not home_url_stripped.startswith('http'):
-            final_url = f"https://{home_url_stripped}"
         else:
-            final_url = home_url_stripped
-            
-        link_text = "홈페이지 열기" # 링크 텍스트 변경
-    
-    # 2-3. 둘 다 없으면 final_url = None, link_text = "정보 링크 없음" 유지
-
-    # 3. 팝업창에 표시할 HTML 내용 생성
-    popup_html = f"<b>{name}</b><br><hr>"
-    if final_url:
-        popup_html += f'<a href="{final_url}" target="_blank">{link_text}</a>'
+            st.warning("검색 결과가 없습니다.")
+
+    elif len(search_term) == 1:
+        st.info("검색어를 2글자 이상 입력해 주세요.(00대학교면 00을 입력)")
     else:
-        popup_html += link_text # "정보 링크 없음"
-    
-    # 4. Folium 팝업 객체 생성
-    popup = folium.Popup(popup_html, max_width=300)
-    # --- [수정된 부분 끝] ---
-
-    is_selected = (name == st.session_state.selected_name)
-    
-    folium.Marker(
-        [lat, lon],
-        tooltip=name,
-        popup=popup, 
-        icon=folium.Icon(
-            color='red' if is_selected else 'green', 
-            icon='star'
+        st.info("지도에서 학교를 클릭하거나 검색창에 대학교 이름을 입력해 주세요.")
+
+
+# --- 5. 지도 표시 (검색 기능 아래로 이동) ---
+@metrics.timed("university.show_map")
+def show_map(store):
+    """
+    대학교 위치 지도 표시
+    전체 마커가 들어간 기본 지도는 데이터 버전마다 한 번만 만들고(map_layers),
+    rerun마다 선택한 학교 강조 레이어와 중심/확대 수준만 보냅니다.
+    브라우저에서는 클릭한 학교만 돌려받고(보이는 범위는 viewport 모드에서만), 그 밖의 이동/확대는 rerun을 만들지 않습니다.
+    """
+    school = store.get(st.session_state.selected_name)
+    if school is not None and map_layers.has_location(school):
+        map_center = [school.lat, school.lon]
+        map_zoom = 15 
+    else:
+        if school is not None:
+            st.caption(f"{school.name}의 위치 정보가 없어 지도에 표시하지 않습니다.")
+        map_center = list(DEFAULT_CENTER)
+        map_zoom = DEFAULT_ZOOM
+
+    returned_objects = map_layers.CLICK_OBJECTS
+    with metrics.timer("university.build_map"):
+        # 조건 필터를 고르면 점 없는 기본 지도 + 조건에 맞는 학교만 그린 레이어
+        rows = store.facets.rows(facet_selection(store))
+        mode = map_layers.VIEWPORT if rows is not None else None
+        base = page_base_map(store, mode, map_layers.remote_client())
+        layers = [map_layers.selection_layer(school)]
+        if base.mode == map_layers.VIEWPORT:
+            # 학교가 아주 많으면 지도에 보이는 범위의 학교만 그림 (브라우저가 알려 준 범위, 처음에는 계산값)
+            bounds = map_layers.returned_bounds(st.session_state.get(MAP_KEY))
+            if bounds is None:
+                bounds = map_layers.view_bounds(map_center, map_zoom, MAP_WIDTH, MAP_HEIGHT)
+            layers.insert(0, map_layers.viewport_layer(store, bounds, rows))
+            returned_objects += map_layers.VIEW_OBJECTS
+
+    # 4-4. 지도 표시
+    with metrics.timer("university.st_folium"):
+        map_layers.show_map(base, MAP_KEY, center=map_center, zoom=map_zoom, layers=layers,
+                            width=MAP_WIDTH, height=MAP_HEIGHT, returned_objects=list(returned_objects),
+                            on_change=lambda: on_map_change(store))
+
+
+# --- 6. 가까운 대학 ---
+@metrics.timed("university.show_nearby_section")
+def show_nearby_section(store):
+    """선택한 학교(없으면 지도 중심) 근처 대학 목록 (격자 색인으로 주변 칸만 계산)"""
+    school = store.get(st.session_state.selected_name)
+    located = school is not None and map_layers.has_location(school)
+    if located:
+        lat, lon = school.lat, school.lon
+        title = f"{school.name} 근처 대학"
+    else:
+        # 지도 이동은 돌려받지 않으므로 보이는 범위를 아는 경우(viewport 모드)에만 그 중심 사용
+        bounds = map_layers.returned_bounds(st.session_state.get(MAP_KEY))
+        if bounds is not None:
+            lat, lon = (bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2
+            title = "지도 중심 근처 대학"
+        else:
+            lat, lon = DEFAULT_CENTER
+            title = "서울 시청 근처 대학"
+
+    nearby = store.nearest(lat, lon, NEARBY_COUNT, exclude=school.name if school else None)
+    if not nearby:
+        return
+
+    st.subheader(title)
+    within = len(store.within_km(lat, lon, NEARBY_RADIUS_KM)) - located
+    st.caption(f"반경 {NEARBY_RADIUS_KM}km 안에 {within}곳이 있습니다.")
+    for neighbor, km in nearby:
+        st.button(
+            f"{neighbor.name} · {km:.1f}km",
+            key=f"nearby.{neighbor.row}",  # 같은 이름의 학교가 있어도 위젯 키가 겹치지 않도록
+            on_click=select_school,
+            args=(store, neighbor.name),
         )
-    ).add_to(m) 
 
-# 4-4. 지도 표시
-st_folium(m, width=1000, height=600, key="main_map")
\ No newline at end of file
+
+@st.fragment
+@metrics.timed_fragment("university.show_map_section")
+def show_map_section(store):
+    """
+    지도와 가까운 대학 목록
+    viewport 모드에서 지도를 움직여 보이는 범위가 바뀌면 이 조각만 다시 실행합니다
+    (학교를 고르면 select_school이 전체 앱을 실행).
+    """
+    show_map(store)
+    show_nearby_section(store)
+
+
+# --- 7. 메인 실행 ---
+@metrics.timed("university.main")
+def main():
+    store = load_store(DATA_FILE)
+    if store is None:
+        return
+
+    initialize_session_state()
+    show_search_section(store)
+    show_map_section(store)
+
+
+def render():
+    """페이지 레지스트리 진입점 (main.py에서 rerun마다 호출)"""
+    main()
+
+
+if __name__ == "__main__":
+    main()
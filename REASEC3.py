@@ -1,80 +1,109 @@
 """
 RIASEC 진로탐색 웹서비스
 사용자가 문항에 응답하여 자신의 흥미 유형을 파악하고 관련 직업과 학과를 추천받습니다.
-변수명 충돌 방지를 위해 모든 st.session_state 키에 'riasec_' 접두사를 추가했습니다.
+세션 상태는 session_store의 'jinroup.riasec' 네임스페이스 객체 하나에 저장합니다.
 """
 
+from collections import namedtuple
+
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
+
+import adaptive_riasec
+import instrument
+import metrics
+import navigation
+import recommend
+import results
+import session_store
+from lazy_imports import lazy_import
+from page_registry import freeze
+
+# plotly는 결과 페이지에서 차트를 그릴 때 처음 임포트됩니다
+go = lazy_import("plotly.graph_objects")
 
 
 # ============================================================
 # 데이터 정의 (기존과 동일)
 # ============================================================
 
-RIASEC_INFO = {
+RIASEC_INFO = freeze({
     "R": {"name": "현실형 (Realistic)", "description": "기계나 도구를 다루는 것을 좋아하고, 실제적이고 체계적인 활동을 선호합니다.", "characteristics": "손재주, 신체활동, 기계적 능력"},
     "I": {"name": "탐구형 (Investigative)", "description": "관찰하고 분석하며 문제를 해결하는 것을 좋아하고, 지적 호기심이 강합니다.", "characteristics": "분석력, 논리적 사고, 탐구심"},
     "A": {"name": "예술형 (Artistic)", "description": "창의적이고 자유로운 환경을 선호하며, 예술적 표현을 즐깁니다.", "characteristics": "창의성, 감수성, 독창성"},
     "S": {"name": "사회형 (Social)", "description": "다른 사람을 돕고 가르치는 것을 좋아하며, 협력적인 활동을 선호합니다.", "characteristics": "친절함, 이해심, 봉사정신"},
     "E": {"name": "진취형 (Enterprising)", "description": "리더십을 발휘하고 목표를 달성하는 것을 좋아하며, 경쟁적인 환경을 선호합니다.", "characteristics": "설득력, 추진력, 리더십"},
     "C": {"name": "관습형 (Conventional)", "description": "체계적이고 규칙적인 업무를 선호하며, 정확성과 세밀함을 중요시합니다.", "characteristics": "정확성, 조직력, 책임감"}
-}
+})
 
-QUESTIONS = {
+QUESTIONS = freeze({
     "R": ["자동차나 기계를 수리하는 것을 좋아한다", "야외에서 일하는 것이 실내보다 좋다", "손으로 무언가를 만드는 활동을 즐긴다", "공구나 기계를 다루는 데 자신이 있다", "체력을 사용하는 일을 선호한다", "전기나 전자제품을 조립하는 것에 흥미가 있다", "건축이나 목공 작업에 관심이 있다", "농업이나 임업 관련 활동을 좋아한다"],
     "I": ["과학적 현상에 대해 탐구하는 것을 좋아한다", "복잡한 문제를 분석하고 해결하는 것을 즐긴다", "실험이나 연구 활동에 흥미가 있다", "수학이나 과학 과목을 좋아한다", "새로운 이론이나 개념을 배우는 것을 좋아한다", "논리적으로 생각하고 추론하는 것을 잘한다", "자연현상이나 우주에 대한 호기심이 많다", "데이터를 분석하고 패턴을 찾는 것을 즐긴다"],
     "A": ["그림 그리기나 디자인하는 것을 좋아한다", "음악을 연주하거나 노래하는 것을 즐긴다", "창의적인 아이디어를 내는 것을 잘한다", "글쓰기나 시 쓰기를 좋아한다", "연극이나 영화에 관심이 많다", "독특하고 개성 있는 것을 추구한다", "예술 작품을 감상하는 것을 즐긴다", "새로운 것을 창조하는 활동을 선호한다"],
     "S": ["다른 사람을 돕는 일을 좋아한다", "아이들을 가르치거나 돌보는 것을 즐긴다", "사람들과 협력하여 일하는 것을 선호한다", "다른 사람의 고민을 들어주고 조언하는 것을 좋아한다", "봉사활동에 적극적으로 참여한다", "팀 프로젝트에서 조화를 중요시한다", "사람들과 대화하고 소통하는 것을 즐긴다", "사회 문제에 관심이 많고 해결하고 싶다"],
     "E": ["다른 사람을 설득하는 것을 잘한다", "리더가 되어 팀을 이끄는 것을 좋아한다", "경쟁적인 환경에서 동기부여를 받는다", "사업이나 창업에 관심이 있다", "목표를 세우고 달성하는 것을 즐긴다", "판매나 마케팅 활동에 흥미가 있다", "새로운 프로젝트를 시작하는 것을 좋아한다", "영향력 있는 사람이 되고 싶다"],
     "C": ["정리정돈을 잘하고 체계적으로 일한다", "규칙과 절차를 따르는 것을 선호한다", "세밀한 작업을 정확하게 수행하는 것을 좋아한다", "데이터나 숫자를 다루는 일에 흥미가 있다", "계획을 세우고 그대로 실행하는 것을 잘한다", "문서 작성이나 기록 관리를 잘한다", "반복적이고 안정적인 업무를 선호한다", "사무 업무에 적합하다고 생각한다"]
-}
+})
 
-JOBS_DATA = {
+JOBS_DATA = freeze({
     "R": ["기계공학기술자", "전기기사", "자동차정비사", "건축기사", "토목기사", "항공정비사", "용접공", "농업기술자"],
     "I": ["과학자", "의사", "약사", "생명공학연구원", "데이터분석가", "소프트웨어개발자", "화학연구원", "수학자"],
     "A": ["그래픽디자이너", "음악가", "작가", "영화감독", "배우", "사진작가", "패션디자이너", "웹디자이너"],
     "S": ["교사", "상담사", "사회복지사", "간호사", "유치원교사", "심리상담사", "작업치료사", "요양보호사"],
     "E": ["CEO", "영업관리자", "마케팅전문가", "변호사", "정치인", "광고기획자", "인사관리자", "창업가"],
     "C": ["회계사", "경리직원", "은행원", "비서", "사무원", "세무사", "감정평가사", "행정공무원"]
-}
+})
 
-MAJORS_DATA = {
+MAJORS_DATA = freeze({
     "R": ["기계공학과", "전기전자공학과", "건축공학과", "토목공학과", "항공우주공학과", "산업공학과", "신소재공학과", "농업학과"],
     "I": ["의학과", "약학과", "생명공학과", "컴퓨터공학과", "화학과", "물리학과", "수학과", "통계학과"],
     "A": ["시각디자인학과", "음악과", "문예창작과", "영화영상학과", "연극영화과", "사진학과", "패션디자인과", "미술학과"],
     "S": ["교육학과", "사회복지학과", "심리학과", "유아교육과", "간호학과", "상담학과", "재활학과", "아동학과"],
     "E": ["경영학과", "광고홍보학과", "법학과", "행정학과", "국제통상학과", "무역학과", "경제학과", "부동산학과"],
     "C": ["회계학과", "경영정보학과", "금융학과", "세무학과", "문헌정보학과", "사무행정학과", "통계학과", "경제학과"]
-}
+})
+
+
+SCALE = instrument.Scale((1, 2, 3, 4, 5), ("전혀 그렇지 않다", "그렇지 않다", "보통이다", "그렇다", "매우 그렇다"))
+
+# 문항 번호: QUESTIONS 순서 (R 0~7, I 8~15, ...)
+INSTRUMENT = instrument.compile_instrument("riasec", SCALE, [
+    ("interest", "흥미 검사", QUESTIONS),
+])
+TOTAL_QUESTIONS = len(INSTRUMENT)
+
+RECOMMEND_COUNT = 12  # 결과 페이지에 보여 줄 추천 직업/학과 수 (유형별 목록이면 유형마다 최대 수)
+
+# 빠른 검사: 상위 3유형 순위가 굳으면 일찍 끝냄 (adaptive_riasec 참고)
+ADAPTIVE = adaptive_riasec.AdaptivePlan(INSTRUMENT)
+ADAPTIVE_KEY = f"{session_store.RIASEC}.adaptive"  # 소개 페이지 토글
 
 
 # ============================================================
-# 유틸리티 함수 (접두사 riasec_ 추가됨)
+# 유틸리티 함수
 # ============================================================
 
 def initialize_session_state():
-    """세션 스테이트 초기화"""
-    if 'riasec_page' not in st.session_state:
-        st.session_state.riasec_page = 'intro'
-    if 'riasec_answers' not in st.session_state:
-        st.session_state.riasec_answers = {}
-    if 'riasec_current_question' not in st.session_state:
-        st.session_state.riasec_current_question = 0
+    """세션 스테이트 초기화 (검사 상태 객체 반환)"""
+    return session_store.get_state(session_store.RIASEC, TOTAL_QUESTIONS)
 
 
 def calculate_scores(answers):
-    """RIASEC 점수 계산"""
-    scores = {riasec_type: 0 for riasec_type in RIASEC_INFO.keys()}
-    question_num = 0
-    for riasec_type, questions in QUESTIONS.items():
-        for _ in questions:
-            if question_num in answers:
-                if answers[question_num] is not None:
-                    scores[riasec_type] += answers[question_num]
-            question_num += 1
-    return scores
+    """
+    RIASEC 점수 계산
+
+    Args:
+        answers: 문항 번호 순서의 응답 값 (0 = 미응답)
+    """
+    return INSTRUMENT.scores(answers)
+
+
+@st.cache_resource
+def get_recommender():
+    """
+    직업/학과 유사도 추천기 (프로세스당 하나, 모든 세션이 공유)
+    JOBS_DATA/MAJORS_DATA와 JINROUP_CATALOG 목록의 RIASEC 벡터를 미리 정규화해 둡니다.
+    """
+    return recommend.Recommender(recommend.default_catalog(JOBS_DATA, MAJORS_DATA))
 
 
 def get_top_types(scores, n=3):
@@ -83,6 +112,69 @@ def get_top_types(scores, n=3):
     return [riasec_type for riasec_type, score in sorted_types[:n]]
 
 
+class RiasecResult(namedtuple("RiasecResult", "scores top_types answered confidence jobs majors flat")):
+    """
+    완료된 응답의 결과 (읽기 전용, 같은 응답이면 모든 세션이 같은 객체를 공유)
+
+    Attributes:
+        scores (MappingProxyType): {유형: 점수} (빠른 검사는 추정 점수)
+        top_types (tuple[str]): 상위 3유형
+        answered (int): 응답한 문항 수
+        confidence (float | None): 빠른 검사의 상위 3유형 순위 확신도 (전체 검사는 None)
+        jobs, majors (tuple): 추천 구역 ((유형, tuple[recommend.Recommendation]), ...)
+            기본 목록이면 상위 3유형마다 그 유형의 직업/학과, JINROUP_CATALOG 목록이 있으면
+            (None, 점수 분포가 비슷한 순) 한 구역 (recommend.Recommender.sections)
+        flat (bool): 순위 목록인데 유형 점수가 모두 같아 상위 3유형 코드로 추천했는지
+    """
+    __slots__ = ()
+
+
+def _result(scores, top_types, answered, confidence):
+    recommender = get_recommender()
+    # 순위 목록에서 점수가 모두 같으면 모양으로 비교할 수 없으므로 상위 3유형 코드로 추천
+    code = "".join(top_types)
+    return RiasecResult(
+        freeze(scores), tuple(top_types), answered, confidence,
+        recommender.sections(scores, code, "job", RECOMMEND_COUNT),
+        recommender.sections(scores, code, "major", RECOMMEND_COUNT),
+        recommender.ranked and recommend.is_flat(scores),
+    )
+
+
+def show_recommendations(sections, kind_label, box):
+    """
+    추천 구역 표시 (유형별 목록이면 유형마다 제목 + 목록, 순위 목록이면 홀랜드 코드를 붙인 목록 하나)
+
+    Args:
+        sections (tuple): RiasecResult.jobs / majors
+        kind_label (str): "직업" 또는 "학과"
+        box (str): 항목 하나를 그릴 열 메서드 이름 ('info', 'success')
+    """
+    for letter, items in sections:
+        if letter is None:
+            st.caption(f"여섯 유형 점수의 전체 모양이 나와 비슷한 {kind_label} 순서입니다.")
+        else:
+            st.markdown(f"**{RIASEC_INFO[letter]['name']} 관련 {kind_label}**")
+        cols = st.columns(4)
+        for i, item in enumerate(items):
+            getattr(cols[i % 4], box)(item.name if letter else f"{item.name} ({item.code})")
+
+
+@results.memoized
+def compute_result(answers):
+    """전체 검사 응답 -> RiasecResult (응답 지문으로 캐시)"""
+    scores = calculate_scores(answers)
+    return _result(scores, get_top_types(scores, 3), TOTAL_QUESTIONS, None)
+
+
+@results.memoized
+def compute_adaptive_result(answers):
+    """빠른 검사 응답 -> RiasecResult (답하지 않은 문항은 유형별 응답 평균으로 채운 추정 점수)"""
+    estimate = ADAPTIVE.estimate(answers)
+    return _result(estimate.projected, estimate.ranking[:3], estimate.answered, estimate.confidence)
+
+
+@results.figure_cache
 def create_radar_chart(scores):
     """레이더 차트 생성"""
     categories = [RIASEC_INFO[t]["name"] for t in scores.keys()]
@@ -100,6 +192,68 @@ def create_radar_chart(scores):
     return fig
 
 
+# ============================================================
+# 콜백 (스크립트 실행 전에 처리되므로 st.rerun()이 필요 없음)
+# ============================================================
+def start_test():
+    state = initialize_session_state()
+    state.reset(page='test')
+    if st.session_state.get(ADAPTIVE_KEY):
+        state.current = ADAPTIVE.next_item(state.answers)
+        state.order = bytearray([state.current])
+
+
+def restart_test():
+    initialize_session_state().reset()
+
+
+def go_previous():
+    state = initialize_session_state()
+    if state.order is None:
+        state.current -= 1
+    else:
+        state.current = state.order[state.order.index(state.current) - 1]
+
+
+def next_adaptive_item(state):
+    """
+    빠른 검사의 다음 문항 번호 (검사를 끝낼 때면 None)
+    이전 문항으로 돌아가 있었다면 이미 낸 순서대로 다시 진행합니다.
+    """
+    position = state.order.index(state.current)
+    if position < len(state.order) - 1:
+        return state.order[position + 1]
+    item_id = ADAPTIVE.next_item(state.answers)
+    if item_id is not None:
+        state.order.append(item_id)
+    return item_id
+
+
+def go_next(key):
+    """
+    현재 문항 응답 저장 후 다음 문항으로 (마지막 문항이면 결과 페이지로)
+
+    Args:
+        key (str): 현재 문항 응답 위젯의 키
+    """
+    state = initialize_session_state()
+    answer = st.session_state.get(key)
+    if answer is None:
+        state.notice = "응답을 선택해주세요!"
+        return
+
+    state.set_answer(state.current, answer)
+    if state.order is not None:
+        next_item = next_adaptive_item(state)
+    else:
+        next_item = state.current + 1 if state.current < TOTAL_QUESTIONS - 1 else None
+    if next_item is not None:
+        state.current = next_item
+    else:
+        state.page = 'result'
+        navigation.rerun_app()
+
+
 # ============================================================
 # 페이지 함수
 # ============================================================
@@ -113,7 +267,7 @@ def show_intro_page():
     맞춤형 직업과 학과를 추천해드립니다.
     
     #### 📋 검사 정보
-    - **문항 수**: 48개 문항
+    - **문항 수**: 48개 문항 (빠른 검사는 응답에 따라 더 일찍 끝남)
     - **소요 시간**: 약 10-15분
     - **응답 방식**: 5점 척도
     """)
@@ -125,81 +279,92 @@ def show_intro_page():
             st.markdown(f"**{info['name']}**\n{info['description']}")
     
     st.markdown("---")
-    if st.button("검사 시작하기 🚀", type="primary", use_container_width=True):
-        st.session_state.riasec_page = 'test'
-        st.session_state.riasec_current_question = 0
-        st.session_state.riasec_answers = {}
-        st.rerun()
+    st.toggle("⚡ 빠른 검사", key=ADAPTIVE_KEY,
+              help="응답에 따라 다음 문항을 고르고, 상위 3유형 순위가 충분히 정해지면 48문항 전에 끝냅니다.")
+    st.button("검사 시작하기 🚀", type="primary", use_container_width=True, on_click=start_test)
 
 
+@metrics.timed("riasec.show_test_page")
 def show_test_page():
     """검사 페이지"""
-    total_questions = sum(len(questions) for questions in QUESTIONS.values())
-    current_q = st.session_state.riasec_current_question
+    show_question_card()
+
+
+@st.fragment
+@metrics.timed_fragment("riasec.show_question_card")
+def show_question_card():
+    """
+    문항 카드, 진행률, 이전/다음 버튼
+    응답 선택과 문항 이동은 이 조각만 다시 실행하고, 결과 페이지로 넘어갈 때만 전체 앱을 실행합니다.
+    이동은 모두 콜백에서 처리되어 클릭 한 번이 실행 한 번입니다.
+    """
+    state = initialize_session_state()
+    if state.page != 'test':
+        # 콜백의 전체 실행 요청이 무시된 경우 (콜백 안 st.rerun()을 지원하지 않는 Streamlit)
+        metrics.rerun()
+    total_questions = TOTAL_QUESTIONS
+    current_q = state.current
+    adaptive = state.order is not None
+    # 빠른 검사는 낸 순서 기준 번호
+    position = state.order.index(current_q) if adaptive else current_q
     
-    answered_count = len([ans for ans in st.session_state.riasec_answers.values() if ans is not None])
+    answered_count = state.answered_count()
     progress = answered_count / total_questions
     st.progress(progress)
-    st.caption(f"진행률: {answered_count}/{total_questions} ({int(progress * 100)}%)")
-    
-    question_num = 0
-    current_type = None
-    current_question_text = None
+    if adaptive:
+        confidence = ADAPTIVE.estimate(state.answers).confidence
+        st.caption(f"빠른 검사: {answered_count}문항 응답 · 결과 확신도 {confidence:.0%} "
+                   f"(목표 {ADAPTIVE.confidence:.0%}에 이르면 끝납니다)")
+    else:
+        st.caption(f"진행률: {answered_count}/{total_questions} ({int(progress * 100)}%)")
     
-    for riasec_type, questions in QUESTIONS.items():
-        for question_text in questions:
-            if question_num == current_q:
-                current_type = riasec_type
-                current_question_text = question_text
-                break
-            question_num += 1
-        if current_type: break
+    item = INSTRUMENT.item(current_q)
     
-    st.markdown(f"### 문항 {current_q + 1}")
-    st.markdown(f"**유형: {RIASEC_INFO[current_type]['name']}**")
-    st.markdown(f"#### {current_question_text}")
+    st.markdown(f"### 문항 {position + 1}")
+    st.markdown(f"**유형: {RIASEC_INFO[item.subscale]['name']}**")
+    st.markdown(f"#### {item.text}")
     
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        previous_answer = st.session_state.riasec_answers.get(current_q)
-        default_index = previous_answer - 1 if previous_answer is not None else None
+        previous_answer = state.answer(item.id)
         
-        answer = st.radio(
+        key = session_store.widget_key(session_store.RIASEC, item.id)
+        session_store.prune_widget_keys(session_store.RIASEC, keep=key)
+        st.radio(
             "응답을 선택해주세요",
-            options=[1, 2, 3, 4, 5],
-            format_func=lambda x: ["전혀 그렇지 않다", "그렇지 않다", "보통이다", "그렇다", "매우 그렇다"][x-1],
-            key=f"riasec_q_{current_q}",
-            index=default_index
+            options=SCALE.values,
+            format_func=SCALE.label,
+            key=key,
+            index=SCALE.index(previous_answer)
         )
         
         st.markdown("---")
         col_prev, col_next = st.columns(2)
         with col_prev:
-            if current_q > 0:
-                if st.button("⬅️ 이전", use_container_width=True):
-                    st.session_state.riasec_current_question -= 1
-                    st.rerun()
+            if position > 0:
+                st.button("⬅️ 이전", use_container_width=True, on_click=go_previous)
         
         with col_next:
-            button_label = "다음 ➡️" if current_q < total_questions - 1 else "결과 보기 ✅"
-            if st.button(button_label, type="primary", use_container_width=True):
-                if answer is None:
-                    st.warning("응답을 선택해주세요!", icon="⚠️")
-                else:
-                    st.session_state.riasec_answers[current_q] = answer
-                    if current_q < total_questions - 1:
-                        st.session_state.riasec_current_question += 1
-                        st.rerun()
-                    else:
-                        st.session_state.riasec_page = 'result'
-                        st.rerun()
+            button_label = "다음 ➡️" if adaptive or current_q < total_questions - 1 else "결과 보기 ✅"
+            st.button(button_label, type="primary", use_container_width=True,
+                      on_click=go_next, args=(key,))
+            notice = state.pop_notice()
+            if notice:
+                st.warning(notice, icon="⚠️")
 
 
+@metrics.timed("riasec.show_result_page")
 def show_result_page():
     """결과 페이지"""
     st.title("🎉 검사 결과")
-    scores = calculate_scores(st.session_state.riasec_answers)
-    top_types = get_top_types(scores, 3)
+    state = initialize_session_state()
+    if state.order is None:
+        result = compute_result(state.answers)
+    else:
+        result = compute_adaptive_result(state.answers)
+        st.caption(f"빠른 검사: {result.answered}문항 응답으로 {TOTAL_QUESTIONS}문항 점수를 추정했습니다 "
+                   f"(상위 3유형 순위 확신도 {result.confidence:.0%}).")
+    scores, top_types = result.scores, result.top_types
     
     st.markdown("### 📊 당신의 RIASEC 유형")
     cols = st.columns(3)
@@ -208,7 +373,7 @@ def show_result_page():
             st.metric(label=f"{idx + 1}순위", value=RIASEC_INFO[riasec_type]["name"], delta=f"{scores[riasec_type]}점")
     
     st.markdown("### 📈 전체 유형별 점수")
-    st.plotly_chart(create_radar_chart(scores), use_container_width=True)
+    st.plotly_chart(create_radar_chart(dict(scores)), use_container_width=True)
     
     st.markdown("### 🔍 당신의 주요 유형 분석")
     for idx, riasec_type in enumerate(top_types):
@@ -216,13 +381,11 @@ def show_result_page():
             st.markdown(f"**특징:** {RIASEC_INFO[riasec_type]['description']}")
             st.markdown(f"**주요 특성:** {RIASEC_INFO[riasec_type]['characteristics']}")
     
+    if result.flat:
+        st.info("여섯 유형 점수가 모두 같아 점수 모양으로 비교할 수 없습니다. "
+                f"아래 추천은 상위 유형 순서({''.join(top_types)})를 기준으로 했습니다.")
     st.markdown("### 💼 추천 직업")
-    for riasec_type in top_types:
-        st.markdown(f"**{RIASEC_INFO[riasec_type]['name']} 관련 직업**")
-        jobs = JOBS_DATA[riasec_type]
-        cols = st.columns(4)
-        for i, job in enumerate(jobs):
-            cols[i % 4].info(job)
+    show_recommendations(result.jobs, "직업", "info")
     st.write("") # 버튼 위에 약간의 여백 추가
 
     st.link_button(
@@ -236,12 +399,7 @@ def show_result_page():
     )
 
     st.markdown("### 🎓 추천 학과")
-    for riasec_type in top_types:
-        st.markdown(f"**{RIASEC_INFO[riasec_type]['name']} 관련 학과**")
-        majors = MAJORS_DATA[riasec_type]
-        cols = st.columns(4)
-        for i, major in enumerate(majors):
-            cols[i % 4].success(major)
+    show_recommendations(result.majors, "학과", "success")
     st.write("") # 버튼 위에 약간의 여백 추가
 
     st.link_button(
@@ -254,26 +412,28 @@ def show_result_page():
 
     )
     st.markdown("---")
-    if st.button("🔄 검사 다시하기", use_container_width=True):
-        st.session_state.riasec_page = 'intro'
-        st.session_state.riasec_answers = {}
-        st.session_state.riasec_current_question = 0
-        st.rerun()
+    st.button("🔄 검사 다시하기", use_container_width=True, on_click=restart_test)
 
 
 # ============================================================
 # 메인 실행
 # ============================================================
 
+@metrics.timed("riasec.main")
 def main():
-    initialize_session_state()
-    if st.session_state.riasec_page == 'intro':
+    state = initialize_session_state()
+    if state.page == 'intro':
         show_intro_page()
-    elif st.session_state.riasec_page == 'test':
+    elif state.page == 'test':
         show_test_page()
-    elif st.session_state.riasec_page == 'result':
+    elif state.page == 'result':
         show_result_page()
 
-main()
+
+def render():
+    """페이지 레지스트리 진입점 (main.py에서 rerun마다 호출)"""
+    main()
 
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+적응형 RIASEC 검사 (조기 종료)
+48문항을 유형 순서대로 모두 묻는 대신, 지금까지의 응답으로 최종 점수를 추정하고
+상위 3유형의 순위를 가장 흔들 수 있는 유형의 문항을 다음으로 냅니다.
+상위 3유형 순위가 정해진 확신도 이상으로 굳으면 검사를 끝냅니다.
+
+- 추정: 유형별 응답 평균 x 남은 문항 수 + 이미 받은 점수 (전체 문항을 답했다면 실제 점수와 같음)
+  문항 응답의 분산은 유형 안 편차를 모은 값 (사전값 1.0, 자유도 PRIOR_DF로 수축)
+- 확신도: 1·2위, 2·3위, 3위와 4~6위 각각이 뒤집히지 않을 확률(정규 근사)로 만든 본페로니 하한
+  동점이면 R, I, A, S, E, C 순 (결과 페이지의 get_top_types와 같은 규칙)
+- 다음 문항: 먼저 유형마다 MIN_PER_SUBSCALE개씩 번갈아 (R, I, A, S, E, C, R, ...)
+  그 뒤에는 가장 불확실한 순위 쌍에서 추정 분산이 큰 유형의 다음 문항
+- 응답은 session_store.InstrumentState.answers 형식 그대로 (순수 파이썬, 콜백 한 번에 수십 µs)
+
+확신도는 JINROUP_ADAPTIVE_CONFIDENCE (기본 0.95)
+
+사용법:
+    python adaptive_riasec.py --respondents 2000              # 가상 응답자로 정확도-문항 수 비교
+    python adaptive_riasec.py --confidence 0.8 0.9 0.95 0.99
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from collections import namedtuple
+
+os.environ.setdefault("JINROUP_METRICS", "0")
+
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+
+CONFIDENCE = float(os.environ.get("JINROUP_ADAPTIVE_CONFIDENCE", "0.95"))
+MIN_PER_SUBSCALE = 2   # 분산을 추정하려면 유형마다 2문항 이상
+PRIOR_DF = 4           # 응답 분산 사전값의 무게 (문항 수 단위)
+TOP = 3
+
+Estimate = namedtuple("Estimate", "answered counts projected ranking confidence")
+
+
+def _normal_cdf(x):
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+def _bonferroni(pairs):
+    """쌍별 확률 -> 모두 그대로일 확률의 하한"""
+    return max(0.0, 1.0 - sum(1.0 - probability for _, _, probability in pairs))
+
+
+class AdaptivePlan:
+    """
+    검사 하나에 대한 적응형 문항 선택 규칙 (읽기 전용, 모든 세션이 공유)
+
+    Args:
+        instrument (instrument.Instrument): 컴파일된 검사 (하위척도 = 유형)
+        confidence (float): 상위 순위가 바뀌지 않을 확률의 목표 (0~1)
+        min_per_subscale (int): 종료 전에 유형마다 받아야 할 최소 문항 수
+        top (int): 순위를 확정할 상위 유형 수
+    """
+
+    def __init__(self, instrument, confidence=CONFIDENCE, min_per_subscale=MIN_PER_SUBSCALE, top=TOP):
+        self.instrument = instrument
+        self.confidence = confidence
+        self.min_per_subscale = min_per_subscale
+        self.top = top
+        subscales = instrument.subscales
+        self._codes = tuple(subscales.index(item.subscale) for item in instrument.items)
+        self._reverse = tuple(item.reverse for item in instrument.items)
+        self._sizes = tuple(instrument.subscale_size(subscale) for subscale in subscales)
+        # 유형별 문항 번호 (선언 순서)
+        self._items = tuple(
+            tuple(item.id for item in instrument.items if item.subscale == subscale) for subscale in subscales
+        )
+        scale = instrument.scale
+        self._flip = scale.low + scale.high
+        self._prior_mean = (scale.low + scale.high) / 2
+        self._prior_var = ((scale.high - scale.low) / 4) ** 2
+
+    # --------------------------------------------------------
+    # 추정
+    # --------------------------------------------------------
+    def _stats(self, answers):
+        n_subscales = len(self._sizes)
+        counts = [0] * n_subscales
+        sums = [0.0] * n_subscales
+        squares = [0.0] * n_subscales
+        for item_id, value in enumerate(answers):
+            if value:
+                if self._reverse[item_id]:
+                    value = self._flip - value
+                code = self._codes[item_id]
+                counts[code] += 1
+                sums[code] += value
+                squares[code] += value * value
+        return counts, sums, squares
+
+    def _projection(self, answers):
+        """유형별 (이미 받은 점수 + 남은 문항 추정, 추정 분산), 유형별 응답 수"""
+        counts, sums, squares = self._stats(answers)
+        within = sum(sq - s * s / n for n, s, sq in zip(counts, sums, squares) if n)
+        df = sum(n - 1 for n in counts if n)
+        item_var = (within + PRIOR_DF * self._prior_var) / (df + PRIOR_DF)
+
+        means, variances = [], []
+        for n, total, size in zip(counts, sums, self._sizes):
+            remaining = size - n
+            if n:
+                means.append(total + remaining * total / n)
+                variances.append(remaining * item_var + remaining * remaining * item_var / n)
+            else:
+                means.append(remaining * self._prior_mean)
+                variances.append(remaining * item_var + remaining * remaining * self._prior_var)
+        return means, variances, counts
+
+    def _pairs(self, means, variances, ranking):
+        """
+        순위 쌍별 (앞 유형, 뒤 유형, 뒤집히지 않을 확률)
+        상위 유형은 바로 다음 유형과, 마지막 상위 유형은 나머지 모두와 비교
+        """
+        pairs = []
+        for rank, ahead in enumerate(ranking[:self.top]):
+            behind_all = ranking[rank + 1:rank + 2] if rank < self.top - 1 else ranking[self.top:]
+            for behind in behind_all:
+                # 최종 점수는 정수: 동점이면 선언 순서가 앞인 유형이 이김 (연속성 보정 0.5)
+                margin = means[ahead] - means[behind] + (0.5 if ahead < behind else -0.5)
+                spread = math.sqrt(variances[ahead] + variances[behind])
+                if spread > 0:
+                    probability = _normal_cdf(margin / spread)
+                else:
+                    probability = 1.0 if margin > 0 else 0.0
+                pairs.append((ahead, behind, probability))
+        return pairs
+
+    def estimate(self, answers):
+        """
+        지금까지의 응답으로 추정한 결과
+
+        Returns:
+            Estimate: answered (응답 수), counts ({유형: 응답 수}), projected ({유형: 추정 점수, 반올림}),
+                ranking (유형 순위 전체), confidence (상위 순위가 그대로일 확률의 하한)
+        """
+        means, variances, counts = self._projection(answers)
+        ranking = sorted(range(len(means)), key=lambda code: (-means[code], code))
+        pairs = self._pairs(means, variances, ranking)
+        confidence = _bonferroni(pairs)
+        subscales = self.instrument.subscales
+        return Estimate(
+            answered=sum(counts),
+            counts=dict(zip(subscales, counts)),
+            projected={subscales[code]: round(mean) for code, mean in enumerate(means)},
+            ranking=tuple(subscales[code] for code in ranking),
+            confidence=confidence,
+        )
+
+    # --------------------------------------------------------
+    # 다음 문항
+    # --------------------------------------------------------
+    def _next_of(self, code, answers):
+        for item_id in self._items[code]:
+            if not answers[item_id]:
+                return item_id
+        return None
+
+    def next_item(self, answers):
+        """
+        다음에 낼 문항 번호 (검사를 끝낼 때면 None)
+
+        Args:
+            answers (bytearray): 문항 번호 순 응답 값 (0 = 미응답)
+        """
+        means, variances, counts = self._projection(answers)
+        open_codes = [code for code, (n, size) in enumerate(zip(counts, self._sizes)) if n < size]
+        if not open_codes:
+            return None
+
+        # 유형마다 최소 문항 수를 채울 때까지 번갈아
+        short = [code for code in open_codes if counts[code] < self.min_per_subscale]
+        if short:
+            return self._next_of(min(short, key=lambda code: (counts[code], code)), answers)
+
+        ranking = sorted(range(len(means)), key=lambda code: (-means[code], code))
+        pairs = self._pairs(means, variances, ranking)
+        if _bonferroni(pairs) >= self.confidence:
+            return None
+
+        # 가장 불확실한 쌍에서 남은 문항이 있고 분산이 큰 유형
+        for ahead, behind, _ in sorted(pairs, key=lambda pair: pair[2]):
+            candidates = [code for code in (ahead, behind) if counts[code] < self._sizes[code]]
+            if candidates:
+                return self._next_of(max(candidates, key=lambda code: (variances[code], -code)), answers)
+        # 불확실한 쌍의 문항을 다 받았으면 남은 유형 중 분산이 큰 유형
+        return self._next_of(max(open_codes, key=lambda code: (variances[code], -code)), answers)
+
+
+# ============================================================
+# 시뮬레이션
+# ============================================================
+def synthetic_responses(n_items, subscale_codes, respondents, seed=0):
+    """
+    가상 응답 (응답자 x 문항 uint8, 1~5)
+    응답자마다 유형 성향 ~ N(3, 0.8), 문항 난이도 ~ N(0, 0.4), 응답 잡음 ~ N(0, 0.8)
+    """
+    rng = np.random.default_rng(seed)
+    traits = rng.normal(3.0, 0.8, (respondents, int(max(subscale_codes)) + 1))
+    offsets = rng.normal(0.0, 0.4, n_items)
+    noise = rng.normal(0.0, 0.8, (respondents, n_items))
+    values = traits[:, subscale_codes] + offsets + noise
+    return np.clip(np.rint(values), 1, 5).astype("uint8")
+
+
+def simulate(plan, responses):
+    """
+    가상 응답자마다 적응형 검사를 끝까지 진행
+
+    Returns:
+        dict: items (평균 문항 수), order (상위 3유형 순위 일치율), top_set (상위 3유형 일치율),
+            first (1위 일치율), seconds (응답자당 선택 시간)
+    """
+    n_items = len(plan.instrument)
+    used, order, top_set, first = 0, 0, 0, 0
+    start = time.perf_counter()
+    for row in responses.tolist():
+        full = plan.estimate(bytes(row)).ranking[:plan.top]
+        answers = bytearray(n_items)
+        item_id = plan.next_item(answers)
+        while item_id is not None:
+            answers[item_id] = row[item_id]
+            item_id = plan.next_item(answers)
+        adaptive = plan.estimate(answers)
+        guess = adaptive.ranking[:plan.top]
+        used += adaptive.answered
+        order += guess == full
+        top_set += set(guess) == set(full)
+        first += guess[0] == full[0]
+    count = len(responses)
+    return {
+        'items': used / count,
+        'order': order / count,
+        'top_set': top_set / count,
+        'first': first / count,
+        'seconds': (time.perf_counter() - start) / count,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="적응형 RIASEC 검사 시뮬레이션 (정확도-문항 수)")
+    parser.add_argument("--respondents", type=int, default=2000, help="가상 응답자 수")
+    parser.add_argument("--confidence", type=float, nargs="+", default=[0.8, 0.9, 0.95, 0.99],
+                        help="비교할 확신도 목표")
+    parser.add_argument("--min-per-subscale", type=int, default=MIN_PER_SUBSCALE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    import page_registry
+    riasec = page_registry.get_page_module("riasec")
+    subscales = riasec.INSTRUMENT.subscales
+    codes = np.array([subscales.index(item.subscale) for item in riasec.INSTRUMENT.items])
+    responses = synthetic_responses(len(riasec.INSTRUMENT), codes, args.respondents, args.seed)
+
+    print(f"가상 응답자 {args.respondents:,}명, 전체 {len(riasec.INSTRUMENT)}문항 결과와 비교")
+    print(f"{'확신도':>6} {'평균 문항':>9} {'순위 일치':>9} {'3유형 일치':>10} {'1위 일치':>8} {'선택 시간':>10}")
+    for confidence in args.confidence:
+        plan = AdaptivePlan(riasec.INSTRUMENT, confidence, args.min_per_subscale)
+        result = simulate(plan, responses)
+        print(f"{confidence:>6.2f} {result['items']:>9.1f} {result['order']:>9.1%} {result['top_set']:>10.1%} "
+              f"{result['first']:>8.1%} {result['seconds'] * 1000:>8.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
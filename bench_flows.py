@@ -0,0 +1,264 @@
+"""
+전체 흐름 벤치마크 (Streamlit AppTest 기반, 브라우저 없이 실행)
+
+- 진로결정돕기(jinrotool2) 40문항 전체 응답 -> 결과
+- 흥미와전공(REASEC3) 48문항 전체 응답 -> 결과
+- 대학입시정보(3.py) 검색어 입력 -> 학교 선택 반복
+
+단계(클릭/입력 1회)마다 소요 시간, 스크립트 실행 횟수(rerun 포함), 최대 메모리를 기록하고
+흐름별 p50/p95/p99 지연 시간을 JSON 파일로 저장합니다.
+
+사용법:
+    python bench_flows.py                          # bench_results/<시각>-<커밋>.json
+    python bench_flows.py --repeat 3 --output out.json
+    python bench_flows.py --compare bench_results/이전결과.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# 벤치마크 중에는 계측 파일을 쓰지 않음 (metrics 모듈 임포트 전에 설정)
+os.environ.setdefault("JINROUP_METRICS", "0")
+
+BASE_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = BASE_DIR / "bench_results"
+
+UNIVERSITY_QUERIES = ("서울", "한양", "경북", "부산", "교육")
+
+
+# ============================================================
+# 통계 함수
+# ============================================================
+def percentile(values, q):
+    """최근접 순위(nearest-rank) 방식 분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(q / 100 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(steps):
+    """단계 목록 요약"""
+    seconds = [s['seconds'] for s in steps]
+    return {
+        'steps': len(steps),
+        'total_seconds': round(sum(seconds), 6),
+        'p50': round(percentile(seconds, 50), 6),
+        'p95': round(percentile(seconds, 95), 6),
+        'p99': round(percentile(seconds, 99), 6),
+        'max_seconds': round(max(seconds, default=0.0), 6),
+        'script_runs': sum(s['script_runs'] for s in steps),
+        'peak_kb': max((s['peak_kb'] for s in steps if s['peak_kb'] is not None), default=None),
+    }
+
+
+# ============================================================
+# 흐름 실행기
+# ============================================================
+class FlowRunner:
+    """AppTest 인스턴스 하나로 단계를 실행하며 측정값을 모음"""
+
+    def __init__(self, trace_memory=True, timeout=60):
+        from streamlit.testing.v1 import AppTest
+
+        self.trace_memory = trace_memory
+        self.at = AppTest.from_file(str(BASE_DIR / "main.py"), default_timeout=timeout)
+        self.steps = []
+
+    def step(self, name, action):
+        """
+        단계 하나 실행 및 측정
+
+        Args:
+            name (str): 단계 이름
+            action (callable): AppTest를 조작하고 run()까지 호출하는 함수
+        """
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        action(self.at)
+        seconds = time.perf_counter() - start
+        peak_kb = tracemalloc.get_traced_memory()[1] // 1024 if self.trace_memory else None
+
+        if self.at.exception:
+            raise RuntimeError(f"{name}: {self.at.exception[0].message}")
+
+        self.steps.append({
+            'name': name,
+            'seconds': round(seconds, 6),
+            'script_runs': self._script_runs(),
+            'peak_kb': peak_kb,
+        })
+
+    def _script_runs(self):
+        """직전 상호작용에서 실행된 스크립트 횟수 (metrics 모듈 집계값)"""
+        try:
+            return self.at.session_state['_jinroup_metrics']['runs_in_interaction']
+        except KeyError:
+            return 1
+
+    def button(self, label):
+        """레이블로 활성화된 버튼 찾기"""
+        for button in self.at.button:
+            if button.label == label and not button.disabled:
+                return button
+        raise LookupError(f"버튼을 찾을 수 없습니다: {label}")
+
+    def has_button(self, label):
+        return any(b.label == label for b in self.at.button)
+
+    def click(self, label):
+        return lambda at: self.button(label).click().run()
+
+
+def _answer_all(runner, prefix, options):
+    """'다음'/'결과 보기' 버튼이 사라질 때까지 문항에 응답"""
+    n = 0
+    while runner.has_button("다음 ➡️") or runner.has_button("결과 보기 ✅"):
+        value = options[n % len(options)]
+        runner.step(f"{prefix}.answer_{n + 1}", lambda at, v=value: at.radio[0].set_value(v).run())
+        label = "다음 ➡️" if runner.has_button("다음 ➡️") else "결과 보기 ✅"
+        runner.step(f"{prefix}.next_{n + 1}", runner.click(label))
+        n += 1
+    return n
+
+
+def career_decision_flow(runner):
+    """진로결정돕기: 40문항 응답 후 결과 확인"""
+    runner.step("career.open", runner.click("🎯 진로결정돕기"))
+    runner.step("career.start", runner.click("검사 시작하기 🚀"))
+    answered = _answer_all(runner, "career", (1, 2, 4, 5))
+    if answered != 40:
+        raise RuntimeError(f"진로결정돕기 문항 수가 40이 아닙니다: {answered}")
+    runner.step("career.restart", runner.click("🔄 검사 다시하기"))
+
+
+def riasec_flow(runner):
+    """흥미와전공: 48문항 응답 후 결과 확인"""
+    runner.step("riasec.open", runner.click("🎨 흥미와전공"))
+    runner.step("riasec.start", runner.click("검사 시작하기 🚀"))
+    answered = _answer_all(runner, "riasec", (1, 2, 3, 4, 5))
+    if answered != 48:
+        raise RuntimeError(f"흥미와전공 문항 수가 48이 아닙니다: {answered}")
+    runner.step("riasec.restart", runner.click("🔄 검사 다시하기"))
+
+
+def university_flow(runner, queries=UNIVERSITY_QUERIES):
+    """대학입시정보: 검색어 입력 후 첫 번째 결과 선택"""
+    runner.step("university.open", runner.click("📚 대학입시정보"))
+    for query in queries:
+        runner.step(f"university.search_{query}", lambda at, q=query: at.text_input[0].input(q).run())
+        if runner.at.selectbox:
+            first = runner.at.selectbox[0].options[0]
+            runner.step(f"university.select_{query}", lambda at, v=first: at.selectbox[0].select(v).run())
+    runner.step("university.clear", lambda at: at.text_input[0].input("").run())
+
+
+FLOWS = {
+    'career_decision': career_decision_flow,
+    'riasec': riasec_flow,
+    'university': university_flow,
+}
+
+
+# ============================================================
+# 실행 및 저장
+# ============================================================
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_benchmark(flow_names, repeat=1, trace_memory=True):
+    """흐름별로 새 세션(AppTest)을 만들어 repeat회 실행"""
+    import streamlit
+
+    if trace_memory:
+        tracemalloc.start()
+
+    results = {}
+    for flow_name in flow_names:
+        steps = []
+        for _ in range(repeat):
+            runner = FlowRunner(trace_memory=trace_memory)
+            runner.step("home", lambda at: at.run())
+            FLOWS[flow_name](runner)
+            steps.extend(runner.steps)
+        results[flow_name] = {'summary': summarize(steps), 'steps': steps}
+
+    if trace_memory:
+        tracemalloc.stop()
+
+    return {
+        'commit': _git_commit(),
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'repeat': repeat,
+        'trace_memory': trace_memory,
+        'flows': results,
+    }
+
+
+def print_summary(report, baseline=None):
+    """흐름별 요약 출력 (baseline이 있으면 p50/p95 변화율 함께 출력)"""
+    print(f"커밋 {report['commit']} · streamlit {report['streamlit']} · 반복 {report['repeat']}회")
+    print(f"{'흐름':<18}{'단계':>6}{'실행':>6}{'합계(s)':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'peak(MB)':>10}")
+    for name, flow in report['flows'].items():
+        s = flow['summary']
+        peak = f"{s['peak_kb'] / 1024:.1f}" if s['peak_kb'] is not None else "-"
+        print(
+            f"{name:<18}{s['steps']:>6}{s['script_runs']:>6}{s['total_seconds']:>10.2f}"
+            f"{s['p50'] * 1000:>10.1f}{s['p95'] * 1000:>10.1f}{s['p99'] * 1000:>10.1f}{peak:>10}"
+        )
+        if baseline and name in baseline.get('flows', {}):
+            b = baseline['flows'][name]['summary']
+            changes = []
+            for key in ('p50', 'p95', 'script_runs'):
+                if b[key]:
+                    changes.append(f"{key} {(s[key] - b[key]) / b[key] * 100:+.0f}%")
+            print(f"{'':<18}기준({baseline['commit']}) 대비: " + ", ".join(changes))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="진로탐색 플랫폼 전체 흐름 벤치마크")
+    parser.add_argument("--flow", choices=list(FLOWS), action="append",
+                        help="실행할 흐름 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--repeat", type=int, default=1, help="흐름별 반복 횟수")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--no-tracemalloc", action="store_true",
+                        help="메모리 추적 끄기 (지연 시간 측정 오차 감소)")
+    args = parser.parse_args(argv)
+
+    os.chdir(BASE_DIR)  # 페이지가 상대 경로로 데이터 파일을 읽음
+    report = run_benchmark(
+        args.flow or list(FLOWS),
+        repeat=args.repeat,
+        trace_memory=not args.no_tracemalloc,
+    )
+
+    output = args.output or RESULTS_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}-{report['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+    print_summary(report, baseline)
+    print(f"결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""
+지도 표시 방식(level of detail) 벤치마크
+
+실제 대학 목록을 복제/좌표 흔들기로 늘린 가상 데이터(기본 400, 5,000, 50,000곳)에 대해
+map_layers의 표시 방식(markers, circles, cluster, viewport)별로 다음을 측정합니다.
+
+- 서버: folium 지도 생성 시간, 렌더링(leaflet 스크립트 변환) 시간, 보내는 데이터 크기(원본/gzip)
+  (viewport는 처음 화면의 동적 레이어 비용 포함)
+- 브라우저 (playwright가 설치된 경우): 페이지 로드~첫 화면까지 시간, JS 힙 사용량, DOM 노드 수
+
+사용법:
+    python bench_map_lod.py                          # bench_results/map-lod-<시각>-<커밋>.json
+    python bench_map_lod.py --sizes 400 5000 --browser
+    python bench_map_lod.py --include-slow           # 5,000곳 초과에서도 개별 마커 측정 (수 분 걸림)
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("JINROUP_METRICS", "0")
+
+import map_layers
+import univ_cache
+import univ_store
+from bench_flows import RESULTS_DIR, _git_commit
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+DEFAULT_SIZES = (400, 5000, 50000)
+DEFAULT_CENTER = (36.5, 127.5)
+DEFAULT_ZOOM = 7
+
+# 개별 마커는 점마다 렌더링 비용이 커서 이 개수를 넘으면 --include-slow일 때만 측정
+SLOW_MARKER_LIMIT = 5000
+
+
+# ============================================================
+# 가상 데이터
+# ============================================================
+def synthetic_store(size, seed=0):
+    """
+    실제 대학 목록에서 size곳을 복원 추출하고 좌표를 흔든 저장소
+
+    Args:
+        size (int): 학교 수
+        seed (int): 난수 시드
+    """
+    df = univ_cache.load()
+    df = df[df['위도'].notna() & df['경도'].notna()]
+    rng = np.random.default_rng(seed)
+    sample = df.iloc[rng.integers(0, len(df), size)].reset_index(drop=True)
+    if size > len(df):
+        # 같은 학교가 여러 번 뽑히므로 캠퍼스/학과처럼 주변에 흩어 놓고 이름을 구분
+        sample['위도'] = sample['위도'] + rng.normal(0, 0.05, size)
+        sample['경도'] = sample['경도'] + rng.normal(0, 0.05, size)
+        sample['대학명'] = sample['대학명'] + ' #' + pd.Series(range(size)).astype(str)
+    return univ_store.UniversityStore(sample, version=f"synthetic-{size}-{seed}")
+
+
+# ============================================================
+# 측정
+# ============================================================
+def measure_server(store, mode):
+    """지도 생성/렌더링 시간과 보내는 데이터 크기"""
+    start = time.perf_counter()
+    fig = map_layers.BUILDERS[mode](store, DEFAULT_CENTER, DEFAULT_ZOOM)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    base = map_layers.BaseMap(fig)
+    render_seconds = time.perf_counter() - start
+
+    layer_script = ""
+    layer_seconds = 0.0
+    if mode == map_layers.VIEWPORT:
+        # 점은 rerun마다 보이는 범위만 보내므로 처음 화면의 레이어 비용을 함께 측정
+        start = time.perf_counter()
+        bounds = map_layers.view_bounds(DEFAULT_CENTER, DEFAULT_ZOOM, 1000, 600)
+        layer = map_layers.viewport_layer(store, bounds)
+        layer.add_to(fig)
+        layer_script = map_layers._feature_group_script(layer, 0)
+        layer_seconds = time.perf_counter() - start
+
+    payload = "".join((base.script or "", base.header or "", base.html or "", layer_script)).encode("utf-8")
+    return fig, {
+        'build_seconds': round(build_seconds, 4),
+        'render_seconds': round(render_seconds, 4),
+        'layer_seconds': round(layer_seconds, 4),
+        'payload_kb': round(len(payload) / 1024, 1),
+        'gzip_kb': round(len(gzip.compress(payload, 6)) / 1024, 1),
+    }
+
+
+def measure_browser(fig, page):
+    """
+    지도를 단독 HTML로 저장해 헤드리스 Chromium에서 열고 첫 화면까지 시간 측정
+    (타일 요청은 막아서 네트워크 영향 제외)
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".html", delete=False, encoding="utf-8") as f:
+        f.write(fig.get_root().render())
+        path = Path(f.name)
+    try:
+        start = time.perf_counter()
+        page.goto(path.as_uri(), wait_until="load")
+        # 두 프레임을 기다려 레이어가 실제로 그려진 뒤를 끝으로 봄
+        page.evaluate("() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))")
+        seconds = time.perf_counter() - start
+        stats = page.evaluate(
+            "() => ({heap: performance.memory ? performance.memory.usedJSHeapSize : null,"
+            " nodes: document.getElementsByTagName('*').length})"
+        )
+    finally:
+        path.unlink()
+    return {
+        'browser_seconds': round(seconds, 4),
+        'js_heap_mb': round(stats['heap'] / 2 ** 20, 1) if stats['heap'] else None,
+        'dom_nodes': stats['nodes'],
+    }
+
+
+def _open_browser():
+    """(playwright, browser, page) (playwright가 설치되어 있지 않으면 None)"""
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        print("playwright가 없어 브라우저 측정을 건너뜁니다 (pip install playwright && playwright install chromium)")
+        return None
+    playwright = sync_playwright().start()
+    browser = playwright.chromium.launch(args=["--enable-precise-memory-info"])
+    page = browser.new_page()
+    page.route("**/*.png", lambda route: route.abort())
+    return playwright, browser, page
+
+
+def run_benchmark(sizes, modes, browser=False, include_slow=False):
+    playwright = chromium = page = None
+    if browser:
+        opened = _open_browser()
+        if opened is not None:
+            playwright, chromium, page = opened
+
+    results = []
+    try:
+        for size in sizes:
+            store = synthetic_store(size)
+            chosen = map_layers.choose_mode(len(store), DEFAULT_ZOOM)
+            for mode in modes:
+                if mode == map_layers.MARKERS and size > SLOW_MARKER_LIMIT and not include_slow:
+                    continue
+                fig, row = measure_server(store, mode)
+                if page is not None:
+                    row.update(measure_browser(fig, page))
+                row.update({'size': size, 'mode': mode, 'auto': mode == chosen})
+                results.append(row)
+                print_row(row)
+    finally:
+        if chromium is not None:
+            chromium.close()
+            playwright.stop()
+    return {
+        'commit': _git_commit(),
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'results': results,
+    }
+
+
+def print_row(row):
+    browser = f"{row['browser_seconds'] * 1000:>10.0f}" if 'browser_seconds' in row else f"{'-':>10}"
+    auto = "*" if row['auto'] else ""
+    print(
+        f"{row['size']:>8} {row['mode'] + auto:<9}{row['build_seconds'] * 1000:>10.0f}"
+        f"{row['render_seconds'] * 1000:>10.0f}{row['payload_kb']:>12.0f}{row['gzip_kb']:>10.0f}{browser}"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="지도 표시 방식별 서버/브라우저 비용 측정")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="학교 수")
+    parser.add_argument("--mode", choices=map_layers.MODES, action="append",
+                        help="측정할 표시 방식 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--browser", action="store_true", help="playwright로 브라우저 비용도 측정")
+    parser.add_argument("--include-slow", action="store_true",
+                        help=f"{SLOW_MARKER_LIMIT}곳 초과에서도 개별 마커 측정")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    os.chdir(Path(__file__).resolve().parent)
+    print(f"{'점':>8} {'방식':<9}{'생성(ms)':>10}{'렌더(ms)':>10}{'크기(KB)':>12}{'gzip(KB)':>10}{'브라우저':>10}")
+    report = run_benchmark(args.sizes, args.mode or list(map_layers.MODES),
+                           browser=args.browser, include_slow=args.include_slow)
+    print("* choose_mode()가 고르는 방식")
+
+    output = args.output or RESULTS_DIR / f"map-lod-{time.strftime('%Y%m%d-%H%M%S')}-{report['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+데이터 파일 감시 / 백그라운드 다시 읽기
+엑셀 파일이 바뀌면 요청을 처리하는 스레드가 아닌 감시 스레드에서 새 버전을 읽고
+(형식 검사 -> 캐시 파일 -> 저장소와 검색/지도 색인 -> 기본 지도 미리 만들기),
+모두 성공했을 때만 현재 버전을 한 번에 바꿉니다.
+
+- 읽는 중이거나 형식이 틀린 파일이면 이전 버전을 그대로 쓰고 last_error에 이유를 남김
+- 세션은 처음 본 버전을 계속 쓸 수 있도록 최근 KEEP_VERSIONS개 버전을 보관
+  (get(version)으로 조회, 새 버전으로 바꿀지는 세션이 정함)
+- 파일을 쓰는 도중에 읽지 않도록 크기/수정 시각이 두 번 연속 같을 때 읽음
+
+설정 (환경 변수):
+    JINROUP_DATA_POLL   파일 확인 주기 (초, 기본 5)
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import univ_cache
+
+
+POLL_SECONDS = float(os.environ.get("JINROUP_DATA_POLL", "5"))
+KEEP_VERSIONS = 3
+
+
+def log(message):
+    print(f"[{time.strftime('%H:%M:%S')}] {message}", flush=True)
+
+
+class DatasetWatcher:
+    """
+    데이터 파일 하나의 버전 관리
+
+    load(path)가 돌려주는 묶음(bundle)은 version 속성(엑셀 내용 해시)을 가져야 합니다.
+
+    Attributes:
+        source (Path): 감시하는 파일
+        last_error (str): 마지막 다시 읽기 실패 이유 (성공하면 None)
+        reloads (int): 백그라운드에서 새 버전으로 바꾼 횟수
+    """
+
+    def __init__(self, source, load, warm=None, interval=POLL_SECONDS):
+        """
+        Args:
+            source (str | Path): 데이터 파일 경로
+            load (callable): path -> bundle (검증/색인 생성까지 끝낸 읽기 전용 객체)
+            warm (callable): bundle -> None, 바꾸기 전에 파생 캐시(기본 지도 등)를 미리 만듦
+            interval (float): 파일 확인 주기 (초)
+        """
+        self.source = Path(source)
+        self.interval = interval
+        self._load = load
+        self._warm = warm
+        self._lock = threading.Lock()
+        self._versions = {}   # version -> bundle (오래된 것부터, 바꿀 때마다 새 dict로 교체)
+        self._current = None
+        self._stat = None
+        self._stop = threading.Event()
+        self._thread = None
+        self.last_error = None
+        self.last_checked = None
+        self.reloads = 0
+
+    # --------------------------------------------------------
+    # 조회 (요청 스레드, 잠금 없음)
+    # --------------------------------------------------------
+    def current(self):
+        """가장 최근에 성공한 버전"""
+        return self._current
+
+    def get(self, version):
+        """보관 중인 버전 (없거나 오래되어 버려졌으면 None)"""
+        return self._versions.get(version)
+
+    def status(self):
+        current = self._current
+        return {
+            'source': str(self.source),
+            'version': current.version if current is not None else None,
+            'versions': list(self._versions),
+            'reloads': self.reloads,
+            'last_error': self.last_error,
+            'last_checked': self.last_checked,
+        }
+
+    # --------------------------------------------------------
+    # 읽기
+    # --------------------------------------------------------
+    def load_initial(self):
+        """
+        처음 버전은 호출한 스레드에서 읽음 (보여 줄 데이터가 없으므로)
+
+        Raises:
+            load()가 던진 예외 (FileNotFoundError, univ_cache.SchemaError 등)
+        """
+        self._stat = self._file_stat()
+        bundle = self._load(self.source)
+        self._install(bundle)
+        return bundle
+
+    def start(self):
+        """감시 스레드 시작 (처음 버전의 파생 캐시도 이 스레드에서 만듦)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="dataset-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _file_stat(self):
+        try:
+            stat = os.stat(self.source)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _run(self):
+        if self._warm is not None and self._current is not None:
+            self._try(self._warm, self._current)
+
+        pending = None
+        while not self._stop.wait(self.interval):
+            self.last_checked = time.time()
+            stat = self._file_stat()
+            if stat is None or stat == self._stat:
+                pending = None
+                continue
+            if stat != pending:
+                pending = stat  # 다음 확인 때도 같으면 다 쓴 것으로 봄
+                continue
+            pending = None
+            self._stat = stat
+            self.reload()
+
+    def reload(self):
+        """
+        파일을 다시 읽어 새 버전으로 교체 (내용이 같으면 그대로)
+
+        Returns:
+            bool: 새 버전으로 바꿨는지
+        """
+        try:
+            digest = univ_cache.source_digest(self.source)
+            current = self._current
+            if current is not None and digest == current.version:
+                return False
+            start = time.perf_counter()
+            bundle = self._load(self.source)
+            if self._warm is not None:
+                self._warm(bundle)
+        except Exception as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            log(f"데이터 다시 읽기 실패, 이전 버전 유지 ({self.source.name}): {self.last_error}")
+            return False
+
+        self._install(bundle)
+        self.last_error = None
+        self.reloads += 1
+        log(f"데이터 새 버전 적용 ({self.source.name} {bundle.version[:12]}, "
+            f"{(time.perf_counter() - start) * 1000:.0f} ms)")
+        return True
+
+    def _install(self, bundle):
+        """보관 목록과 현재 버전을 한 번에 교체 (읽는 쪽은 잠금 없이 이전 또는 새 dict를 봄)"""
+        with self._lock:
+            versions = dict(self._versions)
+            versions.pop(bundle.version, None)
+            versions[bundle.version] = bundle
+            while len(versions) > KEEP_VERSIONS:
+                versions.pop(next(iter(versions)))
+            self._versions = versions
+            self._current = bundle
+
+    def _try(self, func, *args):
+        try:
+            func(*args)
+        except Exception as e:
+            log(f"데이터 파생 캐시 준비 실패 ({self.source.name}): {type(e).__name__}: {e}")
@@ -0,0 +1,425 @@
+"""
+진로의사결정 검사 일괄 채점 / 학생별 보고서
+학년 단위 응답 파일(진로결정돕기 40문항)을 웹 결과 페이지와 같은 기준으로 채점하고
+학생마다 HTML 보고서 한 장을 만듭니다.
+
+- 채점: 청크마다 행렬 곱 한 번으로 진로결정 수준 + 하위요인 6개 백분율 (instrument.batch_percent_scores)
+- 판정/구분: 점수(0~100 정수)별 결과 표를 jinrotool2의 판정 함수로 미리 만들어 두고 인덱싱
+- 보고서: 워커 프로세스들이 청크 단위로 HTML을 만들어 바로 저장 (--workers)
+- 이어 하기: 청크가 끝날 때마다 요약 CSV에 이어 쓰고 _done.json에 처리한 행 수와 요약 파일 크기를 기록
+  -> 중간에 멈춰도 다시 실행하면 기록된 곳부터 이어서 처리
+  (요약 파일은 기록된 크기로 잘라 반쯤 쓴 청크를 지움, 입력 파일이 바뀌었으면 --restart 필요)
+
+입력 파일 (CSV 또는 Parquet, 한 행이 학생 한 명):
+    학생 식별 열 (--id-column, 기본: 문항이 아닌 첫 열) - 보고서 파일 이름으로 씀
+    (같은 식별자나 'a/b'와 'a_b'처럼 같은 파일 이름이 되는 식별자는 뒤에 나온 학생 이름에 행 번호를 붙임)
+    문항 열 q1 ~ q40 (진로결정 수준 10문항 -> 하위요인 30문항 순서, --prefix로 변경),
+    값 1, 2, 4, 5 (빈 칸이나 그 밖의 값은 미응답)
+
+출력 (output 디렉터리):
+    summary.csv         학생별 (식별 열), 점수, 판정, 하위요인 구분, 응답 수, 보고서 경로
+    reports/<식별자>.html
+    _done.json          이어 하기 기록
+
+사용법:
+    python decision_batch.py responses.csv out/
+    python decision_batch.py responses.parquet out/ --workers 4
+    python decision_batch.py responses.csv out/ --restart          # 처음부터 다시
+    python decision_batch.py --make-sample 300 sample.csv          # 가상 응답 파일
+"""
+
+import argparse
+import collections
+import html
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+os.environ.setdefault("JINROUP_METRICS", "0")
+
+import page_registry
+from lazy_imports import lazy_import
+from riasec_batch import CSV_ENCODING, csv_bytes, input_columns, read_chunks
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+DEFAULT_PREFIX = "q"
+DEFAULT_CHUNK_SIZE = 200
+SUMMARY_FILE = "summary.csv"
+REPORTS_DIR = "reports"
+DONE_FILE = "_done.json"
+
+_UNSAFE_NAME = re.compile(r"[^\w.-]+")
+_worker_renderer = None
+
+
+# ============================================================
+# 채점
+# ============================================================
+class DecisionScorer:
+    """
+    jinrotool2 검사 정의로 만든 일괄 채점기
+
+    Attributes:
+        item_columns (list[str]): 입력 파일의 문항 열 이름 (문항 번호 순)
+        factors (tuple[str]): 하위요인 (SUBFACTOR_QUESTIONS 순서)
+    """
+
+    def __init__(self, prefix=DEFAULT_PREFIX):
+        self.page = page_registry.get_page_module("career_decision")
+        self.instrument = self.page.INSTRUMENT
+        self.item_columns = [f"{prefix}{i + 1}" for i in range(len(self.instrument))]
+        self.factors = tuple(s for s in self.instrument.subscales if s != self.page.DECISION_LEVEL)
+        self._valid = np.zeros(256, dtype=bool)
+        self._valid[list(self.instrument.scale.values)] = True
+
+        # 점수 0~100 -> 판정 / 구분 (범주 번호)
+        levels = [self.page.get_decision_level_result(score)[0] for score in range(101)]
+        self._levels = pd.Index(dict.fromkeys(levels))
+        self._level_codes = self._levels.get_indexer(levels)
+        categories = [self.page.categorize_subfactor_score(score) for score in range(101)]
+        self._categories = pd.Index(dict.fromkeys(categories))
+        self._category_codes = self._categories.get_indexer(categories)
+
+    def answers(self, frame):
+        """문항 열 -> 응답 uint8 배열 (학생 x 문항, 척도에 없는 값/빈 칸은 0)"""
+        values = frame[self.item_columns].to_numpy(dtype="float32", na_value=0.0)
+        values = np.nan_to_num(values, nan=0.0, posinf=0.0, neginf=0.0)
+        whole = (values >= 0) & (values <= 255) & (values == np.floor(values))
+        answers = np.where(whole, values, 0).astype("uint8")
+        answers[~self._valid[answers]] = 0
+        return answers
+
+    def score(self, frame, ids):
+        """
+        청크 채점 결과 DataFrame
+
+        열: id, decision_score, decision_level, <하위요인>..., <하위요인>_level..., answered
+        """
+        answers = self.answers(frame)
+        percents = self.instrument.batch_percent_scores(answers)
+        decision = percents[:, self.instrument.subscales.index(self.page.DECISION_LEVEL)]
+
+        result = pd.DataFrame({'id': ids})
+        result['decision_score'] = decision
+        result['decision_level'] = pd.Categorical.from_codes(self._level_codes[decision], categories=self._levels)
+        for factor in self.factors:
+            result[factor] = percents[:, self.instrument.subscales.index(factor)]
+        for factor in self.factors:
+            result[f"{factor}_level"] = pd.Categorical.from_codes(
+                self._category_codes[result[factor].to_numpy()], categories=self._categories)
+        result['answered'] = np.count_nonzero(answers, axis=1)
+        return result
+
+
+# ============================================================
+# 보고서
+# ============================================================
+REPORT_STYLE = """
+body { font-family: 'Malgun Gothic', 'Apple SD Gothic Neo', sans-serif; max-width: 760px; margin: 2em auto;
+       color: #222; line-height: 1.6; }
+h1 { font-size: 1.6em; } h2 { font-size: 1.2em; border-bottom: 1px solid #ddd; padding-bottom: .2em; }
+.level { padding: .8em 1em; border-radius: 6px; color: #fff; }
+.bar { display: flex; align-items: center; margin: .3em 0; }
+.bar span { width: 9em; } .bar div { height: 1.1em; border-radius: 3px; }
+.guide { background: #f7f7f7; padding: .6em 1em; border-radius: 6px; margin: .6em 0; }
+.note { color: #666; font-size: .9em; }
+@media print { body { margin: 0; } }
+"""
+
+BAR_COLORS = {'높음': '#4CAF50', '보통': '#FFC107', '낮음': '#F44336'}  # create_subfactor_chart와 같은 색
+
+
+class ReportRenderer:
+    """학생 한 명의 채점 결과 -> 독립 HTML 문서 (차트 라이브러리 없이 CSS 막대)"""
+
+    def __init__(self, out_dir):
+        self.page = page_registry.get_page_module("career_decision")
+        self.reports_dir = Path(out_dir) / REPORTS_DIR
+
+    def render(self, row, factors):
+        page = self.page
+        esc = html.escape
+        level, color = page.get_decision_level_result(row['decision_score'])
+        scores = {factor: row[factor] for factor in factors}
+
+        bars = "".join(
+            f'<div class="bar"><span>{esc(factor)}</span>'
+            f'<div style="width:{score * 4}px;background:{BAR_COLORS.get(page.categorize_subfactor_score(score), "#999")}">'
+            f'</div>&nbsp;{score}점 ({esc(page.categorize_subfactor_score(score))})</div>'
+            for factor, score in scores.items()
+        )
+
+        problems = sorted(((f, s) for f, s in scores.items() if s >= page.PROBLEM_THRESHOLD),
+                          key=lambda item: item[1], reverse=True)
+        if problems:
+            guides = "".join(self._guide(factor, score, full=True) for factor, score in problems)
+            guide_intro = f"<p>주로 겪고 있는 어려움은 <b>{len(problems)}가지</b> 영역입니다.</p>"
+        else:
+            top = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:3]
+            guides = "".join(self._guide(factor, score, full=False) for factor, score in top)
+            guide_intro = "<p>모든 요인에서 양호한 수준입니다. 더 강화하면 좋은 영역:</p>"
+
+        incomplete = ""
+        if row['answered'] < len(page.INSTRUMENT):
+            incomplete = (f'<p class="note">응답하지 않은 문항이 {len(page.INSTRUMENT) - row["answered"]}개 있어 '
+                          "해당 문항은 0점으로 계산했습니다.</p>")
+
+        return (
+            '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">'
+            f"<title>진로의사결정 검사 결과 - {esc(str(row['id']))}</title><style>{REPORT_STYLE}</style></head><body>"
+            f"<h1>🎯 진로의사결정 검사 결과</h1><p>학생: <b>{esc(str(row['id']))}</b></p>{incomplete}"
+            f"<h2>1. 진로결정 수준</h2>"
+            f'<div class="level" style="background:{color}">{row["decision_score"]}점 · {esc(level)}</div>'
+            f"<p>{esc(page.LEVEL_INTERPRETATIONS[level])}</p>"
+            f"<h2>2. 의사결정 방해요인</h2>{bars}"
+            f"<h2>3. 맞춤형 해결 방안</h2>{guide_intro}{guides}"
+            "</body></html>"
+        )
+
+    def _guide(self, factor, score, full):
+        esc = html.escape
+        guide = self.page.SOLUTION_GUIDE[factor]
+        parts = [f'<div class="guide"><b>{esc(factor)}</b> ({score}점)<p>{esc(guide["description"])}</p>']
+        if full:
+            parts.append("<b>해결 방법</b><ol>" + "".join(f"<li>{esc(s)}</li>" for s in guide['solutions']) + "</ol>")
+        tests = guide['tests'] if full else guide['tests'][:2]
+        parts.append("<b>추천 진로심리검사</b><ul>" + "".join(f"<li>{esc(t)}</li>" for t in tests) + "</ul></div>")
+        return "".join(parts)
+
+    def write(self, result, factors):
+        """청크의 보고서를 모두 저장 (파일마다 임시 파일 -> 이름 바꾸기, 파일 이름은 report 열)"""
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        for row in result.to_dict("records"):
+            path = self.reports_dir / Path(row['report']).name
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(self.render(row, factors), encoding="utf-8")
+            os.replace(tmp_path, path)
+        return len(result)
+
+
+def report_name(student_id):
+    """학생 식별자 -> 보고서 파일 이름 (경로 문자 등은 _로)"""
+    return f"{_UNSAFE_NAME.sub('_', str(student_id)).strip('._') or 'student'}.html"
+
+
+class ReportNames:
+    """
+    실행 하나에서 겹치지 않는 보고서 파일 이름
+    입력 순서대로 정하므로 이어 하기로 다시 실행해도 같은 학생은 같은 이름을 받습니다.
+    """
+
+    def __init__(self):
+        self._used = set()
+        self.renamed = 0  # 이름이 겹쳐 행 번호를 붙인 학생 수
+
+    def assign(self, ids, first_row):
+        """
+        Args:
+            ids (sequence[str]): 학생 식별자 (입력 순서)
+            first_row (int): ids[0]의 입력 파일 행 번호 (0부터)
+
+        Returns:
+            list[str]: 파일 이름 (겹치면 '<식별자>-<행 번호>.html', 행 번호는 1부터)
+        """
+        names = []
+        for row, student_id in enumerate(ids, first_row + 1):
+            name = report_name(student_id)
+            suffix = 0
+            while name in self._used:
+                suffix += 1
+                name = report_name(f"{student_id}-{row}" + (f"-{suffix}" if suffix > 1 else ""))
+            self.renamed += suffix > 0
+            self._used.add(name)
+            names.append(name)
+        return names
+
+
+def _init_worker(out_dir):
+    global _worker_renderer
+    _worker_renderer = ReportRenderer(out_dir)
+
+
+def _write_in_worker(result, factors):
+    return _worker_renderer.write(result, factors)
+
+
+# ============================================================
+# 이어 하기 기록
+# ============================================================
+def source_signature(path):
+    stat = os.stat(path)
+    return {'source': str(Path(path).resolve()), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def read_done(out_dir):
+    try:
+        return json.loads((Path(out_dir) / DONE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def write_done(out_dir, record):
+    """_done.json 원자적 교체 (쓰다 멈춰도 이전 기록이 남음)"""
+    path = Path(out_dir) / DONE_FILE
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(json.dumps(record, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+# ============================================================
+# 실행
+# ============================================================
+def run(source, out_dir, id_column=None, prefix=DEFAULT_PREFIX, chunk_size=DEFAULT_CHUNK_SIZE,
+        workers=1, restart=False):
+    """
+    응답 파일 전체 채점 + 보고서 생성 (이전 실행 기록이 있으면 이어서)
+
+    Returns:
+        dict: {'rows': 이번에 처리한 학생 수, 'skipped': 이전에 끝난 학생 수,
+               'renamed': 파일 이름이 겹쳐 행 번호를 붙인 학생 수, 'seconds'}
+
+    Raises:
+        ValueError: 문항/식별 열이 없거나, 입력 파일이 이전 실행과 달라 이어 할 수 없는 경우
+    """
+    start = time.perf_counter()
+    out_dir = Path(out_dir)
+    scorer = DecisionScorer(prefix)
+    available = input_columns(source)
+    missing = [column for column in scorer.item_columns if column not in available]
+    if missing:
+        raise ValueError(f"문항 열이 없습니다: {', '.join(missing[:5])}{' 등' if len(missing) > 5 else ''} "
+                         f"(열 이름은 {scorer.item_columns[0]}~{scorer.item_columns[-1]}, --prefix로 변경)")
+    if id_column is None:
+        others = [column for column in available if column not in set(scorer.item_columns)]
+        if not others:
+            raise ValueError("학생 식별 열이 없습니다 (--id-column)")
+        id_column = others[0]
+    elif id_column not in available:
+        raise ValueError(f"입력 파일에 없는 열: {id_column}")
+
+    signature = source_signature(source)
+    done = None if restart else read_done(out_dir)
+    if done is not None and done.get('signature') != signature:
+        raise ValueError("이전 실행과 입력 파일이 다릅니다 (처음부터 하려면 --restart)")
+    skip = done['rows'] if done else 0
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    summary_path = out_dir / SUMMARY_FILE
+    if done:
+        summary = open(summary_path, "r+b")
+        summary.truncate(done['summary_bytes'])  # 기록 뒤에 반쯤 쓴 청크 제거
+        summary.seek(0, os.SEEK_END)
+    else:
+        summary = open(summary_path, "wb")
+    renderer = ReportRenderer(out_dir)
+    factors = scorer.factors
+    names = ReportNames()
+    state = {'rows': skip}
+
+    def commit(result):
+        """보고서가 모두 저장된 청크를 요약에 쓰고 기록 갱신 (입력 순서대로)"""
+        if summary.tell() == 0:
+            columns = [id_column if column == 'id' else column for column in result.columns]
+            summary.write(pd.DataFrame(columns=columns).to_csv(index=False).encode(CSV_ENCODING))
+        summary.write(csv_bytes(result.rename(columns={'id': id_column})))
+        summary.flush()
+        os.fsync(summary.fileno())
+        state['rows'] += len(result)
+        write_done(out_dir, {'signature': signature, 'rows': state['rows'], 'summary_bytes': summary.tell()})
+        print(f"  {state['rows']:>8,}명 ({(state['rows'] - skip) / (time.perf_counter() - start):,.0f}명/초)",
+              flush=True)
+
+    def scored_chunks():
+        seen = 0
+        for frame in read_chunks(source, [id_column] + scorer.item_columns, scorer.item_columns, chunk_size):
+            # 이미 끝난 행도 이름을 정해 두어야 이후 학생의 이름이 이전 실행과 같음
+            ids = frame[id_column].astype(str).to_numpy()
+            files = names.assign(ids, seen)
+            start_row = max(skip - seen, 0)
+            seen += len(frame)
+            if start_row >= len(frame):
+                continue
+            result = scorer.score(frame.iloc[start_row:], ids[start_row:])
+            yield result.assign(report=[f"{REPORTS_DIR}/{name}" for name in files[start_row:]])
+
+    try:
+        if workers <= 1:
+            for result in scored_chunks():
+                renderer.write(result, factors)
+                commit(result)
+        else:
+            # 진행 중인 청크를 workers x 2개로 제한 (기록은 앞 청크부터 순서대로)
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(str(out_dir),)) as pool:
+                pending = collections.deque()
+                for result in scored_chunks():
+                    pending.append((result, pool.submit(_write_in_worker, result, factors)))
+                    if len(pending) >= workers * 2:
+                        result, future = pending.popleft()
+                        future.result()
+                        commit(result)
+                while pending:
+                    result, future = pending.popleft()
+                    future.result()
+                    commit(result)
+    finally:
+        summary.close()
+    return {'rows': state['rows'] - skip, 'skipped': skip, 'renamed': names.renamed,
+            'seconds': time.perf_counter() - start}
+
+
+def make_sample(path, rows, seed=0, prefix=DEFAULT_PREFIX):
+    """가상 응답 파일 (학번 + 문항 열)"""
+    scorer = DecisionScorer(prefix)
+    rng = np.random.default_rng(seed)
+    values = np.array(scorer.instrument.scale.values)
+    answers = values[rng.integers(0, len(values), (rows, len(scorer.item_columns)))]
+    frame = pd.DataFrame(answers, columns=scorer.item_columns)
+    frame.insert(0, '학번', [f"2025{i:05d}" for i in range(rows)])
+    if str(path).endswith((".parquet", ".pq")):
+        frame.to_parquet(path, index=False)
+    else:
+        frame.to_csv(path, index=False, encoding=CSV_ENCODING)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="진로의사결정 검사 일괄 채점 / 학생별 HTML 보고서")
+    parser.add_argument("source", nargs="?", type=Path, help="응답 파일 (.csv / .parquet)")
+    parser.add_argument("output", type=Path, help="결과 디렉터리 (--make-sample이면 만들 응답 파일)")
+    parser.add_argument("--id-column", help="학생 식별 열 (기본: 문항이 아닌 첫 열)")
+    parser.add_argument("--prefix", default=DEFAULT_PREFIX, help="문항 열 이름 접두사 (기본 q -> q1~q40)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="한 번에 처리할 학생 수")
+    parser.add_argument("--workers", type=int, default=1, help="보고서 생성 프로세스 수")
+    parser.add_argument("--restart", action="store_true", help="이전 실행 기록을 무시하고 처음부터")
+    parser.add_argument("--make-sample", type=int, metavar="ROWS", help="채점 대신 가상 응답 파일 생성")
+    args = parser.parse_args(argv)
+
+    if args.make_sample:
+        make_sample(args.output, args.make_sample, prefix=args.prefix)
+        print(f"{args.output} ({args.make_sample:,}명)")
+        return 0
+    if args.source is None:
+        parser.error("응답 파일을 지정하세요")
+
+    try:
+        stats = run(args.source, args.output, args.id_column, args.prefix, args.chunk_size,
+                    args.workers, args.restart)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"입력 파일 오류 ({args.source}): {e}", file=sys.stderr)
+        return 1
+    resumed = f" (이전 실행에서 {stats['skipped']:,}명 완료)" if stats['skipped'] else ""
+    print(f"{args.output}: {stats['rows']:,}명 보고서 생성{resumed}, {stats['seconds']:.1f}초")
+    if stats['renamed']:
+        print(f"식별자가 겹치거나 같은 파일 이름이 되는 학생 {stats['renamed']:,}명은 보고서 이름에 행 번호를 붙였습니다 "
+              "(summary.csv의 report 열 참고)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+조건 필터 색인 (지역 / 설립유형 / 대학 유형)
+범주형 열의 코드로 값마다 해당 행 번호 배열을 미리 만들어 두고,
+조건이 바뀌면 고른 값들의 행 번호를 합치고(같은 열 안은 OR) 열끼리 교집합(AND)을 구합니다.
+rerun마다 DataFrame 전체에 불리언 마스크를 만들지 않으므로 비용은 일치하는 행 수에 비례합니다.
+
+- 값별 개수는 "그 열을 뺀 나머지 조건"에 맞는 행으로 셈
+  (지역에서 서울을 골라도 다른 지역 개수가 0이 되지 않아 여러 값을 더 고를 수 있음)
+- 조건 조합별 결과는 LRU 캐시 (색인은 읽기 전용이므로 모든 세션이 공유)
+"""
+
+import functools
+from types import MappingProxyType
+
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+FACET_COLUMNS = ('지역', '설립유형', '대학 유형')
+
+
+class FacetIndex:
+    """
+    열별 값 -> 행 번호 색인 (한 번 만들고 읽기만 함)
+
+    selection 인자는 {열 이름: 고른 값 목록} 형태이며, 빠진 열이나 빈 목록은 조건 없음입니다.
+
+    Attributes:
+        columns (tuple[str]): 필터 열 (표에 있는 것만)
+        values (dict): 열 이름 -> 값 tuple (범주 순서)
+        size (int): 전체 행 수
+    """
+
+    def __init__(self, frame, columns=FACET_COLUMNS, cache_size=128):
+        self.columns = tuple(column for column in columns if column in frame.columns)
+        self.size = len(frame)
+        self.values = {}
+        self._codes = {}
+        self._value_codes = {}
+        self._postings = {}
+
+        for column in self.columns:
+            series = frame[column]
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                series = series.astype("category")
+            values = tuple(series.cat.categories.tolist())
+            codes = series.cat.codes.to_numpy()  # 빈 값은 -1
+
+            # 코드 순으로 안정 정렬하면 값마다 행 번호가 오름차순인 연속 구간이 됨
+            order = np.argsort(codes, kind="stable")
+            starts = np.searchsorted(codes[order], np.arange(len(values) + 1))
+            postings = tuple(order[starts[k]:starts[k + 1]] for k in range(len(values)))
+            for rows in postings:
+                rows.setflags(write=False)
+
+            self.values[column] = values
+            self._codes[column] = codes
+            self._value_codes[column] = {value: code for code, value in enumerate(values)}
+            self._postings[column] = postings
+
+        self._rows = functools.lru_cache(maxsize=cache_size)(self._rows_for)
+        self._counts = functools.lru_cache(maxsize=cache_size)(self._counts_for)
+
+    # --------------------------------------------------------
+    # 조건 -> 캐시 키
+    # --------------------------------------------------------
+    def key(self, selection):
+        """조건을 캐시 키로 ((열, 값 코드 tuple), ...) - 모르는 값은 무시"""
+        key = []
+        for column in self.columns:
+            codes = {self._value_codes[column][v] for v in selection.get(column, ()) if v in self._value_codes[column]}
+            if codes:
+                key.append((column, tuple(sorted(codes))))
+        return tuple(key)
+
+    def active(self, selection):
+        """조건이 하나라도 있는지"""
+        return bool(self.key(selection))
+
+    # --------------------------------------------------------
+    # 질의
+    # --------------------------------------------------------
+    def rows(self, selection):
+        """조건에 맞는 행 번호 (오름차순 ndarray, 조건이 없으면 None = 전체)"""
+        return self._rows(self.key(selection))
+
+    def counts(self, selection):
+        """
+        열별 값 개수 {열: {값: 개수}} (각 열은 나머지 열의 조건만 적용해 셈)
+        """
+        return self._counts(self.key(selection))
+
+    def _rows_for(self, key):
+        if not key:
+            return None
+        # 행이 적은 열부터 교집합 (중간 결과가 작게 유지됨)
+        groups = []
+        for column, codes in key:
+            postings = [self._postings[column][code] for code in codes]
+            groups.append(postings)
+        groups.sort(key=lambda postings: sum(len(rows) for rows in postings))
+
+        result = None
+        for postings in groups:
+            rows = postings[0] if len(postings) == 1 else np.sort(np.concatenate(postings))
+            result = rows if result is None else np.intersect1d(result, rows, assume_unique=True)
+            if not len(result):
+                break
+        result.setflags(write=False)
+        return result
+
+    def _counts_for(self, key):
+        counts = {}
+        for column in self.columns:
+            rows = self._rows(tuple(item for item in key if item[0] != column))
+            codes = self._codes[column] if rows is None else self._codes[column][rows]
+            per_value = np.bincount(codes[codes >= 0], minlength=len(self.values[column]))
+            counts[column] = MappingProxyType(dict(zip(self.values[column], per_value.tolist())))
+        return MappingProxyType(counts)
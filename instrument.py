@@ -0,0 +1,234 @@
+"""
+검사 엔진
+검사(진로결정돕기, 흥미와전공)를 문항/하위척도/역채점/응답 척도로 선언하면
+임포트할 때 한 번 평평한 배열로 컴파일합니다.
+
+- 문항 조회는 문항 번호로 tuple 인덱싱 한 번 (O(1), rerun마다 중첩 dict를 훑지 않음)
+- 채점은 numpy 한 번: 응답 bytearray -> 역채점 -> 하위척도별 np.bincount
+  (문항이 늘어도 클릭마다 드는 비용은 같고, 결과 페이지 채점도 배열 연산 한 번)
+- 응답은 session_store.InstrumentState.answers 형식 (문항 번호 순 bytearray, 0 = 미응답)
+- 여러 명을 한꺼번에 채점할 때는 (응답자 x 문항) 배열과 (문항 x 하위척도) 가중치의 행렬 곱 한 번
+
+예:
+    SCALE = instrument.Scale((1, 2, 3, 4, 5), ("전혀 그렇지 않다", ..., "매우 그렇다"))
+    INSTRUMENT = instrument.compile_instrument("riasec", SCALE, [
+        ("main", "흥미 검사", {"R": ["...", ...], "I": [...]}),
+    ])
+    INSTRUMENT.item(12).text
+    INSTRUMENT.scores(state.answers)      # {'R': 31, 'I': 25, ...}
+"""
+
+from collections import namedtuple
+from types import MappingProxyType
+
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+
+# ============================================================
+# 선언
+# ============================================================
+class Scale(namedtuple("Scale", "values labels")):
+    """
+    응답 척도
+
+    Attributes:
+        values (tuple[int]): 응답 값 (1~255, 예: (1, 2, 4, 5))
+        labels (tuple[str]): 값별 문구
+    """
+    __slots__ = ()
+
+    @property
+    def low(self):
+        return min(self.values)
+
+    @property
+    def high(self):
+        return max(self.values)
+
+    def label(self, value):
+        return self.labels[self.values.index(value)]
+
+    def index(self, value):
+        """라디오 버튼 기본 선택 위치 (값이 척도에 없으면 None)"""
+        return self.values.index(value) if value in self.values else None
+
+
+class Item(namedtuple("Item", "id text subscale section position reverse")):
+    """
+    컴파일된 문항 하나
+
+    Attributes:
+        id (int): 전체 문항 번호 (응답 배열 위치)
+        subscale (str): 하위척도 이름
+        section (str): 단계 ID
+        position (int): 단계 안에서의 순서 (0부터)
+        reverse (bool): 역채점 문항
+    """
+    __slots__ = ()
+
+
+class Section(namedtuple("Section", "id title start stop")):
+    """단계 (문항 번호 [start, stop) 구간)"""
+    __slots__ = ()
+
+    @property
+    def size(self):
+        return self.stop - self.start
+
+    def item_id(self, position):
+        """단계 안 순서 -> 전체 문항 번호"""
+        return self.start + position
+
+
+def _item_spec(spec):
+    """문항 선언 (문자열 또는 {'text', 'reverse'}) -> (문구, 역채점)"""
+    if isinstance(spec, str):
+        return spec, False
+    return spec['text'], bool(spec.get('reverse', False))
+
+
+def compile_instrument(name, scale, sections):
+    """
+    검사 선언을 컴파일
+
+    Args:
+        name (str): 검사 이름
+        scale (Scale): 응답 척도
+        sections (list): [(단계 ID, 단계 제목, {하위척도: [문항, ...]}), ...]
+            문항은 문구 문자열 또는 {"text": 문구, "reverse": True} (역채점)
+            같은 하위척도가 여러 단계에 나오면 하나로 합쳐 채점
+
+    Returns:
+        Instrument
+    """
+    items = []
+    subscales = {}
+    compiled_sections = {}
+    for section_id, title, groups in sections:
+        start = len(items)
+        for subscale, specs in groups.items():
+            subscales.setdefault(subscale, len(subscales))
+            for spec in specs:
+                text, reverse = _item_spec(spec)
+                items.append(Item(len(items), text, subscale, section_id, len(items) - start, reverse))
+        compiled_sections[section_id] = Section(section_id, title, start, len(items))
+    return Instrument(name, scale, tuple(items), tuple(subscales), compiled_sections)
+
+
+# ============================================================
+# 컴파일된 검사
+# ============================================================
+class Instrument:
+    """
+    컴파일된 검사 (읽기 전용, 모든 세션이 공유)
+
+    Attributes:
+        name (str): 검사 이름
+        scale (Scale): 응답 척도
+        items (tuple[Item]): 문항 번호 순
+        subscales (tuple[str]): 하위척도 (선언 순서)
+        sections (MappingProxyType): 단계 ID -> Section (선언 순서)
+    """
+
+    def __init__(self, name, scale, items, subscales, sections):
+        self.name = name
+        self.scale = scale
+        self.items = items
+        self.subscales = subscales
+        self.sections = MappingProxyType(sections)
+
+        codes = {subscale: code for code, subscale in enumerate(subscales)}
+        self._subscale_codes = np.array([codes[item.subscale] for item in items], dtype="intp")
+        self._reverse = np.array([item.reverse for item in items], dtype=bool)
+        self._sizes = np.bincount(self._subscale_codes, minlength=len(subscales))
+        # 문항 x 하위척도 0/1 가중치 (일괄 채점용)
+        self._weights = np.zeros((len(items), len(subscales)), dtype="float32")
+        self._weights[np.arange(len(items)), self._subscale_codes] = 1.0
+        for array in (self._subscale_codes, self._reverse, self._sizes, self._weights):
+            array.setflags(write=False)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __repr__(self):
+        return f"<Instrument {self.name}: {len(self.items)}문항, 하위척도 {len(self.subscales)}개>"
+
+    # --------------------------------------------------------
+    # 조회
+    # --------------------------------------------------------
+    def item(self, item_id):
+        return self.items[item_id]
+
+    def section(self, section_id):
+        return self.sections[section_id]
+
+    def next_section(self, section_id):
+        """다음 단계 ID (마지막 단계면 None)"""
+        ids = tuple(self.sections)
+        index = ids.index(section_id) + 1
+        return ids[index] if index < len(ids) else None
+
+    def subscale_size(self, subscale):
+        """하위척도의 문항 수"""
+        return int(self._sizes[self.subscales.index(subscale)])
+
+    # --------------------------------------------------------
+    # 채점
+    # --------------------------------------------------------
+    def keyed(self, answers):
+        """
+        역채점을 적용한 응답 배열 (미응답은 0)
+
+        Args:
+            answers (bytes | bytearray | ndarray): 문항 번호 순 응답 값
+        """
+        if isinstance(answers, (bytes, bytearray, memoryview)):
+            values = np.frombuffer(answers, dtype="uint8")
+        else:
+            values = np.asarray(answers)
+        values = values.astype("int64")
+        flip = self._reverse & (values > 0)
+        values[flip] = self.scale.low + self.scale.high - values[flip]
+        return values
+
+    def raw_scores(self, answers):
+        """하위척도별 원점수 ndarray (subscales 순서)"""
+        return np.bincount(self._subscale_codes, weights=self.keyed(answers),
+                           minlength=len(self.subscales)).astype("int64")
+
+    def scores(self, answers):
+        """하위척도별 원점수 {하위척도: 점수}"""
+        return dict(zip(self.subscales, self.raw_scores(answers).tolist()))
+
+    def percent_scores(self, answers):
+        """
+        하위척도별 백분율 점수 {하위척도: 0~100 정수}
+        (원점수 / (문항 수 x 척도 최댓값) x 100, 반올림)
+        """
+        percents = self.raw_scores(answers) / (self._sizes * self.scale.high) * 100
+        return {subscale: round(value) for subscale, value in zip(self.subscales, percents.tolist())}
+
+    # --------------------------------------------------------
+    # 일괄 채점 (응답자 여러 명)
+    # --------------------------------------------------------
+    def batch_raw_scores(self, answers):
+        """
+        응답자별 하위척도 원점수 (응답자 x 하위척도 int64 ndarray, subscales 순서)
+
+        Args:
+            answers (ndarray): 응답자 x 문항 응답 값 (정수, 0 = 미응답)
+        """
+        values = np.asarray(answers)
+        if self._reverse.any():
+            values = values.astype("int16")
+            flip = self._reverse & (values > 0)
+            values = np.where(flip, self.scale.low + self.scale.high - values, values)
+        # 점수가 작은 정수라 float32 행렬 곱도 정확함 (2^24 미만)
+        return np.rint(values.astype("float32") @ self._weights).astype("int64")
+
+    def batch_percent_scores(self, answers):
+        """응답자별 하위척도 백분율 점수 (응답자 x 하위척도 int64 ndarray, percent_scores와 같은 반올림)"""
+        percents = self.batch_raw_scores(answers) / (self._sizes * self.scale.high) * 100
+        return np.round(percents).astype("int64")  # 짝수 반올림 = 파이썬 round()
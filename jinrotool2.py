@@ -3,8 +3,20 @@
 진로결정 수준, 하위요인, 의사결정 유형을 종합적으로 분석합니다.
 """
 
+from collections import namedtuple
+
 import streamlit as st
-import plotly.graph_objects as go
+
+import instrument
+import metrics
+import navigation
+import results
+import session_store
+from lazy_imports import lazy_import
+from page_registry import freeze
+
+# plotly는 결과 페이지에서 차트를 그릴 때 처음 임포트됩니다
+go = lazy_import("plotly.graph_objects")
 
 
 # ============================================================
@@ -22,7 +34,7 @@ import plotly.graph_objects as go
 # ============================================================
 
 # 진로결정 수준 문항 (10문항)
-DECISION_LEVEL_QUESTIONS = [
+DECISION_LEVEL_QUESTIONS = freeze([
     {"text": "미래 진로에 대해 현실적이고 구체적인 방향성이 결정되어 있다", "reverse": False},
     {"text": "진로에 대한 결정을 내리지 못해 불안하고 답답하다", "reverse": True},
     {"text": "진로 방향을 정하지 못해 스트레스를 받는다", "reverse": True},
@@ -33,10 +45,10 @@ DECISION_LEVEL_QUESTIONS = [
     {"text": "선택한 진로에 대해 만족하고 편안하다", "reverse": False},
     {"text": "진로를 정하지 못해 조급한 마음이 든다", "reverse": True},
     {"text": "진로 방향에 대한 확신이 있다", "reverse": False}
-]
+])
 
 # 하위요인 문항 (6개 요인 × 5문항 = 30문항)
-SUBFACTOR_QUESTIONS = {
+SUBFACTOR_QUESTIONS = freeze({
     "자기명확성부족": [
         "나의 적성과 흥미를 잘 모르겠다",
         "나에게 맞는 직업이 무엇인지 확신이 없다",
@@ -79,10 +91,10 @@ SUBFACTOR_QUESTIONS = {
         "진로에 대해 고민하는 것이 시간 낭비 같다",
         "나중에 생각해도 늦지 않다고 생각한다"
     ]
-}
+})
 
 # 요인별 해결 방법 및 추천 검사
-SOLUTION_GUIDE = {
+SOLUTION_GUIDE = freeze({
     "자기명확성부족": {
         "description": "자신의 흥미, 적성, 가치관, 성격 등을 명확히 이해하지 못하여 진로 결정에 어려움을 겪고 있습니다.",
         "solutions": [
@@ -173,7 +185,28 @@ SOLUTION_GUIDE = {
             "🚀 진로준비도검사 - 현재 진로 준비 상태 점검"
         ]
     }
-}
+})
+
+# 진로결정 수준 판정별 해석
+LEVEL_INTERPRETATIONS = freeze({
+    "미결정 X 불편안": "미래의 진로에 대해 현실적, 구체적인 방향성이 결정되어 있지 않고 진로 방향성의 견고한 정도가 낮습니다.",
+    "결정 X 불편안": "또래 평균과 비교하여, 진로의사결정 수준은 평균 수준으로 결정하고 있습니다. 현재도 어느 정도 진로의사결정을 하고 있으나, 아래 능력 향상을 위한 노력이 조금 더 요구됩니다.",
+    "결정 X 편안": "미래 진로에 대해 현실적, 구체적인 방향성이 결정되어 있습니다.",
+    "미결정 X 편안": "미래 진로에 대해 현실적, 구체적인 방향성이 아직 결정되지 않았음을 의미합니다. 다양한 진로 관련 경험을 통해 자신에게 적절한 진로를 결정해나가는 과정이 필요합니다.",
+})
+
+PROBLEM_THRESHOLD = 50  # 이 점수 이상인 하위요인은 해결 방안을 안내
+
+DECISION_LEVEL = "진로결정수준"  # 진로결정 수준 문항의 하위척도 이름
+
+SCALE = instrument.Scale((1, 2, 4, 5), ("매우 아니다", "아니다", "그렇다", "매우 그렇다"))
+
+# 문항 번호: 진로결정 수준 0~9, 하위요인 10~39 (SUBFACTOR_QUESTIONS 순서)
+INSTRUMENT = instrument.compile_instrument("career_decision", SCALE, [
+    ("decision_level", "1단계: 진로결정 수준", {DECISION_LEVEL: DECISION_LEVEL_QUESTIONS}),
+    ("subfactors", "2단계: 의사결정 방해요인", SUBFACTOR_QUESTIONS),
+])
+TOTAL_QUESTIONS = len(INSTRUMENT)
 
 
 # ============================================================
@@ -181,33 +214,24 @@ SOLUTION_GUIDE = {
 # ============================================================
 
 def initialize_session_state():
-    """세션 스테이트 초기화"""
-    if 'page' not in st.session_state:
-        st.session_state.page = 'intro'
-    if 'test_phase' not in st.session_state:
-        st.session_state.test_phase = 'decision_level'
-    if 'answers' not in st.session_state:
-        st.session_state.answers = {
-            'decision_level': {},
-            'subfactors': {}
-        }
-    if 'current_question' not in st.session_state:
-        st.session_state.current_question = 0
+    """세션 스테이트 초기화 (검사 상태 객체 반환)"""
+    return session_store.get_state(
+        session_store.CAREER_DECISION, TOTAL_QUESTIONS, phase='decision_level'
+    )
 
 
-def calculate_decision_level_score(answers):
-    """진로결정 수준 점수 계산 (0-100점)"""
-    total = 0
-    for idx, answer in answers.items():
-        question = DECISION_LEVEL_QUESTIONS[idx]
-        if question['reverse']:
-            total += (6 - answer)
-        else:
-            total += answer
-    
-    max_score = len(DECISION_LEVEL_QUESTIONS) * 5
-    percentage = (total / max_score) * 100
-    return round(percentage)
+def calculate_scores(answers):
+    """
+    진로결정 수준과 하위요인 점수 계산 (0-100점, 역채점 문항 반영)
+
+    Args:
+        answers: 문항 번호 순서의 응답 값 (0 = 미응답)
+
+    Returns:
+        tuple: (진로결정 수준 점수, {하위요인: 점수})
+    """
+    scores = INSTRUMENT.percent_scores(answers)
+    return scores.pop(DECISION_LEVEL), scores
 
 
 def get_decision_level_result(score):
@@ -222,17 +246,6 @@ def get_decision_level_result(score):
         return "미결정 X 편안", "#2196F3"
 
 
-def calculate_subfactor_scores(answers):
-    """하위요인 점수 계산"""
-    scores = {}
-    for factor, questions in SUBFACTOR_QUESTIONS.items():
-        total = sum(answers.get(f"{factor}_{i}", 0) for i in range(len(questions)))
-        max_score = len(questions) * 5
-        percentage = round((total / max_score) * 100)
-        scores[factor] = percentage
-    return scores
-
-
 def categorize_subfactor_score(score):
     """하위요인 점수 구분"""
     if score >= 61:
@@ -243,11 +256,42 @@ def categorize_subfactor_score(score):
         return "낮음"
 
 
+class CareerDecisionResult(namedtuple(
+        "CareerDecisionResult", "decision_score level color subfactors categories problem_factors")):
+    """
+    완료된 응답의 결과 (읽기 전용, 같은 응답이면 모든 세션이 같은 객체를 공유)
+
+    Attributes:
+        decision_score (int): 진로결정 수준 점수
+        level, color (str): get_decision_level_result 판정
+        subfactors (MappingProxyType): {하위요인: 점수}
+        categories (MappingProxyType): {하위요인: 높음/보통/낮음}
+        problem_factors (tuple): PROBLEM_THRESHOLD 이상인 (하위요인, 점수), 높은 순
+    """
+    __slots__ = ()
+
+
+@results.memoized
+def compute_result(answers):
+    """응답 -> CareerDecisionResult (응답 지문으로 캐시)"""
+    decision_score, subfactor_scores = calculate_scores(answers)
+    level, color = get_decision_level_result(decision_score)
+    problem_factors = [(f, s) for f, s in subfactor_scores.items() if s >= PROBLEM_THRESHOLD]
+    problem_factors.sort(key=lambda x: x[1], reverse=True)
+    return CareerDecisionResult(
+        decision_score, level, color,
+        freeze(subfactor_scores),
+        freeze({factor: categorize_subfactor_score(score) for factor, score in subfactor_scores.items()}),
+        tuple(problem_factors),
+    )
+
+
 def calculate_decision_type_scores(answers):
     """진로의사결정 유형 점수 계산 (사용 안 함)"""
     return {}
 
 
+@results.figure_cache
 def create_decision_level_gauge(score):
     """진로결정 수준 게이지 차트"""
     level, color = get_decision_level_result(score)
@@ -277,6 +321,7 @@ def create_decision_level_gauge(score):
     return fig
 
 
+@results.figure_cache
 def create_subfactor_chart(scores):
     """하위요인 막대 차트"""
     factors = list(scores.keys())
@@ -331,6 +376,48 @@ def create_decision_type_chart(scores):
     return fig
 
 
+# ============================================================
+# 콜백 (스크립트 실행 전에 처리되므로 st.rerun()이 필요 없음)
+# ============================================================
+def start_test():
+    initialize_session_state().reset(page='test', phase='decision_level')
+
+
+def restart_test():
+    initialize_session_state().reset(phase='decision_level')
+
+
+def go_previous():
+    initialize_session_state().current -= 1
+
+
+def go_next(key):
+    """
+    현재 문항 응답 저장 후 다음 문항으로
+    단계의 마지막 문항이면 다음 단계로, 마지막 단계면 결과 페이지로 이동합니다.
+
+    Args:
+        key (str): 현재 문항 응답 위젯의 키
+    """
+    state = initialize_session_state()
+    answer = st.session_state.get(key)
+    if answer is None:
+        state.notice = "응답을 선택해주세요!"
+        return
+
+    section = INSTRUMENT.section(state.phase)
+    state.set_answer(section.item_id(state.current), answer)
+    next_phase = INSTRUMENT.next_section(state.phase)
+    if state.current < section.size - 1:
+        state.current += 1
+    elif next_phase is not None:
+        state.phase = next_phase
+        state.current = 0
+    else:
+        state.page = 'result'
+        navigation.rerun_app()
+
+
 # ============================================================
 # 페이지 함수
 # ============================================================
@@ -369,67 +456,59 @@ def show_intro_page():
     
     st.markdown("---")
     
-    if st.button("검사 시작하기 🚀", type="primary", use_container_width=True):
-        st.session_state.page = 'test'
-        st.session_state.test_phase = 'decision_level'
-        st.session_state.current_question = 0
-        st.rerun()
+    st.button("검사 시작하기 🚀", type="primary", use_container_width=True, on_click=start_test)
 
 
+@metrics.timed("jinrotool2.show_test_page")
 def show_test_page():
     """검사 페이지"""
-    phase = st.session_state.test_phase
-    current_q = st.session_state.current_question
-    
-    # 현재 단계에 따른 문항 설정
-    if phase == 'decision_level':
-        questions = DECISION_LEVEL_QUESTIONS
-        total = len(questions)
-        phase_name = "1단계: 진로결정 수준"
-        answer_key = 'decision_level'
-    else:  # subfactors
-        all_questions = []
-        for factor, qs in SUBFACTOR_QUESTIONS.items():
-            for q in qs:
-                all_questions.append((factor, q))
-        questions = all_questions
-        total = len(questions)
-        phase_name = "2단계: 의사결정 방해요인"
-        answer_key = 'subfactors'
+    show_question_card()
+
+
+@st.fragment
+@metrics.timed_fragment("jinrotool2.show_question_card")
+def show_question_card():
+    """
+    문항 카드, 진행률, 이전/다음 버튼
+    응답 선택, 문항 이동, 단계 전환은 이 조각만 다시 실행하고,
+    결과 페이지로 넘어갈 때만 전체 앱을 실행합니다.
+    이동은 모두 콜백에서 처리되어 클릭 한 번이 실행 한 번입니다.
+    """
+    state = initialize_session_state()
+    if state.page != 'test':
+        # 콜백의 전체 실행 요청이 무시된 경우 (콜백 안 st.rerun()을 지원하지 않는 Streamlit)
+        metrics.rerun()
+    section = INSTRUMENT.section(state.phase)
+    current_q = state.current
+    total = section.size
+    item = INSTRUMENT.item(section.item_id(current_q))
     
     # 진행률
     progress = current_q / total
     st.progress(progress)
-    st.caption(f"{phase_name} - {current_q}/{total} ({int(progress * 100)}%)")
+    st.caption(f"{section.title} - {current_q}/{total} ({int(progress * 100)}%)")
     
     # 문항 표시
     st.markdown(f"### 문항 {current_q + 1}")
     
-    if phase == 'decision_level':
-        question_text = questions[current_q]['text']
-        st.markdown(f"#### {question_text}")
-    else:
-        factor, question_text = questions[current_q]
-        st.markdown(f"**[{factor}]**")
-        st.markdown(f"#### {question_text}")
+    if item.subscale != DECISION_LEVEL:
+        st.markdown(f"**[{item.subscale}]**")
+    st.markdown(f"#### {item.text}")
     
     # 응답 선택 - 이전에 답한 값이 있는지 확인
-    if phase == 'decision_level':
-        previous_answer = st.session_state.answers[answer_key].get(current_q)
-    else:
-        factor = questions[current_q][0]
-        key = f"{factor}_{sum(1 for f, _ in questions[:current_q] if f == factor)}"
-        previous_answer = st.session_state.answers[answer_key].get(key)
+    previous_answer = state.answer(item.id)
+    key = session_store.widget_key(session_store.CAREER_DECISION, item.id)
+    session_store.prune_widget_keys(session_store.CAREER_DECISION, keep=key)
     
     col1, col2, col3 = st.columns([1, 2, 1])
     
     with col2:
-        answer = st.radio(
+        st.radio(
             "응답을 선택해주세요",
-            options=[1, 2, 4, 5],
-            format_func=lambda x: {1: "매우 아니다", 2: "아니다", 4: "그렇다", 5: "매우 그렇다"}[x],
-            index=[1, 2, 4, 5].index(previous_answer) if previous_answer in [1, 2, 4, 5] else None,
-            key=f"q_{phase}_{current_q}",
+            options=SCALE.values,
+            format_func=SCALE.label,
+            index=SCALE.index(previous_answer),
+            key=key,
             horizontal=False
         )
         
@@ -439,50 +518,33 @@ def show_test_page():
         
         with col_prev:
             if current_q > 0:
-                if st.button("⬅️ 이전", use_container_width=True):
-                    st.session_state.current_question -= 1
-                    st.rerun()
+                st.button("⬅️ 이전", use_container_width=True, on_click=go_previous)
         
         with col_next:
             is_last_question = current_q == total - 1
-            is_last_phase = phase == 'subfactors'
+            is_last_phase = INSTRUMENT.next_section(section.id) is None
             
             button_text = "결과 보기 ✅" if (is_last_question and is_last_phase) else "다음 ➡️"
             
-            if st.button(button_text, type="primary", use_container_width=True):
-                # 답변이 선택되었는지 확인
-                if answer is None:
-                    st.error("응답을 선택해주세요!")
-                    st.stop()
-                
-                # 답변 저장
-                if phase == 'decision_level':
-                    st.session_state.answers['decision_level'][current_q] = answer
-                else:  # subfactors
-                    factor, _ = questions[current_q]
-                    key = f"{factor}_{sum(1 for f, _ in questions[:current_q] if f == factor)}"
-                    st.session_state.answers['subfactors'][key] = answer
-                
-                if is_last_question:
-                    if phase == 'decision_level':
-                        st.session_state.test_phase = 'subfactors'
-                        st.session_state.current_question = 0
-                    else:
-                        st.session_state.page = 'result'
-                else:
-                    st.session_state.current_question += 1
-                
-                st.rerun()
+            st.button(button_text, type="primary", use_container_width=True,
+                      on_click=go_next, args=(key,))
+            
+            # 응답 없이 '다음'을 누른 경우
+            notice = state.pop_notice()
+            if notice:
+                st.error(notice)
 
 
+@metrics.timed("jinrotool2.show_result_page")
 def show_result_page():
     """결과 페이지"""
     st.title("🎉 검사 결과")
     
     # 1. 진로결정 수준
     st.markdown("## 1️⃣ 진로결정 수준")
-    decision_score = calculate_decision_level_score(st.session_state.answers['decision_level'])
-    level, color = get_decision_level_result(decision_score)
+    result = compute_result(initialize_session_state().answers)
+    decision_score, level = result.decision_score, result.level
+    subfactor_scores = result.subfactors
     
     col1, col2 = st.columns([1, 1])
     
@@ -495,24 +557,13 @@ def show_result_page():
         st.metric("점수", f"{decision_score}점")
         st.markdown(f"**판정**: {level}")
         
-        if level == "미결정 X 불편안":
-            interpretation = "미래의 진로에 대해 현실적, 구체적인 방향성이 결정되어 있지 않고 진로 방향성의 견고한 정도가 낮습니다."
-        elif level == "결정 X 불편안":
-            interpretation = "또래 평균과 비교하여, 진로의사결정 수준은 평균 수준으로 결정하고 있습니다. 현재도 어느 정도 진로의사결정을 하고 있으나, 아래 능력 향상을 위한 노력이 조금 더 요구됩니다."
-        elif level == "결정 X 편안":
-            interpretation = "미래 진로에 대해 현실적, 구체적인 방향성이 결정되어 있습니다."
-        else:
-            interpretation = "미래 진로에 대해 현실적, 구체적인 방향성이 아직 결정되지 않았음을 의미합니다. 다양한 진로 관련 경험을 통해 자신에게 적절한 진로를 결정해나가는 과정이 필요합니다."
-        
-        st.info(interpretation)
+        st.info(LEVEL_INTERPRETATIONS[level])
     
     # 2. 하위요인 검사
     st.markdown("---")
     st.markdown("## 2️⃣ 의사결정 방해요인 분석")
     
-    subfactor_scores = calculate_subfactor_scores(st.session_state.answers['subfactors'])
-    
-    fig = create_subfactor_chart(subfactor_scores)
+    fig = create_subfactor_chart(dict(subfactor_scores))
     st.plotly_chart(fig, use_container_width=True)
     
     # 하위요인 상세 결과
@@ -523,24 +574,19 @@ def show_result_page():
     with col1:
         st.markdown("#### 📌 정보 및 자기이해")
         for factor in ["자기명확성부족", "진로관련정보부족", "결단성부족"]:
-            score = subfactor_scores[factor]
-            category = categorize_subfactor_score(score)
-            st.metric(factor, f"{score}점", delta=category)
+            st.metric(factor, f"{subfactor_scores[factor]}점", delta=result.categories[factor])
     
     with col2:
         st.markdown("#### ⚡ 갈등 및 동기")
         for factor in ["내적갈등", "외적장애", "결정의필요성부족"]:
-            score = subfactor_scores[factor]
-            category = categorize_subfactor_score(score)
-            st.metric(factor, f"{score}점", delta=category)
+            st.metric(factor, f"{subfactor_scores[factor]}점", delta=result.categories[factor])
     
     # 3. 요인별 해결 방법 및 추천 검사
     st.markdown("---")
     st.markdown("## 3️⃣ 맞춤형 해결 방안")
     
     # 높은 점수(문제가 되는) 요인 찾기
-    problem_factors = [(f, s) for f, s in subfactor_scores.items() if s >= 50]
-    problem_factors.sort(key=lambda x: x[1], reverse=True)
+    problem_factors = result.problem_factors
     
     if problem_factors:
         st.info(f"💡 당신이 주로 겪고 있는 어려움은 **{len(problem_factors)}가지** 영역입니다. 각 영역별 해결 방법을 확인해보세요.")
@@ -670,33 +716,31 @@ def show_result_page():
     
     # 다시하기 버튼
     st.markdown("---")
-    if st.button("🔄 검사 다시하기", use_container_width=True):
-        st.session_state.page = 'intro'
-        st.session_state.test_phase = 'decision_level'
-        st.session_state.answers = {
-            'decision_level': {},
-            'subfactors': {},
-            'decision_type': {}
-        }
-        st.session_state.current_question = 0
-        st.rerun()
+    st.button("🔄 검사 다시하기", use_container_width=True, on_click=restart_test)
 
 
 # ============================================================
 # 메인 실행
 # ============================================================
 
+@metrics.timed("jinrotool2.main")
 def main():
     """메인 함수"""
-    initialize_session_state()
+    state = initialize_session_state()
     
     # 페이지 라우팅
-    if st.session_state.page == 'intro':
+    if state.page == 'intro':
         show_intro_page()
-    elif st.session_state.page == 'test':
+    elif state.page == 'test':
         show_test_page()
-    elif st.session_state.page == 'result':
+    elif state.page == 'result':
         show_result_page()
 
 
-main()
\ No newline at end of file
+def render():
+    """페이지 레지스트리 진입점 (main.py에서 rerun마다 호출)"""
+    main()
+
+
+if __name__ == "__main__":
+    main()
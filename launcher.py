@@ -0,0 +1,487 @@
+"""
+여러 앱 워커 실행기 (한 대의 리눅스 서버에서 모든 코어 사용)
+
+Streamlit 프로세스 하나는 코어 하나만 쓰므로, main.py 워커 N개를 서로 다른 포트로 띄우고
+그 앞에 작은 역방향 프록시를 둡니다. 표준 라이브러리만 사용하며 외부 서비스가 필요 없습니다.
+
+- 고정 라우팅: 첫 응답에 jinroup_worker 쿠키를 심어 같은 브라우저는 항상 같은 워커로 보냄
+  (Streamlit 세션 상태와 /media 파일은 워커 프로세스 메모리에 있으므로 필요함)
+- 새 접속은 열린 세션(웹소켓)이 가장 적은 정상 워커로 보냄
+- 헬스 체크: /_stcore/health를 주기적으로 확인하고, 죽었거나 응답하지 않는 워커는 다시 띄움
+- 상태 페이지: /_jinroup/status (HTML), /_jinroup/status.json
+
+워커마다 계측 파일은 metrics/worker-<번호>/ 에, 로그는 logs/worker-<번호>.log 에 씁니다.
+워커를 띄우기 전에 대학 정보 캐시 파일(univ_cache.py)을 한 번 만들어 두어
+워커들이 동시에 엑셀을 읽지 않도록 합니다.
+
+사용법:
+    python launcher.py                          # CPU 코어 수만큼 워커, 8501 포트
+    python launcher.py --workers 4 --port 80
+    python launcher.py --workers 4 -- --server.maxUploadSize 10   # -- 뒤는 streamlit 옵션
+"""
+
+import argparse
+import asyncio
+import html
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from http.cookies import CookieError, SimpleCookie
+from pathlib import Path
+
+
+BASE_DIR = Path(__file__).resolve().parent
+
+COOKIE_NAME = "jinroup_worker"
+STATUS_PATH = "/_jinroup/status"
+HEALTH_PATH = "/_stcore/health"
+STREAM_PATH = "/_stcore/stream"
+
+HEALTH_INTERVAL = 2.0     # 헬스 체크 간격(초)
+HEALTH_TIMEOUT = 3.0      # 헬스 체크 응답 대기 시간(초)
+UNHEALTHY_LIMIT = 3       # 연속 실패가 이 횟수에 이르면 워커를 다시 띄움
+STARTUP_GRACE = 30.0      # 시작 후 이 시간(초) 동안은 헬스 체크 실패로 재시작하지 않음
+MAX_BACKOFF = 30.0        # 연달아 죽는 워커의 재시작 대기 시간 상한(초)
+MAX_HEAD_BYTES = 64 * 1024
+CHUNK_BYTES = 64 * 1024
+
+
+# ============================================================
+# 워커
+# ============================================================
+def process_rss_kb(pid):
+    """다른 프로세스의 RSS (KB, 읽을 수 없으면 None)"""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+class Worker:
+    """main.py를 실행하는 Streamlit 프로세스 하나"""
+
+    def __init__(self, index, port, streamlit_args=(), log_dir=None):
+        self.index = index
+        self.port = port
+        self.streamlit_args = list(streamlit_args)
+        self.log_dir = log_dir
+        self.process = None
+        self.started_at = 0.0
+        self.healthy = False
+        self.failures = 0
+        self.restarts = 0
+        self.next_start = None  # 재시작 예정 시각 (monotonic)
+        self.last_check = None
+        self.sessions = 0       # 열린 웹소켓 수 (= Streamlit 세션 수, 현재 프로세스 세대만)
+        self.generation = 0     # 재시작을 예약할 때마다 1씩 증가 (이전 프로세스의 연결과 구분)
+        self.connections = 0    # 열린 TCP 연결 수
+        self.requests = 0       # 받은 연결 수 누적
+
+    @property
+    def running(self):
+        return self.process is not None and self.process.poll() is None
+
+    def _command(self):
+        return [
+            sys.executable, "-m", "streamlit", "run", str(BASE_DIR / "main.py"),
+            "--server.port", str(self.port),
+            "--server.address", "127.0.0.1",
+            "--server.headless", "true",
+            "--browser.gatherUsageStats", "false",
+            *self.streamlit_args,
+        ]
+
+    def _env(self):
+        metrics_base = Path(os.environ.get("JINROUP_METRICS_DIR", BASE_DIR / "metrics"))
+        return dict(os.environ, JINROUP_METRICS_DIR=str(metrics_base / f"worker-{self.index}"))
+
+    def start(self):
+        """프로세스 시작 (출력은 로그 파일로)"""
+        output = subprocess.DEVNULL
+        if self.log_dir is not None:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            output = open(self.log_dir / f"worker-{self.index}.log", "ab")
+        try:
+            self.process = subprocess.Popen(
+                self._command(), cwd=BASE_DIR, env=self._env(),
+                stdout=output, stderr=subprocess.STDOUT,
+                start_new_session=True,  # Ctrl+C는 실행기가 받아서 정리함
+            )
+        finally:
+            if output is not subprocess.DEVNULL:
+                output.close()
+        self.started_at = time.monotonic()
+        self.healthy = False
+        self.failures = 0
+        log(f"워커 {self.index} 시작 (포트 {self.port}, PID {self.process.pid})")
+
+    def stop(self, timeout=10.0):
+        """SIGTERM 후 timeout초 안에 끝나지 않으면 SIGKILL"""
+        if not self.running:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.healthy = False
+
+    def schedule_restart(self, reason):
+        """재시작 예약 (프로세스가 멈춘 뒤 호출, 연달아 죽으면 대기 시간을 두 배씩 늘림)"""
+        quick_crash = time.monotonic() - self.started_at < STARTUP_GRACE
+        delay = min(MAX_BACKOFF, 2 ** self.restarts) if quick_crash else 0.0
+        self.restarts += 1
+        self.next_start = time.monotonic() + delay
+        # 아직 닫히지 않은 이전 프로세스의 연결은 session_closed에서 세지 않음
+        self.generation += 1
+        self.sessions = 0
+        log(f"워커 {self.index} 재시작 예정 ({reason}, {delay:.0f}초 후)")
+
+    def session_opened(self):
+        """웹소켓 세션 시작 (session_closed에 넘길 세대 번호 반환)"""
+        self.sessions += 1
+        return self.generation
+
+    def session_closed(self, generation):
+        """웹소켓 세션 종료 (재시작 전에 열린 세션은 이미 0으로 초기화했으므로 무시)"""
+        if generation == self.generation:
+            self.sessions -= 1
+
+    def status(self):
+        pid = self.process.pid if self.process is not None else None
+        rss = process_rss_kb(pid) if self.running else None
+        return {
+            'index': self.index,
+            'port': self.port,
+            'pid': pid,
+            'running': self.running,
+            'healthy': self.healthy,
+            'sessions': self.sessions,
+            'connections': self.connections,
+            'requests': self.requests,
+            'restarts': self.restarts,
+            'uptime_s': round(time.monotonic() - self.started_at, 1) if self.running else None,
+            'rss_mb': round(rss / 1024, 1) if rss else None,
+            'last_check_ago_s': (
+                round(time.monotonic() - self.last_check, 1) if self.last_check else None
+            ),
+        }
+
+
+def log(message):
+    print(f"[{time.strftime('%H:%M:%S')}] {message}", flush=True)
+
+
+# ============================================================
+# 헬스 체크
+# ============================================================
+async def http_status(port, path, timeout=HEALTH_TIMEOUT):
+    """127.0.0.1:port에 GET 요청을 보내고 (상태 코드, 본문) 반환 (실패하면 (None, b''))"""
+    writer = None
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection("127.0.0.1", port), timeout)
+        writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\nConnection: close\r\n\r\n".encode("ascii")
+        )
+        await writer.drain()
+        data = await asyncio.wait_for(reader.read(), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None, b""
+    finally:
+        if writer is not None:
+            writer.close()
+    head, _, body = data.partition(b"\r\n\r\n")
+    try:
+        return int(head.split(b" ", 2)[1]), body
+    except (IndexError, ValueError):
+        return None, body
+
+
+async def check_worker(worker):
+    """워커 하나 점검: 죽었으면 재시작 예약, 연속으로 응답하지 않으면 재시작"""
+    now = time.monotonic()
+    if worker.process is None:
+        worker.start()
+        return
+    if not worker.running:
+        worker.healthy = False
+        if worker.next_start is None:
+            worker.schedule_restart(f"종료 코드 {worker.process.returncode}")
+        if now >= worker.next_start:
+            worker.next_start = None
+            worker.start()
+        return
+
+    code, _ = await http_status(worker.port, HEALTH_PATH)
+    worker.last_check = time.monotonic()
+    if code == 200:
+        if not worker.healthy:
+            log(f"워커 {worker.index} 정상 (포트 {worker.port})")
+        worker.healthy = True
+        worker.failures = 0
+        return
+
+    worker.healthy = False
+    worker.failures += 1
+    started_long_ago = now - worker.started_at > STARTUP_GRACE
+    if worker.failures >= UNHEALTHY_LIMIT and started_long_ago:
+        await asyncio.to_thread(worker.stop)
+        worker.schedule_restart(f"헬스 체크 {worker.failures}회 연속 실패")
+
+
+async def health_loop(workers):
+    while True:
+        await asyncio.gather(*(check_worker(w) for w in workers))
+        await asyncio.sleep(HEALTH_INTERVAL)
+
+
+# ============================================================
+# 프록시
+# ============================================================
+class Request:
+    """요청 첫 줄과 헤더 (본문은 그대로 흘려보냄)"""
+    __slots__ = ('raw', 'method', 'path', 'headers')
+
+    def __init__(self, raw):
+        self.raw = raw
+        lines = raw.decode("latin-1").split("\r\n")
+        self.method, self.path = (lines[0].split(" ") + ["", ""])[:2]
+        self.headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                self.headers[name.strip().lower()] = value.strip()
+
+    @property
+    def is_websocket(self):
+        return self.headers.get("upgrade", "").lower() == "websocket"
+
+    def cookie(self, name):
+        try:
+            morsel = SimpleCookie(self.headers.get("cookie", "")).get(name)
+        except CookieError:
+            return None
+        return morsel.value if morsel is not None else None
+
+
+class Proxy:
+    """요청 헤더만 읽어 워커를 고른 뒤, 이후 바이트는 양방향으로 그대로 전달"""
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.started_at = time.monotonic()
+
+    def choose(self, request):
+        """
+        요청을 보낼 워커 선택
+
+        Returns:
+            tuple: (워커 또는 None, 쿠키를 새로 심어야 하는지)
+        """
+        pinned = request.cookie(COOKIE_NAME)
+        if pinned is not None and pinned.isdigit() and int(pinned) < len(self.workers):
+            worker = self.workers[int(pinned)]
+            if worker.healthy:
+                return worker, False
+        healthy = [w for w in self.workers if w.healthy]
+        if not healthy:
+            return None, False
+        return min(healthy, key=lambda w: (w.sessions, w.connections)), True
+
+    async def handle(self, client_reader, client_writer):
+        try:
+            raw = await client_reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            client_writer.close()
+            return
+        request = Request(raw)
+
+        if request.path.split("?")[0] in (STATUS_PATH, STATUS_PATH + ".json"):
+            await self.respond_status(request, client_writer)
+            return
+
+        worker, set_cookie = self.choose(request)
+        if worker is None:
+            await respond(client_writer, 503, "text/plain; charset=utf-8",
+                          "사용 가능한 워커가 없습니다. 잠시 후 다시 시도해주세요.".encode("utf-8"))
+            return
+
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", worker.port)
+        except OSError:
+            worker.healthy = False
+            await respond(client_writer, 502, "text/plain; charset=utf-8",
+                          "워커에 연결하지 못했습니다.".encode("utf-8"))
+            return
+
+        is_session = request.is_websocket and request.path.startswith(STREAM_PATH)
+        worker.requests += 1
+        worker.connections += 1
+        generation = worker.session_opened() if is_session else None
+        try:
+            upstream_writer.write(raw)
+            await upstream_writer.drain()
+            first = set_cookie_filter(worker.index) if set_cookie else None
+            # 한쪽이 끊기면 다른 쪽도 정리 (워커가 죽으면 브라우저가 바로 다시 접속하도록)
+            tasks = [
+                asyncio.create_task(pipe(client_reader, upstream_writer)),
+                asyncio.create_task(pipe(upstream_reader, client_writer, first)),
+            ]
+            _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+        except ConnectionError:
+            pass
+        finally:
+            worker.connections -= 1
+            if is_session:
+                worker.session_closed(generation)
+            for writer in (upstream_writer, client_writer):
+                writer.close()
+
+    async def respond_status(self, request, writer):
+        report = {
+            'uptime_s': round(time.monotonic() - self.started_at, 1),
+            'sessions': sum(w.sessions for w in self.workers),
+            'healthy_workers': sum(w.healthy for w in self.workers),
+            'workers': [w.status() for w in self.workers],
+        }
+        if request.path.split("?")[0].endswith(".json"):
+            body = json.dumps(report, ensure_ascii=False, indent=2).encode("utf-8")
+            await respond(writer, 200, "application/json; charset=utf-8", body)
+        else:
+            await respond(writer, 200, "text/html; charset=utf-8", status_html(report).encode("utf-8"))
+
+
+def set_cookie_filter(index):
+    """첫 응답 헤더에 워커 고정 쿠키를 끼워 넣는 함수"""
+    cookie = f"Set-Cookie: {COOKIE_NAME}={index}; Path=/; HttpOnly; SameSite=Lax\r\n".encode("ascii")
+
+    def insert(head):
+        return head[:-2] + cookie + b"\r\n"
+    return insert
+
+
+async def pipe(reader, writer, head_filter=None):
+    """reader가 끝날 때까지 writer로 복사 (head_filter가 있으면 응답 헤더를 바꿔서 보냄)"""
+    try:
+        if head_filter is not None:
+            head = await reader.readuntil(b"\r\n\r\n")
+            writer.write(head_filter(head))
+        while True:
+            data = await reader.read(CHUNK_BYTES)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        pass
+
+
+async def respond(writer, code, content_type, body):
+    reason = {200: "OK", 502: "Bad Gateway", 503: "Service Unavailable"}[code]
+    writer.write(
+        f"HTTP/1.1 {code} {reason}\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\nCache-Control: no-store\r\nConnection: close\r\n\r\n"
+        .encode("ascii") + body
+    )
+    try:
+        await writer.drain()
+    except ConnectionError:
+        pass
+    writer.close()
+
+
+def status_html(report):
+    """상태 페이지 HTML (5초마다 새로고침)"""
+    columns = ('index', 'port', 'pid', 'healthy', 'sessions', 'connections',
+               'requests', 'restarts', 'uptime_s', 'rss_mb', 'last_check_ago_s')
+    header = "".join(f"<th>{c}</th>" for c in columns)
+    rows = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(str(w[c] if w[c] is not None else '-'))}</td>" for c in columns) + "</tr>"
+        for w in report['workers']
+    )
+    return (
+        "<!doctype html><meta charset='utf-8'><meta http-equiv='refresh' content='5'>"
+        "<title>진로탐색 플랫폼 워커 상태</title>"
+        "<style>body{font-family:sans-serif;margin:2em}td,th{padding:4px 12px;text-align:right}"
+        "tr:nth-child(even){background:#f4f4f8}</style>"
+        f"<h2>워커 상태</h2><p>세션 {report['sessions']}개 · 정상 워커 "
+        f"{report['healthy_workers']}/{len(report['workers'])} · 가동 {report['uptime_s']:.0f}초</p>"
+        f"<table><tr>{header}</tr>{rows}</table>"
+    )
+
+
+# ============================================================
+# 실행
+# ============================================================
+def prebuild_caches():
+    """워커 시작 전에 데이터 캐시 파일 생성 (실패해도 워커가 직접 만들 수 있으므로 계속 진행)"""
+    result = subprocess.run(
+        [sys.executable, str(BASE_DIR / "univ_cache.py")],
+        cwd=BASE_DIR, capture_output=True, text=True
+    )
+    if result.returncode == 0:
+        log(f"대학 정보 캐시 준비: {result.stdout.strip().splitlines()[0]}")
+    else:
+        log(f"대학 정보 캐시 생성 실패 (워커가 처음 접속 때 생성): {result.stderr.strip()[-200:]}")
+
+
+async def serve(args, streamlit_args):
+    log_dir = None if args.no_logs else args.log_dir
+    workers = [
+        Worker(i, args.base_port + i, streamlit_args, log_dir)
+        for i in range(args.workers)
+    ]
+    proxy = Proxy(workers)
+    server = await asyncio.start_server(proxy.handle, args.host, args.port, limit=MAX_HEAD_BYTES)
+    log(f"프록시 http://{args.host}:{args.port} -> 워커 {args.workers}개 "
+        f"(포트 {args.base_port}~{args.base_port + args.workers - 1}), 상태: {STATUS_PATH}")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    checker = asyncio.create_task(health_loop(workers))
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        checker.cancel()
+        log("종료 중: 워커 정리")
+        await asyncio.gather(*(asyncio.to_thread(w.stop) for w in workers))
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    streamlit_args = []
+    if "--" in argv:
+        cut = argv.index("--")
+        argv, streamlit_args = argv[:cut], argv[cut + 1:]
+
+    parser = argparse.ArgumentParser(description="진로탐색 플랫폼 다중 워커 실행기")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="워커 수 (기본: CPU 코어 수)")
+    parser.add_argument("--host", default="0.0.0.0", help="프록시가 받을 주소")
+    parser.add_argument("--port", type=int, default=8501, help="프록시 포트")
+    parser.add_argument("--base-port", type=int, default=8601, help="첫 워커 포트 (이후 1씩 증가)")
+    parser.add_argument("--log-dir", type=Path, default=BASE_DIR / "logs", help="워커 로그 폴더")
+    parser.add_argument("--no-logs", action="store_true", help="워커 출력 버리기")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers는 1 이상이어야 합니다")
+
+    prebuild_caches()
+    asyncio.run(serve(args, streamlit_args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
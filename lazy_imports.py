@@ -0,0 +1,183 @@
+"""
+무거운 의존성 지연 로드
+plotly, folium, streamlit_folium, pandas 등은 실제로 처음 사용하는 순간에 임포트하고,
+임포트에 걸린 시간과 늘어난 메모리(RSS)를 기록합니다.
+
+사용법:
+    go = lazy_import("plotly.graph_objects")   # 이 시점에는 임포트하지 않음
+    fig = go.Figure()                          # 첫 속성 접근 시 임포트
+
+시작 리포트:
+    python lazy_imports.py    # 의존성별 임포트 시간과 RSS 증가량 출력
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+import types
+
+
+# 모듈 이름 -> {"seconds": 임포트 시간, "rss_kb": RSS 증가량}
+IMPORT_STATS = {}
+
+# 시작 리포트에서 측정할 의존성 (main.py 홈 화면에는 필요 없는 것들)
+HEAVY_DEPENDENCIES = (
+    "pandas",
+    "plotly.graph_objects",
+    "folium",
+    "streamlit_folium",
+    "openpyxl",
+    "pyarrow",
+)
+
+_lock = threading.Lock()
+
+
+# ============================================================
+# 메모리 측정
+# ============================================================
+def current_rss_kb():
+    """현재 프로세스의 RSS (KB)"""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+
+    # /proc이 없는 환경에서는 최대 RSS로 대신함
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+# ============================================================
+# 지연 로드
+# ============================================================
+def _load(name):
+    """모듈을 임포트하고 처음 임포트한 경우 시간과 RSS 증가량을 기록"""
+    if name in sys.modules:
+        # 다른 스레드가 임포트 중인 모듈이면 import_module이 끝날 때까지 기다려 줌
+        return importlib.import_module(name)
+
+    with _lock:
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+        rss_before = current_rss_kb()
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        IMPORT_STATS[name] = {
+            "seconds": time.perf_counter() - start,
+            "rss_kb": current_rss_kb() - rss_before,
+        }
+        return module
+
+
+class LazyModule(types.ModuleType):
+    """첫 속성 접근 시 실제 모듈을 임포트하는 대리 객체"""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _resolve(self):
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = _load(self.__name__)
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+    def __dir__(self):
+        return dir(self._resolve())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name):
+    """
+    지연 로드 모듈 반환 (이미 임포트된 경우 실제 모듈 반환)
+
+    Args:
+        name (str): 모듈 이름 (예: "plotly.graph_objects")
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
+
+def is_loaded(name):
+    """모듈이 이미 임포트되었는지 확인"""
+    return name in sys.modules
+
+
+# ============================================================
+# 시작 리포트
+# ============================================================
+def _measure_in_subprocess(name):
+    """새 프로세스에서 streamlit 이후 모듈 하나의 임포트 비용 측정"""
+    code = (
+        "import sys, json, streamlit, lazy_imports as li;"
+        f"preloaded = {name!r} in sys.modules;"
+        f"li._load({name!r});"
+        f"print(json.dumps(li.IMPORT_STATS.get({name!r}, {{'seconds': 0.0, 'rss_kb': 0}}) | {{'preloaded': preloaded}}))"
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, env=env
+    )
+    if result.returncode != 0:
+        return None
+    import json
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def startup_report(names=HEAVY_DEPENDENCIES):
+    """
+    의존성별 콜드 임포트 비용 측정 (각각 새 프로세스에서 측정)
+
+    Returns:
+        list[dict]: {"name", "seconds", "rss_kb", "preloaded"}
+            설치되지 않은 모듈은 seconds/rss_kb가 None,
+            streamlit 임포트 시 함께 로드되는 모듈은 preloaded=True
+    """
+    rows = []
+    for name in names:
+        stats = _measure_in_subprocess(name)
+        if stats is None:
+            stats = {"seconds": None, "rss_kb": None, "preloaded": False}
+        rows.append(dict(stats, name=name))
+    return rows
+
+
+def print_startup_report():
+    """시작 리포트 출력"""
+    rss_before = current_rss_kb()
+    start = time.perf_counter()
+    import streamlit  # noqa: F401  (홈 화면에 필요한 유일한 무거운 의존성)
+    base_seconds = time.perf_counter() - start
+    base_rss = current_rss_kb() - rss_before
+
+    print(f"{'모듈':<24}{'임포트 시간':>12}{'RSS 증가':>12}")
+    print(f"{'streamlit (기본)':<24}{base_seconds * 1000:>10.0f}ms{base_rss / 1024:>10.1f}MB")
+    for row in startup_report():
+        name = row["name"]
+        if row["seconds"] is None:
+            print(f"{name:<24}{'설치 안 됨':>12}")
+        elif row["preloaded"]:
+            print(f"{name:<24}{'streamlit과 함께 로드됨':>12}")
+        else:
+            print(f"{name:<24}{row['seconds'] * 1000:>10.0f}ms{row['rss_kb'] / 1024:>10.1f}MB")
+
+
+if __name__ == "__main__":
+    print_startup_report()
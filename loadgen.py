@@ -0,0 +1,522 @@
+"""
+동시 접속 부하 생성기 (용량 산정용)
+
+실행 중인 `streamlit run main.py` 서버에 가상 학생 N명을 웹소켓으로 접속시키고,
+진로결정돕기 / 흥미와전공 / 대학 검색을 섞어서 사람처럼 쉬어가며(think time) 진행합니다.
+
+측정 항목:
+    - 처리량 (초당 상호작용 수)
+    - 상호작용 지연 시간 p50/p95/p99 (요청 전송 -> script_finished 수신)
+    - 웹소켓 메시지 크기 (상호작용당 수신 바이트, 최대 단일 메시지)
+      브라우저처럼 받은 메시지를 캐시하고 cached_message_hashes로 알리므로, 서버는 다시 그린
+      같은 요소를 참조(ref_hash)로만 보냄 (실제 브라우저가 받는 바이트와 같음)
+    - 서버 RSS 증가량 (전체 / 세션당), --server-pid 또는 자동 탐색
+      (launcher.py 앞단이면 상태 페이지의 워커 PID 합계, 아니면 --port에서 LISTEN 중인 프로세스,
+       찾지 못하면 측정하지 않음)
+
+사용법:
+    streamlit run main.py --server.headless true &
+    python loadgen.py --sessions 40 --mix career=0.4,riasec=0.4,university=0.2
+    python loadgen.py --sessions 200 --ramp 60 --think-median 4 --output load.json
+
+필요 패키지: websockets (pip install -r requirements-dev.txt)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import launcher
+from bench_flows import percentile
+
+
+UNIVERSITY_QUERIES = ("서울", "한양", "경북", "부산", "교육", "과학", "전남", "한국")
+RESTART_LABEL = "🔄 검사 다시하기"
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+DEFAULT_MESSAGE_AGE = 2  # 서버 설정 global.maxCachedMessageAge의 기본값 (new_session으로 받은 값이 우선)
+
+
+# ============================================================
+# 서버 메모리 측정
+# ============================================================
+def find_server_pids(host, port):
+    """
+    부하를 받는 서버 프로세스 PID 목록 (찾지 못하면 빈 목록)
+
+    launcher.py가 앞단이면 상태 페이지(JSON)의 워커 PID들, 아니면 port에서 LISTEN 중인 프로세스.
+    다른 streamlit 프로세스를 잘못 재지 않도록 포트로 확인되지 않으면 추측하지 않습니다.
+    """
+    if host not in LOCAL_HOSTS:
+        return []
+    pids = _launcher_worker_pids(host, port)
+    if pids:
+        return pids
+    pid = _listening_pid(port)
+    return [pid] if pid is not None else []
+
+
+def _launcher_worker_pids(host, port):
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}{launcher.STATUS_PATH}.json", timeout=2) as response:
+            report = json.load(response)
+    except (OSError, ValueError):
+        return []
+    if not isinstance(report, dict):
+        return []
+    return [w['pid'] for w in report.get('workers', ()) if w.get('running') and w.get('pid')]
+
+
+def _listening_pid(port):
+    """/proc/net/tcp(6)에서 port를 LISTEN 중인 소켓을 가진 프로세스"""
+    sockets = set()
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            lines = Path(table).read_text().splitlines()[1:]
+        except OSError:
+            continue
+        for line in lines:
+            fields = line.split()
+            # local_address는 "주소:포트(16진수)", 상태 0A = LISTEN
+            if fields[3] == "0A" and int(fields[1].rsplit(":", 1)[1], 16) == port:
+                sockets.add(f"socket:[{fields[9]}]")
+    if not sockets:
+        return None
+    for proc in Path("/proc").iterdir():
+        if not proc.name.isdigit():
+            continue
+        try:
+            if any(os.readlink(fd) in sockets for fd in (proc / "fd").iterdir()):
+                return int(proc.name)
+        except OSError:
+            continue
+    return None
+
+
+def total_rss_kb(pids):
+    """여러 프로세스 RSS(KB) 합계 (하나도 읽지 못하면 None)"""
+    values = [rss for rss in map(launcher.process_rss_kb, pids) if rss is not None]
+    return sum(values) if values else None
+
+
+# ============================================================
+# Streamlit 웹소켓 클라이언트
+# ============================================================
+class StreamlitSession:
+    """
+    브라우저 대신 Streamlit 웹소켓 프로토콜(BackMsg/ForwardMsg)을 사용하는 가상 세션
+
+    화면에 그려진 위젯을 delta 경로별로 기억해 두었다가,
+    브라우저처럼 현재 위젯 값 전체와 눌린 버튼의 trigger 값을 함께 보냅니다.
+    """
+
+    WIDGET_TYPES = ("button", "radio", "selectbox", "text_input")
+
+    def __init__(self, url, stats):
+        self.url = url
+        self.stats = stats
+        self.ws = None
+        self.widgets = {}        # delta 경로 -> (위젯 종류, proto, fragment_id)
+        self.values = {}         # 위젯 ID -> WidgetState
+        self._seen_paths = set()
+        self._fragment_ids = set()   # 이번 실행이 조각 실행이면 그 조각 ID들
+        # 브라우저의 메시지 캐시: 해시 -> [ForwardMsg, 마지막으로 쓴 실행 번호]
+        self._message_cache = {}
+        self._message_age = DEFAULT_MESSAGE_AGE
+        self._finished_runs = 0
+
+        from streamlit.proto.Radio_pb2 import Radio
+        # 최신 Streamlit은 radio/selectbox 값을 선택지 문자열로, 이전 버전은 인덱스로 주고받음
+        self.string_options = "raw_value" in Radio.DESCRIPTOR.fields_by_name
+
+    async def connect(self):
+        import websockets
+
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        await self._rerun()
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    # --- 메시지 송수신 ---
+    def _client_state(self, trigger=None, fragment_id=""):
+        from streamlit.proto.ClientState_pb2 import ClientState
+
+        state = ClientState(query_string="", page_script_hash="", fragment_id=fragment_id)
+        present = {proto.id for _, proto, _ in self.widgets.values()}
+        for widget_id, value in self.values.items():
+            if widget_id in present:
+                state.widget_states.widgets.append(value)
+        if trigger is not None:
+            state.widget_states.widgets.append(trigger)
+        state.cached_message_hashes.extend(self._message_cache)
+        return state
+
+    def _resolve(self, fwd):
+        """ref_hash 메시지는 캐시한 원래 메시지로 바꾸고, 캐시 가능한 메시지는 저장 (브라우저와 같은 규칙)"""
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        if fwd.WhichOneof("type") == "ref_hash":
+            entry = self._message_cache.get(fwd.ref_hash)
+            if entry is None:
+                raise LookupError(f"캐시에 없는 메시지 참조: {fwd.ref_hash}")
+            entry[1] = self._finished_runs
+            self.stats.cached_messages += 1
+            resolved = ForwardMsg()
+            resolved.CopyFrom(entry[0])
+            resolved.metadata.CopyFrom(fwd.metadata)
+            return resolved
+        if fwd.metadata.cacheable:
+            self._message_cache[fwd.hash] = [fwd, self._finished_runs]
+        return fwd
+
+    def _expire_messages(self):
+        """실행이 끝날 때마다 오래 쓰지 않은 메시지를 캐시에서 제거"""
+        self._finished_runs += 1
+        self._message_cache = {
+            key: entry for key, entry in self._message_cache.items()
+            if self._finished_runs - entry[1] <= self._message_age
+        }
+
+    async def _rerun(self, trigger=None, fragment_id=""):
+        """rerun 요청을 보내고 script_finished까지 수신 (지연 시간과 수신 바이트 기록)"""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.CopyFrom(self._client_state(trigger, fragment_id))
+
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        received = 0
+        runs = 0
+        run_deltas = 0
+        while True:
+            data = await self.ws.recv()
+            received += len(data)
+            self.stats.max_message_bytes = max(self.stats.max_message_bytes, len(data))
+            fwd = ForwardMsg()
+            fwd.ParseFromString(data)
+            fwd = self._resolve(fwd)
+            kind = fwd.WhichOneof("type")
+            if kind == "new_session":
+                self._message_age = fwd.new_session.config.max_cached_message_age or self._message_age
+                # 스크립트 실행 하나가 시작될 때마다 전송됨 (st.rerun()이면 여러 번)
+                self._seen_paths = set()
+                self._fragment_ids = set(fwd.new_session.fragment_ids_this_run)
+                runs += 1
+                run_deltas = 0
+            elif kind == "delta":
+                run_deltas += 1
+                self._handle_delta(fwd)
+            elif kind == "script_finished":
+                self._expire_messages()
+                status = ForwardMsg.ScriptFinishedStatus.Name(fwd.script_finished)
+                if status == "FINISHED_EARLY_FOR_RERUN":
+                    if run_deltas == 0:
+                        # 콜백이 전체 실행을 요청해 본문을 그리기 전에 중단된 실행은 세지 않음
+                        runs -= 1
+                    continue
+                if status == "FINISHED_SUCCESSFULLY":
+                    # 전체 실행에서 다시 그려지지 않은 위젯은 화면에서 사라진 것
+                    self.widgets = {p: w for p, w in self.widgets.items() if p in self._seen_paths}
+                elif status == "FINISHED_FRAGMENT_RUN_SUCCESSFULLY":
+                    # 조각 실행에서는 그 조각에 속한 위젯만 정리
+                    self.widgets = {
+                        p: w for p, w in self.widgets.items()
+                        if p in self._seen_paths or w[2] not in self._fragment_ids
+                    }
+                break
+        self.stats.record(time.perf_counter() - start, received, runs)
+
+    def _handle_delta(self, fwd):
+        delta = fwd.delta
+        if delta.WhichOneof("type") != "new_element":
+            return
+        path = tuple(fwd.metadata.delta_path)
+        self._seen_paths.add(path)
+        kind = delta.new_element.WhichOneof("type")
+        if kind in self.WIDGET_TYPES:
+            self.widgets[path] = (kind, getattr(delta.new_element, kind), delta.fragment_id)
+        else:
+            self.widgets.pop(path, None)
+
+    # --- 위젯 조작 ---
+    def _find(self, kind, label=None):
+        for widget_kind, proto, fragment_id in self.widgets.values():
+            if widget_kind != kind:
+                continue
+            if label is not None and proto.label != label:
+                continue
+            if kind == "button" and proto.disabled:
+                continue
+            return proto, fragment_id
+        return None, ""
+
+    def has_button(self, label):
+        return self._find("button", label)[0] is not None
+
+    async def click(self, label):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        proto, fragment_id = self._find("button", label)
+        if proto is None:
+            raise LookupError(f"버튼 없음: {label}")
+        await self._rerun(WidgetState(id=proto.id, trigger_value=True), fragment_id)
+
+    async def choose(self, kind, index, label=None):
+        """radio/selectbox의 index번째 선택지 선택"""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        proto, fragment_id = self._find(kind, label)
+        if proto is None or not proto.options:
+            raise LookupError(f"{kind} 없음")
+        index = index % len(proto.options)
+        if self.string_options:
+            value = WidgetState(id=proto.id, string_value=proto.options[index])
+        else:
+            value = WidgetState(id=proto.id, int_value=index)
+        self.values[proto.id] = value
+        await self._rerun(fragment_id=fragment_id)
+
+    async def type_text(self, text):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        proto, fragment_id = self._find("text_input")
+        if proto is None:
+            raise LookupError("text_input 없음")
+        self.values[proto.id] = WidgetState(id=proto.id, string_value=text)
+        await self._rerun(fragment_id=fragment_id)
+
+    def option_count(self, kind):
+        proto, _ = self._find(kind)
+        return len(proto.options) if proto is not None else 0
+
+
+# ============================================================
+# 통계
+# ============================================================
+class LoadStats:
+    """전체 세션이 공유하는 측정값"""
+
+    def __init__(self):
+        self.latencies = []
+        self.bytes_per_interaction = []
+        self.runs_per_interaction = []
+        self.max_message_bytes = 0
+        self.cached_messages = 0   # 캐시 참조(ref_hash)로 받은 메시지 수
+        self.errors = 0
+        self.completed_flows = {}
+
+    def record(self, seconds, received, runs):
+        self.latencies.append(seconds)
+        self.bytes_per_interaction.append(received)
+        self.runs_per_interaction.append(runs)
+
+    def summary(self, elapsed):
+        lat = self.latencies
+        return {
+            'interactions': len(lat),
+            'throughput_per_s': round(len(lat) / elapsed, 2) if elapsed else 0.0,
+            'p50_ms': round(percentile(lat, 50) * 1000, 1),
+            'p95_ms': round(percentile(lat, 95) * 1000, 1),
+            'p99_ms': round(percentile(lat, 99) * 1000, 1),
+            'max_ms': round(max(lat, default=0.0) * 1000, 1),
+            'mean_script_runs_per_interaction': round(statistics.fmean(self.runs_per_interaction), 2) if lat else 0,
+            'mean_bytes_per_interaction': round(statistics.fmean(self.bytes_per_interaction)) if lat else 0,
+            'max_message_bytes': self.max_message_bytes,
+            'cached_messages': self.cached_messages,
+            'errors': self.errors,
+            'completed_flows': self.completed_flows,
+        }
+
+
+# ============================================================
+# 시나리오
+# ============================================================
+class ThinkTime:
+    """로그정규분포 생각 시간 (중앙값 median초)"""
+
+    def __init__(self, median, sigma, scale):
+        self.median = median
+        self.sigma = sigma
+        self.scale = scale
+
+    async def pause(self, rng):
+        if self.median <= 0:
+            return
+        await asyncio.sleep(rng.lognormvariate(0, self.sigma) * self.median * self.scale)
+
+
+async def _answer_items(session, rng, think, values):
+    """문항 응답 반복 (응답 선택 -> 다음)"""
+    count = 0
+    while session.has_button("다음 ➡️") or session.has_button("결과 보기 ✅"):
+        await think.pause(rng)
+        await session.choose("radio", rng.randrange(values))
+        label = "다음 ➡️" if session.has_button("다음 ➡️") else "결과 보기 ✅"
+        await session.click(label)
+        count += 1
+    return count
+
+
+async def _take_test(session, rng, think, menu, values):
+    """
+    검사 한 번: 메뉴 -> 시작 -> 응답 -> 결과 -> 다시하기
+    같은 세션이 같은 검사를 다시 고르면 결과 페이지가 남아 있으므로 (--duration)
+    시작 버튼이 없으면 먼저 다시하기를 누르고, 끝날 때도 다시하기로 소개 페이지로 돌려 둠
+    """
+    await session.click(menu)
+    await think.pause(rng)
+    if session.has_button(RESTART_LABEL):
+        await session.click(RESTART_LABEL)
+    await session.click("검사 시작하기 🚀")
+    await _answer_items(session, rng, think, values)
+    await think.pause(rng)
+    await session.click(RESTART_LABEL)
+
+
+async def career_scenario(session, rng, think):
+    await _take_test(session, rng, think, "🎯 진로결정돕기", 4)
+
+
+async def riasec_scenario(session, rng, think):
+    await _take_test(session, rng, think, "🎨 흥미와전공", 5)
+
+
+async def university_scenario(session, rng, think):
+    await session.click("📚 대학입시정보")
+    for query in rng.sample(UNIVERSITY_QUERIES, 3):
+        await think.pause(rng)
+        await session.type_text(query)
+        options = session.option_count("selectbox")
+        if options:
+            await think.pause(rng)
+            await session.choose("selectbox", rng.randrange(options))
+
+
+SCENARIOS = {
+    'career': career_scenario,
+    'riasec': riasec_scenario,
+    'university': university_scenario,
+}
+
+
+def parse_mix(text):
+    """'career=0.4,riasec=0.4,university=0.2' -> {이름: 가중치}"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 시나리오: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+async def run_user(index, url, mix, think, stats, duration, deadline, seed):
+    """가상 학생 한 명: 시간이 다 될 때까지 시나리오를 골라 반복"""
+    rng = random.Random(seed + index)
+    names = list(mix)
+    weights = [mix[n] for n in names]
+    session = StreamlitSession(url, stats)
+    try:
+        await session.connect()
+        while time.monotonic() < deadline:
+            name = rng.choices(names, weights)[0]
+            await SCENARIOS[name](session, rng, think)
+            stats.completed_flows[name] = stats.completed_flows.get(name, 0) + 1
+            if duration is None:
+                break
+    except Exception as e:  # 한 세션의 실패가 전체 측정을 멈추지 않도록
+        stats.errors += 1
+        print(f"[세션 {index}] 오류: {e!r}", file=sys.stderr)
+    finally:
+        await session.close()
+
+
+async def run_load(args):
+    stats = LoadStats()
+    think = ThinkTime(args.think_median, args.think_sigma, args.think_scale)
+    url = f"ws://{args.host}:{args.port}/_stcore/stream"
+
+    pids = [args.server_pid] if args.server_pid else find_server_pids(args.host, args.port)
+    if not pids:
+        print(f"{args.host}:{args.port} 서버 프로세스를 찾지 못해 RSS를 측정하지 않습니다 (--server-pid로 지정)",
+              file=sys.stderr)
+    rss_start = total_rss_kb(pids)
+    rss_peak = rss_start
+
+    start = time.monotonic()
+    deadline = start + args.duration if args.duration else float("inf")
+
+    tasks = []
+    for i in range(args.sessions):
+        tasks.append(asyncio.create_task(
+            run_user(i, url, args.mix, think, stats, args.duration, deadline, args.seed)
+        ))
+        if args.ramp:
+            await asyncio.sleep(args.ramp / args.sessions)
+
+    while not all(t.done() for t in tasks):
+        await asyncio.sleep(1.0)
+        rss = total_rss_kb(pids)
+        if rss is not None:
+            rss_peak = max(rss_peak or 0, rss)
+
+    elapsed = time.monotonic() - start
+    report = stats.summary(elapsed)
+    report.update({
+        'sessions': args.sessions,
+        'elapsed_s': round(elapsed, 1),
+        'mix': args.mix,
+        'server_pids': pids,
+        'server_rss_start_mb': round(rss_start / 1024, 1) if rss_start else None,
+        'server_rss_peak_mb': round(rss_peak / 1024, 1) if rss_peak else None,
+        'server_rss_per_session_kb': (
+            round((rss_peak - rss_start) / args.sessions) if rss_start and rss_peak else None
+        ),
+    })
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="진로탐색 플랫폼 동시 접속 부하 생성기")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8501)
+    parser.add_argument("--sessions", type=int, default=10, help="동시 세션 수")
+    parser.add_argument("--ramp", type=float, default=10.0, help="모든 세션이 접속할 때까지 걸리는 시간(초)")
+    parser.add_argument("--duration", type=float, help="측정 시간(초). 지정하지 않으면 세션당 시나리오 1회")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("career=0.4,riasec=0.4,university=0.2"),
+                        help="시나리오 비율 (예: career=0.4,riasec=0.4,university=0.2)")
+    parser.add_argument("--think-median", type=float, default=3.0, help="생각 시간 중앙값(초)")
+    parser.add_argument("--think-sigma", type=float, default=0.6, help="생각 시간 로그정규 분포의 sigma")
+    parser.add_argument("--think-scale", type=float, default=1.0, help="생각 시간 배율 (0.1이면 10배 빠르게)")
+    parser.add_argument("--server-pid", type=int,
+                        help="RSS를 측정할 서버 PID (기본: launcher 워커 또는 --port에서 LISTEN 중인 프로세스)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        parser.error("websockets 패키지가 필요합니다: pip install -r requirements-dev.txt")
+
+    report = asyncio.run(run_load(args))
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    print(text)
+    return 1 if report['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
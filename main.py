@@ -4,9 +4,10 @@
 """
 
 import streamlit as st
-import importlib.util
-import sys
-from pathlib import Path
+
+import metrics
+import navigation
+import page_registry
 
 
 # ============================================================
@@ -96,35 +97,28 @@ st.markdown("""
 # 세션 스테이트 초기화
 # ============================================================
 def initialize_session_state():
-    """세션 스테이트 초기화"""
-    if 'current_page' not in st.session_state:
-        st.session_state.current_page = 'home'
+    """세션 스테이트 초기화 (?page=riasec 처럼 주소로 시작 페이지 지정 가능)"""
+    navigation.initialize()
 
 
 # ============================================================
-# 외부 Python 파일 실행 함수
+# 페이지 모듈 실행 함수
 # ============================================================
-def load_and_run_module(file_path, module_name):
+def load_and_run_module(page_id):
     """
-    외부 Python 파일을 동적으로 로드하고 실행
+    페이지 레지스트리에서 모듈을 가져와 render() 실행
+    (모듈은 프로세스당 한 번만 임포트되고, rerun마다 다시 컴파일하지 않습니다)
     
     Args:
-        file_path (str): 실행할 Python 파일 경로
-        module_name (str): 모듈 이름
+        page_id (str): page_registry.PAGES에 등록된 페이지 ID
     """
     try:
-        # 파일 존재 확인
-        if not Path(file_path).exists():
-            st.error(f"⚠️ 파일을 찾을 수 없습니다: {file_path}")
-            st.info("파일이 같은 폴더에 있는지 확인해주세요.")
-            return
-        
-        # 모듈 로드
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[module_name] = module
-        spec.loader.exec_module(module)
-        
+        page_registry.render_page(page_id)
+    
+    except FileNotFoundError as e:
+        st.error(f"⚠️ 파일을 찾을 수 없습니다: {e}")
+        st.info("파일이 같은 폴더에 있는지 확인해주세요.")
+    
     except Exception as e:
         st.error(f"⚠️ 페이지 로드 중 오류가 발생했습니다: {str(e)}")
         st.info("파일 경로와 코드를 확인해주세요.")
@@ -138,24 +132,16 @@ def show_menu():
     col1, col2, col3, col4, col5 = st.columns([1, 2, 2, 2, 2])
     
     with col1:
-        if st.button("🏠 홈", use_container_width=True, type="primary" if st.session_state.current_page == 'home' else "secondary"):
-            st.session_state.current_page = 'home'
-            st.rerun()
+        navigation.nav_button("🏠 홈", 'home', use_container_width=True)
     
     with col2:
-        if st.button("🎯 진로결정돕기", use_container_width=True, type="primary" if st.session_state.current_page == 'career_decision' else "secondary"):
-            st.session_state.current_page = 'career_decision'
-            st.rerun()
+        navigation.nav_button("🎯 진로결정돕기", 'career_decision', use_container_width=True)
     
     with col3:
-        if st.button("🎨 흥미와전공", use_container_width=True, type="primary" if st.session_state.current_page == 'riasec' else "secondary"):
-            st.session_state.current_page = 'riasec'
-            st.rerun()
+        navigation.nav_button("🎨 흥미와전공", 'riasec', use_container_width=True)
     
     with col4:
-        if st.button("📚 대학입시정보", use_container_width=True, type="primary" if st.session_state.current_page == 'university' else "secondary"):
-            st.session_state.current_page = 'university'
-            st.rerun()
+        navigation.nav_button("📚 대학입시정보", 'university', use_container_width=True)
     
     with col5:
         st.write("")
@@ -192,9 +178,7 @@ def show_home_page():
         </div>
         """, unsafe_allow_html=True)
         
-        if st.button("시작하기", key="btn1", use_container_width=True, type="primary"):
-            st.session_state.current_page = 'career_decision'
-            st.rerun()
+        navigation.nav_button("시작하기", 'career_decision', key="btn1", use_container_width=True, type="primary")
     
     with col2:
         st.markdown("""
@@ -209,9 +193,7 @@ def show_home_page():
         </div>
         """, unsafe_allow_html=True)
         
-        if st.button("시작하기", key="btn2", use_container_width=True, type="primary"):
-            st.session_state.current_page = 'riasec'
-            st.rerun()
+        navigation.nav_button("시작하기", 'riasec', key="btn2", use_container_width=True, type="primary")
     
     with col3:
         st.markdown("""
@@ -226,9 +208,7 @@ def show_home_page():
         </div>
         """, unsafe_allow_html=True)
         
-        if st.button("시작하기", key="btn3", use_container_width=True, type="primary"):
-            st.session_state.current_page = 'university'
-            st.rerun()
+        navigation.nav_button("시작하기", 'university', key="btn3", use_container_width=True, type="primary")
     
     # 추가 정보
     st.markdown("---")
@@ -272,7 +252,17 @@ def show_home_page():
 # ============================================================
 def main():
     """메인 함수"""
+    metrics.begin_run()
+    try:
+        route()
+    finally:
+        metrics.end_run(st.session_state.get('current_page'))
+
+
+def route():
+    """상단 메뉴 표시 및 페이지 라우팅"""
     initialize_session_state()
+    metrics.show_debug_sidebar()
     
     # 상단 메뉴
     show_menu()
@@ -286,21 +276,21 @@ def main():
         st.markdown("---")
         
         # jinrotool2.py 실행
-        load_and_run_module("jinrotool2.py", "jinrotool2")
+        load_and_run_module('career_decision')
     
     elif st.session_state.current_page == 'riasec':
         st.title("🎨 흥미와전공")
         st.markdown("---")
         
         # REASEC3.py 실행
-        load_and_run_module("REASEC3.py", "riasec3")
+        load_and_run_module('riasec')
     
     elif st.session_state.current_page == 'university':
         st.title("📚 대학입시정보")
         st.markdown("---")
         
         # 3.py 실행
-        load_and_run_module("3.py", "university_info")
+        load_and_run_module('university')
 
 
 if __name__ == "__main__":
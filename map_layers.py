@@ -0,0 +1,486 @@
+"""
+지도 레이어 캐시
+st_folium은 호출될 때마다 folium.Map 전체를 렌더링하고 leaflet 스크립트로 변환합니다
+(대학 400곳 기준 약 1.4초). 전체 마커가 들어간 기본 지도는 데이터 버전마다 한 번만 변환해
+모든 세션이 공유하고, rerun마다 바뀌는 것(선택한 학교 강조, 중심, 확대 수준)만
+작은 동적 레이어로 보냅니다.
+
+- 기본 지도 스크립트가 rerun 사이에 그대로이므로 Streamlit 메시지 캐시가 같은 지도를 다시 보내지 않고,
+  지도 컴포넌트도 다시 마운트되지 않음 (중심/확대/선택 레이어만 브라우저에서 바뀜)
+- streamlit_folium 내부 함수를 쓰는 빠른 경로는 확인한 버전(FAST_PATH_VERSIONS)에서만 사용하고,
+  다른 버전이면 공개 API인 st_folium()으로 돌아감 (결과는 같고 느림, 그 버전에 없는 인자는 넘기지 않음)
+
+기본 지도는 점 개수와 처음 확대 수준에 따라 세 가지 방식 중 하나로 그립니다 (choose_mode).
+- markers: 학교마다 folium.Marker (아이콘/팝업 DOM이 점마다 생김, JINROUP_MARKER_LIMIT곳 이하일 때만)
+- circles: GeoJSON 레이어 하나 + 공통 스타일의 CircleMarker (canvas에 그림, 기본)
+- cluster: FastMarkerCluster (확대하면 CLUSTER_OFF_ZOOM부터 개별 점으로 풀림)
+- viewport: 기본 지도에는 점을 넣지 않고, rerun마다 지도에 보이는 범위(+여유)의 점만 격자 색인으로
+  골라 동적 레이어로 보냄 (점이 너무 많으면 격자 칸별 개수로 묶어 표시)
+점 개수별 서버/브라우저 비용은 bench_map_lod.py로 측정합니다.
+배경 타일은 JINROUP_TILES 등을 설정하면 로컬 타일 서버에서 받습니다 (tile_server.py).
+기본 주소(localhost)의 로컬 타일은 다른 컴퓨터의 브라우저에서 열리지 않으므로 그런 세션은 기본 지도를 따로 캐시합니다.
+"""
+
+import functools
+import importlib.metadata
+import inspect
+import ipaddress
+import json
+import math
+import os
+import threading
+
+import streamlit as st
+
+import tile_server
+from lazy_imports import lazy_import
+
+folium = lazy_import("folium")
+streamlit_folium = lazy_import("streamlit_folium")
+
+
+# 빠른 경로에서 사용하는 streamlit_folium 내부 함수 (인자가 버전마다 바뀌므로 확인한 버전 범위에서만 사용)
+_PRIVATE_API = (
+    "_component_func", "_get_html", "_get_header", "_get_map_string",
+    "_get_feature_group_string", "get_full_id", "generate_js_hash",
+)
+FAST_PATH_VERSIONS = ((0, 27), (0, 28))  # [이상, 미만)
+
+_fallback_lock = threading.Lock()
+
+# 브라우저에서 돌려받을 항목 (returned_objects)
+# 값이 바뀔 때만 브라우저가 보내므로, 여기 없는 항목(중심, 확대 수준 등)이 바뀌는 지도 이동은 rerun을 만들지 않음
+CLICK_OBJECTS = ("last_object_clicked_tooltip", "last_object_clicked_count")  # 클릭한 점의 툴팁(학교명), 클릭 횟수
+VIEW_OBJECTS = ("bounds",)  # 보이는 범위 (viewport 모드에서만 필요)
+
+
+def _installed_version(package):
+    """설치된 패키지의 (major, minor) (알 수 없으면 None)"""
+    try:
+        return tuple(int(part) for part in importlib.metadata.version(package).split(".")[:2])
+    except (importlib.metadata.PackageNotFoundError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _fast_path_available():
+    version = _installed_version("streamlit-folium")
+    low, high = FAST_PATH_VERSIONS
+    if version is None or not low <= version < high:
+        return False
+    return all(hasattr(streamlit_folium, name) for name in _PRIVATE_API)
+
+
+# ============================================================
+# 기본 지도 (데이터 버전마다 한 번)
+# ============================================================
+class BaseMap:
+    """렌더링이 끝난 기본 지도 (읽기 전용으로 공유)"""
+    __slots__ = ('fig', 'mode', 'script', 'header', 'html', 'map_id', 'css_links', 'js_links',
+                 'defaults', '_hash_keys')
+
+    def __init__(self, fig, mode=None):
+        self.fig = fig
+        self.mode = mode
+        self.script = None
+        self._hash_keys = {}
+        if _fast_path_available():
+            self._render()
+
+    def _render(self):
+        """st_folium()이 매번 하는 렌더링을 한 번만 수행"""
+        sf = streamlit_folium
+        fig = self.fig
+        fig.get_root().render()
+        fig.render()
+        self.html = sf._get_html(fig)
+        self.header = sf._get_header(fig)
+        self.script = sf._get_map_string(fig)
+        self.map_id = sf.get_full_id(fig)
+
+        css_links, js_links = [], []
+        for element in _walk(fig):
+            css_links.extend(href for _, href in getattr(element, "default_css", []))
+            js_links.extend(src for _, src in getattr(element, "default_js", []))
+        self.css_links = list(dict.fromkeys(css_links))
+        self.js_links = list(dict.fromkeys(js_links))
+
+        southwest, northeast = fig.get_bounds()
+        # st_folium()이 처음(브라우저 응답 전)에 돌려주는 값과 같게 맞춤
+        self.defaults = {
+            "last_clicked": None,
+            "last_object_clicked": None,
+            "last_object_clicked_count": None,
+            "last_object_clicked_tooltip": None,
+            "last_object_clicked_popup": None,
+            "all_drawings": None,
+            "last_active_drawing": None,
+            "bounds": {
+                "_southWest": {"lat": southwest[0], "lng": southwest[1]},
+                "_northEast": {"lat": northeast[0], "lng": northeast[1]},
+            },
+            "zoom": fig.options.get("zoom"),
+            "last_circle_radius": None,
+            "last_circle_polygon": None,
+            "selected_layers": None,
+            "selected_tags": None,
+            "last_geocoder_result": None,
+        }
+
+    def hash_key(self, key):
+        """컴포넌트 키 (스크립트가 같으면 같은 값 -> 다시 마운트되지 않음)"""
+        if key not in self._hash_keys:
+            self._hash_keys[key] = streamlit_folium.generate_js_hash(self.script, key, False)
+        return self._hash_keys[key]
+
+
+def _walk(element):
+    """CSS/JS 링크를 가진 하위 요소 순회"""
+    if isinstance(element, folium.elements.JSCSSMixin):
+        yield element
+    for child in getattr(element, "_children", {}).values():
+        yield from _walk(child)
+
+
+# ============================================================
+# 표시 방식 (level of detail)
+# ============================================================
+MARKERS = 'markers'
+CIRCLES = 'circles'
+CLUSTER = 'cluster'
+VIEWPORT = 'viewport'
+MODES = (MARKERS, CIRCLES, CLUSTER, VIEWPORT)
+
+# 이하이면 개별 마커 (기본 0 = 사용하지 않음)
+# 400곳에서 markers는 렌더링 3.4초/468KB, circles는 0.12초/178KB이고 100곳에서도 1.3초 대 0.05초라
+# 점 개수와 관계없이 circles가 빠름 (bench_map_lod.py). 마커 아이콘이 꼭 필요할 때만 설정
+MARKER_LIMIT = int(os.environ.get("JINROUP_MARKER_LIMIT", "0"))
+CIRCLE_LIMIT = 10000    # 이하이면 GeoJSON 점 레이어, 초과하면 클러스터
+VIEWPORT_LIMIT = 20000  # 초과하면 보이는 범위만 rerun마다 그림
+DETAIL_ZOOM = 12        # 이 확대 수준 이상으로 시작하면 보이는 범위가 좁으므로 클러스터 대신 점 레이어
+CLUSTER_OFF_ZOOM = 15   # 클러스터 모드에서 이 확대 수준부터 개별 점으로 표시
+VIEWPORT_MAX_POINTS = 1500  # 보이는 범위의 점이 이보다 많으면 격자 칸별 개수로 묶음
+VIEWPORT_MARGIN = 0.25      # 보이는 범위 바깥으로 더 그릴 비율 (조금 움직여도 다시 그리지 않도록)
+VIEWPORT_GROUPS = 12        # 묶어서 표시할 때 보이는 범위의 가로/세로 묶음 수
+
+POINT_STYLE = {'radius': 5, 'color': '#1b7837', 'weight': 1, 'fill': True,
+               'fill_color': '#5aae61', 'fill_opacity': 0.85}
+
+# FastMarkerCluster가 행마다 호출하는 함수: [위도, 경도, 대학명, 팝업 HTML] -> 점
+_CLUSTER_CALLBACK = """\
+function (row) {
+    var point = L.circleMarker(new L.LatLng(row[0], row[1]), %s);
+    point.bindTooltip(row[2]);
+    point.bindPopup(row[3], {maxWidth: 300});
+    return point;
+}"""
+
+
+def choose_mode(count, zoom):
+    """
+    점 개수와 처음 확대 수준으로 표시 방식 선택
+
+    Args:
+        count (int): 지도에 그릴 점 개수
+        zoom (int): 처음 확대 수준
+    """
+    if count <= MARKER_LIMIT:
+        return MARKERS
+    if count > VIEWPORT_LIMIT:
+        return VIEWPORT
+    if count <= CIRCLE_LIMIT or zoom >= DETAIL_ZOOM:
+        return CIRCLES
+    return CLUSTER
+
+
+def has_location(school):
+    """위도/경도가 모두 있는지 (NaN은 자기 자신과 같지 않음)"""
+    return school.lat == school.lat and school.lon == school.lon
+
+
+def _located(store):
+    """좌표가 있는 학교만 (folium.Marker/GeoJSON/클러스터 데이터에 NaN이 들어가지 않도록)"""
+    return [s for s in store.records if has_location(s)]
+
+
+def build_marker_map(store, center, zoom, remote=False):
+    """모든 대학을 초록 별 마커로 표시한 folium 지도 (팝업 HTML은 저장소에 미리 계산됨)"""
+    m = folium.Map(location=center, zoom_start=zoom, **tile_server.map_tiles(remote))
+    for school in _located(store):
+        folium.Marker(
+            [school.lat, school.lon],
+            tooltip=school.name,
+            popup=folium.Popup(school.popup_html, max_width=300),
+            icon=folium.Icon(color='green', icon='star')
+        ).add_to(m)
+    return m
+
+
+def _circle_layer(schools):
+    """학교 목록을 GeoJSON 레이어 하나로 (스타일/툴팁/팝업 함수를 모든 점이 공유)"""
+    features = [
+        {
+            'type': 'Feature',
+            'geometry': {'type': 'Point', 'coordinates': [school.lon, school.lat]},
+            'properties': {'name': school.name, 'popup': school.popup_html},
+        }
+        for school in schools
+    ]
+    return folium.GeoJson(
+        {'type': 'FeatureCollection', 'features': features},
+        name="universities",
+        marker=folium.CircleMarker(**POINT_STYLE),
+        tooltip=folium.GeoJsonTooltip(fields=['name'], labels=False),
+        popup=folium.GeoJsonPopup(fields=['popup'], labels=False, max_width=300),
+    )
+
+
+def build_circle_map(store, center, zoom, remote=False):
+    """모든 대학을 GeoJSON 점 레이어 하나로 표시"""
+    m = folium.Map(location=center, zoom_start=zoom, prefer_canvas=True, **tile_server.map_tiles(remote))
+    _circle_layer(_located(store)).add_to(m)
+    return m
+
+
+def build_cluster_map(store, center, zoom, remote=False):
+    """모든 대학을 FastMarkerCluster로 표시 (점 데이터는 배열 하나, 마커는 브라우저에서 생성)"""
+    from folium.plugins import FastMarkerCluster
+
+    m = folium.Map(location=center, zoom_start=zoom, prefer_canvas=True, **tile_server.map_tiles(remote))
+    style = {'radius': POINT_STYLE['radius'], 'color': POINT_STYLE['color'],
+             'weight': POINT_STYLE['weight'], 'fillColor': POINT_STYLE['fill_color'],
+             'fillOpacity': POINT_STYLE['fill_opacity']}
+    data = [[school.lat, school.lon, school.name, school.popup_html] for school in _located(store)]
+    FastMarkerCluster(
+        data,
+        callback=_CLUSTER_CALLBACK % json.dumps(style),
+        options={'disableClusteringAtZoom': CLUSTER_OFF_ZOOM, 'chunkedLoading': True},
+        name="universities",
+    ).add_to(m)
+    return m
+
+
+def build_viewport_map(store, center, zoom, remote=False):
+    """점 없는 기본 지도 (점은 viewport_layer가 rerun마다 보이는 범위만 그림)"""
+    return folium.Map(location=center, zoom_start=zoom, prefer_canvas=True, **tile_server.map_tiles(remote))
+
+
+BUILDERS = {
+    MARKERS: build_marker_map,
+    CIRCLES: build_circle_map,
+    CLUSTER: build_cluster_map,
+    VIEWPORT: build_viewport_map,
+}
+
+
+def remote_client():
+    """
+    현재 세션의 브라우저가 다른 컴퓨터인지
+    (localhost로 접속하면 st.context.ip_address가 None, 세션 밖이어도 None)
+    """
+    address = st.context.ip_address
+    if address is None:
+        return False
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return True
+    ip = getattr(ip, "ipv4_mapped", None) or ip  # ::ffff:127.0.0.1
+    return not ip.is_loopback
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def base_map(version, center, zoom, _store, mode=None, remote=False):
+    """
+    데이터 버전별 기본 지도
+
+    Args:
+        version (str): 데이터 버전 (엑셀 내용 해시) - 캐시 키
+        center (tuple): 처음 중심 좌표
+        zoom (int): 처음 확대 수준
+        _store (UniversityStore): 대학 정보 (캐시 키에서 제외)
+        mode (str): 표시 방식 (None이면 choose_mode로 선택)
+        remote (bool): 다른 컴퓨터에서 접속한 세션용인지 (remote_client, 배경 타일 주소가 다를 수 있음)
+    """
+    mode = mode or choose_mode(len(_store), zoom)
+    return BaseMap(BUILDERS[mode](_store, center, zoom, remote), mode=mode)
+
+
+# ============================================================
+# 동적 레이어 (rerun마다)
+# ============================================================
+def selection_layer(school):
+    """선택한 학교를 빨간 별로 덮어 그리는 레이어 (선택이 없거나 좌표가 없으면 None)"""
+    if school is None or not has_location(school):
+        return None
+    group = folium.FeatureGroup(name="selection")
+    folium.Marker(
+        [school.lat, school.lon],
+        tooltip=school.name,
+        popup=folium.Popup(school.popup_html, max_width=300),
+        icon=folium.Icon(color='red', icon='star')
+    ).add_to(group)
+    return group
+
+
+# ============================================================
+# 보이는 범위 (viewport 모드)
+# ============================================================
+def view_bounds(center, zoom, width, height):
+    """
+    중심/확대 수준/지도 크기(px)로 계산한 보이는 범위 (브라우저가 범위를 알려 주기 전에 사용)
+
+    Returns:
+        tuple: (south, west, north, east)
+    """
+    world_px = 256 * 2 ** zoom  # 웹 메르카토르: 확대 수준 z에서 세계 전체 폭
+    half_lon = width / world_px * 180
+    y = math.log(math.tan(math.pi / 4 + math.radians(center[0]) / 2))
+    half_y = height / world_px * math.pi
+
+    def to_lat(value):
+        return math.degrees(2 * math.atan(math.exp(value)) - math.pi / 2)
+
+    return to_lat(y - half_y), center[1] - half_lon, to_lat(y + half_y), center[1] + half_lon
+
+
+def returned_bounds(map_state):
+    """st_folium 반환값의 bounds -> (south, west, north, east) (아직 없으면 None)"""
+    bounds = (map_state or {}).get("bounds") or {}
+    try:
+        southwest, northeast = bounds["_southWest"], bounds["_northEast"]
+        return southwest["lat"], southwest["lng"], northeast["lat"], northeast["lng"]
+    except (KeyError, TypeError):
+        return None
+
+
+def padded_bounds(bounds, cell_deg, margin=VIEWPORT_MARGIN):
+    """
+    보이는 범위를 margin 비율만큼 넓히고 격자 칸 경계에 맞춰 바깥으로 반올림
+    (조금 움직인 범위는 같은 값이 되어 같은 레이어를 그림)
+    """
+    south, west, north, east = bounds
+    pad_lat = (north - south) * margin
+    pad_lon = (east - west) * margin
+    return (
+        math.floor((south - pad_lat) / cell_deg) * cell_deg,
+        math.floor((west - pad_lon) / cell_deg) * cell_deg,
+        math.ceil((north + pad_lat) / cell_deg) * cell_deg,
+        math.ceil((east + pad_lon) / cell_deg) * cell_deg,
+    )
+
+
+def viewport_layer(store, bounds, rows=None):
+    """
+    보이는 범위(+여유)의 학교만 그리는 레이어
+    점이 VIEWPORT_MAX_POINTS보다 많으면 격자 칸 묶음마다 원 하나(개수 표시)로 표시
+
+    Args:
+        rows (ndarray): 조건 필터에 맞는 행 번호 (None이면 전체)
+            VIEWPORT_MAX_POINTS 이하이면 보이는 범위와 관계없이 모두 그림 (지도를 움직여도 그대로)
+    """
+    group = folium.FeatureGroup(name="viewport")
+    if rows is not None and len(rows) <= VIEWPORT_MAX_POINTS:
+        _circle_layer([store.records[i] for i in rows if has_location(store.records[i])]).add_to(group)
+        return group
+
+    box = padded_bounds(bounds, store.spatial.cell_deg)
+    ids = store.spatial.in_bounds(*box, rows=rows)
+    if len(ids) <= VIEWPORT_MAX_POINTS:
+        _circle_layer([store.records[i] for i in ids]).add_to(group)
+        return group
+
+    cell_deg = store.spatial.cell_deg
+    span = max(box[2] - box[0], box[3] - box[1])
+    factor = max(1, math.ceil(span / (cell_deg * VIEWPORT_GROUPS)))
+    lats, lons, counts = store.spatial.cell_counts(*box, factor=factor, rows=rows)
+    for lat, lon, count in zip(lats.tolist(), lons.tolist(), counts.tolist()):
+        folium.CircleMarker(
+            [lat, lon],
+            radius=min(6 + math.sqrt(count), 30),
+            tooltip=f"{count}곳 (확대하면 학교별로 표시)",
+            **{k: v for k, v in POINT_STYLE.items() if k != 'radius'},
+        ).add_to(group)
+    return group
+
+
+def _feature_group_script(group, idx):
+    """동적 레이어 하나를 leaflet 스크립트로 변환 (빈 지도에 붙여서 변환하므로 기본 지도는 그대로)"""
+    scratch = folium.Map()
+    return streamlit_folium._get_feature_group_string(group, map=scratch, idx=idx)
+
+
+def show_map(base, key, center=None, zoom=None, layers=(), width=1000, height=600,
+             returned_objects=None, on_change=None):
+    """
+    기본 지도 + 동적 레이어 표시 (st_folium과 같은 값을 반환)
+
+    Args:
+        base (BaseMap): base_map()의 반환값
+        key (str): 위젯 키
+        center (list): 지도 중심 (바뀌어도 지도를 다시 그리지 않고 이동만 함)
+        zoom (int): 확대 수준
+        layers (list[folium.FeatureGroup]): 선택 강조, 보이는 범위의 점 등 rerun마다 바뀌는 레이어
+        returned_objects (list): 브라우저에서 돌려받을 항목 (None이면 전체 - 이동/확대마다 rerun)
+        on_change (callable): 브라우저가 새 값을 보냈을 때 호출 (값은 st.session_state[key])
+    """
+    layers = [layer for layer in layers if layer is not None]
+    if base.script is None:
+        return _show_map_fallback(base, key, center, zoom, layers, width, height, returned_objects, on_change)
+
+    hash_key = base.hash_key(key)
+
+    def on_component_change():
+        st.session_state[key] = st.session_state.get(hash_key, {})
+        if on_change is not None:
+            on_change()
+
+    defaults = base.defaults
+    if returned_objects is not None:
+        defaults = {k: v for k, v in defaults.items() if k in returned_objects}
+
+    return streamlit_folium._component_func(
+        script=base.script,
+        header=base.header,
+        html=base.html,
+        id=base.map_id,
+        key=hash_key,
+        height=height,
+        width=width,
+        returned_objects=returned_objects,
+        default=defaults,
+        zoom=zoom,
+        center=center,
+        feature_group="".join(_feature_group_script(layer, idx) for idx, layer in enumerate(layers)) or None,
+        return_on_hover=False,
+        layer_control=None,
+        pixelated=False,
+        css_links=base.css_links,
+        js_links=base.js_links,
+        on_change=on_component_change,
+        wrap_longitude=False,
+    )
+
+
+def _show_map_fallback(base, key, center, zoom, layers, width, height, returned_objects, on_change):
+    """
+    공개 API 경로: st_folium()이 공유 지도에 레이어를 붙이므로 세션 사이에 잠금
+    설치된 버전에 없는 인자는 빼고, on_change가 없는 버전이면 돌려받은 값이 바뀌었을 때 직접 호출
+    """
+    options = {
+        'key': key, 'width': width, 'height': height, 'center': center, 'zoom': zoom,
+        'feature_group_to_add': layers or None, 'returned_objects': returned_objects, 'on_change': on_change,
+    }
+    supported = inspect.signature(streamlit_folium.st_folium).parameters
+    with _fallback_lock:
+        value = streamlit_folium.st_folium(
+            base.fig, **{name: option for name, option in options.items() if name in supported}
+        )
+    if on_change is not None and 'on_change' not in supported:
+        previous_key = f"_{key}_previous"
+        changed = previous_key in st.session_state and st.session_state[previous_key] != value
+        st.session_state[previous_key] = value
+        if changed:
+            on_change()
+            st.rerun()
+    return value
@@ -0,0 +1,397 @@
+"""
+렌더링 계측
+rerun마다 페이지 함수별 소요 시간, 모듈 로드 시간, 상호작용당 st.rerun() 횟수,
+동시 접속 세션 수를 기록합니다.
+
+- 실행(run)마다 한 줄씩 JSONL 파일에 기록 (크기 제한 후 순환)
+- Prometheus 텍스트 형식 파일로 누적 지표 내보내기
+- ?debug=1 또는 JINROUP_DEBUG=1 일 때 사이드바에 디버그 정보 표시
+
+st.fragment 조각만 다시 실행되는 경우(main.main()을 거치지 않음)도
+timed_fragment()로 감싸면 별도의 실행으로 집계됩니다.
+
+환경변수:
+    JINROUP_METRICS=0        파일 내보내기 끄기
+    JINROUP_METRICS_DIR      내보낼 폴더 (기본: 앱 폴더의 metrics/)
+    JINROUP_DEBUG=1          모든 세션에서 디버그 사이드바 표시
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+import streamlit as st
+
+
+# ============================================================
+# 설정
+# ============================================================
+ENABLED = os.environ.get("JINROUP_METRICS", "1") != "0"
+METRICS_DIR = Path(os.environ.get(
+    "JINROUP_METRICS_DIR", Path(__file__).resolve().parent / "metrics"
+))
+EVENTS_FILE = "events.jsonl"
+PROM_FILE = "jinroup.prom"
+
+EVENTS_MAX_BYTES = 5 * 1024 * 1024   # JSONL 파일 하나의 최대 크기
+EVENTS_BACKUPS = 3                   # 보관할 이전 파일 수 (events.jsonl.1 ~ .3)
+PROM_INTERVAL = 5.0                  # Prometheus 파일 갱신 간격(초)
+SESSION_TTL = 300.0                  # 이 시간(초) 동안 실행이 없으면 세션 종료로 간주
+SAMPLE_WINDOW = 1000                 # 분위수 계산에 쓰는 최근 측정값 개수
+
+_STATE_KEY = '_jinroup_metrics'
+
+
+# ============================================================
+# 프로세스 전체 누적 지표
+# ============================================================
+class _Timing:
+    """이름별 소요 시간 누적값"""
+    __slots__ = ('count', 'total', 'samples')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=SAMPLE_WINDOW)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.samples.append(seconds)
+
+    def quantile(self, q):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+_lock = threading.Lock()
+_timings = {}          # 이름 -> _Timing
+_module_loads = {}     # 모듈 이름 -> 마지막 로드 시간(초)
+_counters = {          # 누적 카운터
+    'script_runs': 0,
+    'fragment_runs': 0,
+    'interactions': 0,
+    'reruns': 0,
+}
+_reruns_by_page = {}   # 페이지 -> st.rerun() 호출 수
+_sessions = {}         # 세션 ID -> 마지막 실행 시각(monotonic)
+_last_prom_write = 0.0
+_prom_lock = threading.Lock()  # Prometheus 파일 쓰기 (세션 스레드가 동시에 쓰지 않도록, _lock과 별도)
+
+# 현재 스크립트 실행 중 기록된 소요 시간 (세션마다 별도 스레드에서 실행됨)
+_current = threading.local()
+
+
+def record_timing(name, seconds):
+    """소요 시간 기록"""
+    with _lock:
+        timing = _timings.get(name)
+        if timing is None:
+            timing = _timings[name] = _Timing()
+        timing.add(seconds)
+    run_timings = getattr(_current, 'timings', None)
+    if run_timings is not None:
+        run_timings[name] = run_timings.get(name, 0.0) + seconds
+
+
+def record_module_load(module_name, seconds):
+    """페이지 모듈 임포트 시간 기록"""
+    with _lock:
+        _module_loads[module_name] = seconds
+    record_timing(f"module_load.{module_name}", seconds)
+
+
+@contextmanager
+def timer(name):
+    """with 블록의 소요 시간 기록 (st.rerun()/st.stop()으로 중단되어도 기록)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(name, time.perf_counter() - start)
+
+
+def timed(name):
+    """함수 소요 시간을 기록하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def timed_fragment(name):
+    """
+    st.fragment 함수용 데코레이터
+
+    전체 실행 중에 호출되면 timed()와 같고, 조각만 다시 실행될 때는
+    그 자체를 하나의 실행(begin_run/end_run)으로 기록합니다.
+    @st.fragment 바로 아래에 붙여 사용합니다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if getattr(_current, 'timings', None) is not None:
+                with timer(name):
+                    return func(*args, **kwargs)
+            begin_run(fragment=True)
+            try:
+                with timer(name):
+                    return func(*args, **kwargs)
+            finally:
+                end_run(st.session_state.get('current_page'))
+        return wrapper
+    return decorator
+
+
+def live_session_count():
+    """최근 SESSION_TTL초 안에 실행된 세션 수"""
+    cutoff = time.monotonic() - SESSION_TTL
+    with _lock:
+        for session_id in [s for s, seen in _sessions.items() if seen < cutoff]:
+            del _sessions[session_id]
+        return len(_sessions)
+
+
+# ============================================================
+# 세션별 실행 추적
+# ============================================================
+def _session_metrics():
+    """세션별 계측 상태 (세션 ID, 현재 상호작용의 실행 횟수 등)"""
+    if _STATE_KEY not in st.session_state:
+        st.session_state[_STATE_KEY] = {
+            'session_id': uuid.uuid4().hex[:12],
+            'interaction': 0,
+            'runs': 0,
+            'runs_in_interaction': 0,
+            'rerun_pending': False,
+            'last_run': None,
+        }
+    return st.session_state[_STATE_KEY]
+
+
+def rerun(scope="app"):
+    """
+    st.rerun() 대신 사용: 같은 상호작용 안의 추가 실행으로 집계한 뒤 rerun
+
+    Args:
+        scope (str): "app"이면 전체 앱, "fragment"이면 현재 조각만 다시 실행
+            (조각만 실행 중이 아닐 때는 전체 앱을 다시 실행)
+    """
+    state = _session_metrics()
+    state['rerun_pending'] = True
+    page = st.session_state.get('current_page', 'unknown')
+    with _lock:
+        _counters['reruns'] += 1
+        _reruns_by_page[page] = _reruns_by_page.get(page, 0) + 1
+    if scope == "fragment" and getattr(_current, 'fragment', False):
+        st.rerun(scope="fragment")
+    st.rerun()
+
+
+def begin_run(fragment=False):
+    """
+    스크립트 실행 시작 (main.main() 맨 앞에서 호출)
+
+    Args:
+        fragment (bool): st.fragment 조각만 다시 실행되는 경우 True
+    """
+    state = _session_metrics()
+    if state['rerun_pending']:
+        # 직전 실행이 st.rerun()을 요청함 -> 같은 상호작용의 연속
+        state['runs_in_interaction'] += 1
+    else:
+        state['interaction'] += 1
+        state['runs_in_interaction'] = 1
+        with _lock:
+            _counters['interactions'] += 1
+    state['rerun_pending'] = False
+    state['runs'] += 1
+
+    _current.timings = {}
+    _current.start = time.perf_counter()
+    _current.fragment = fragment
+    with _lock:
+        _counters['fragment_runs' if fragment else 'script_runs'] += 1
+        _sessions[state['session_id']] = time.monotonic()
+
+
+def end_run(page):
+    """스크립트 실행 종료 (main.main()의 finally에서 호출)"""
+    run_seconds = time.perf_counter() - getattr(_current, 'start', time.perf_counter())
+    timings = getattr(_current, 'timings', None) or {}
+    fragment = getattr(_current, 'fragment', False)
+    _current.timings = None
+    _current.fragment = False
+    record_timing("fragment_run" if fragment else "script_run", run_seconds)
+
+    state = _session_metrics()
+    event = {
+        'ts': round(time.time(), 3),
+        'session': state['session_id'],
+        'page': page,
+        'interaction': state['interaction'],
+        'run_in_interaction': state['runs_in_interaction'],
+        'fragment': fragment,
+        'rerun_requested': state['rerun_pending'],
+        'run_seconds': round(run_seconds, 6),
+        'timings': {name: round(sec, 6) for name, sec in timings.items()},
+        'live_sessions': live_session_count(),
+    }
+    state['last_run'] = event
+
+    if ENABLED:
+        try:
+            _write_event(event)
+            _maybe_write_prometheus()
+        except OSError:
+            # 계측 실패가 화면 표시를 막으면 안 됨
+            pass
+
+
+# ============================================================
+# 파일 내보내기
+# ============================================================
+def _write_event(event):
+    """JSONL 파일에 한 줄 추가 (EVENTS_MAX_BYTES를 넘으면 순환)"""
+    line = json.dumps(event, ensure_ascii=False) + "\n"
+    path = METRICS_DIR / EVENTS_FILE
+    with _lock:
+        METRICS_DIR.mkdir(parents=True, exist_ok=True)
+        if path.exists() and path.stat().st_size + len(line) > EVENTS_MAX_BYTES:
+            for i in range(EVENTS_BACKUPS - 1, 0, -1):
+                older = path.with_name(f"{EVENTS_FILE}.{i}")
+                if older.exists():
+                    os.replace(older, path.with_name(f"{EVENTS_FILE}.{i + 1}"))
+            os.replace(path, path.with_name(f"{EVENTS_FILE}.1"))
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def _prom_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def prometheus_text():
+    """누적 지표를 Prometheus 텍스트 형식으로 반환"""
+    sessions = live_session_count()
+    lines = [
+        "# HELP jinroup_render_seconds 페이지 함수별 소요 시간",
+        "# TYPE jinroup_render_seconds summary",
+    ]
+    with _lock:
+        for name, timing in sorted(_timings.items()):
+            label = _prom_label(name)
+            for q in (0.5, 0.95, 0.99):
+                lines.append(
+                    f'jinroup_render_seconds{{name="{label}",quantile="{q}"}} {timing.quantile(q):.6f}'
+                )
+            lines.append(f'jinroup_render_seconds_sum{{name="{label}"}} {timing.total:.6f}')
+            lines.append(f'jinroup_render_seconds_count{{name="{label}"}} {timing.count}')
+
+        lines += [
+            "# HELP jinroup_module_load_seconds 페이지 모듈 임포트 시간",
+            "# TYPE jinroup_module_load_seconds gauge",
+        ]
+        for module_name, seconds in sorted(_module_loads.items()):
+            lines.append(f'jinroup_module_load_seconds{{module="{_prom_label(module_name)}"}} {seconds:.6f}')
+
+        lines += [
+            "# HELP jinroup_script_runs_total 스크립트 실행 횟수",
+            "# TYPE jinroup_script_runs_total counter",
+            f"jinroup_script_runs_total {_counters['script_runs']}",
+            "# HELP jinroup_fragment_runs_total st.fragment 조각만 다시 실행된 횟수",
+            "# TYPE jinroup_fragment_runs_total counter",
+            f"jinroup_fragment_runs_total {_counters['fragment_runs']}",
+            "# HELP jinroup_interactions_total 사용자 상호작용 횟수 (st.rerun()으로 이어진 실행은 하나로 셈)",
+            "# TYPE jinroup_interactions_total counter",
+            f"jinroup_interactions_total {_counters['interactions']}",
+            "# HELP jinroup_reruns_total st.rerun() 호출 횟수",
+            "# TYPE jinroup_reruns_total counter",
+        ]
+        for page, count in sorted(_reruns_by_page.items()):
+            lines.append(f'jinroup_reruns_total{{page="{_prom_label(page)}"}} {count}')
+
+    lines += [
+        "# HELP jinroup_live_sessions 최근 활동한 세션 수",
+        "# TYPE jinroup_live_sessions gauge",
+        f"jinroup_live_sessions {sessions}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _maybe_write_prometheus(force=False):
+    """
+    PROM_INTERVAL마다 Prometheus 파일을 원자적으로 교체
+    간격 확인과 쓰기를 _prom_lock 안에서 하므로 한 번에 한 스레드만 쓰고,
+    임시 파일은 프로세스·스레드마다 달라 다른 워커와도 섞이지 않음
+    """
+    global _last_prom_write
+    with _prom_lock:
+        now = time.monotonic()
+        if not force and now - _last_prom_write < PROM_INTERVAL:
+            return
+        _last_prom_write = now
+
+        METRICS_DIR.mkdir(parents=True, exist_ok=True)
+        path = METRICS_DIR / PROM_FILE
+        tmp_path = path.with_name(f"{PROM_FILE}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(prometheus_text(), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+# ============================================================
+# 디버그 사이드바
+# ============================================================
+def debug_enabled():
+    """디버그 사이드바 표시 여부 (?debug=1 또는 JINROUP_DEBUG=1)"""
+    if os.environ.get("JINROUP_DEBUG", "") == "1":
+        return True
+    return st.query_params.get("debug") == "1"
+
+
+def show_debug_sidebar():
+    """직전 실행의 계측 정보를 사이드바에 표시"""
+    if not debug_enabled():
+        return
+
+    from lazy_imports import IMPORT_STATS
+    from session_store import session_bytes
+
+    state = _session_metrics()
+    total_bytes, per_key = session_bytes()
+    last = state['last_run']
+    with st.sidebar:
+        st.markdown("### 🛠️ 디버그")
+        st.caption(f"세션 {state['session_id']} · 동시 세션 {live_session_count()}개")
+        st.caption(
+            f"상호작용 {state['interaction']}회 · 실행 {state['runs']}회 "
+            f"(상호작용당 {state['runs'] / max(state['interaction'], 1):.2f}회)"
+        )
+        with st.expander(f"세션 상태 {total_bytes:,} bytes"):
+            for key, size in sorted(per_key.items(), key=lambda x: -x[1]):
+                st.text(f"{size:8,d} B  {key}")
+        if last:
+            st.metric("직전 실행 시간", f"{last['run_seconds'] * 1000:.1f} ms")
+            st.caption(
+                f"상호작용 #{last['interaction']} - "
+                f"{last['run_in_interaction']}번째 실행"
+                + (" (조각)" if last['fragment'] else "")
+                + (" (rerun 요청)" if last['rerun_requested'] else "")
+            )
+            for name, seconds in sorted(last['timings'].items(), key=lambda x: -x[1]):
+                st.text(f"{seconds * 1000:8.1f} ms  {name}")
+        if IMPORT_STATS:
+            st.markdown("**지연 로드된 모듈**")
+            for name, stats in IMPORT_STATS.items():
+                st.text(f"{stats['seconds'] * 1000:8.0f} ms  {stats['rss_kb'] / 1024:6.1f} MB  {name}")
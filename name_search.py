@@ -0,0 +1,386 @@
+"""
+대학명 검색 색인
+검색어가 바뀔 때마다 DataFrame 전체에 str.contains를 돌리는 대신,
+대학명(과 줄임말)을 미리 2글자 단위(bigram)로 쪼갠 색인을 만들어 두고 후보만 확인합니다.
+
+- 부분 문자열 검색: 검색어 bigram들의 색인 목록 교집합 -> 후보만 실제 포함 여부 확인
+- 초성 검색: 'ㅎㅇ' -> 한양대학교 (초성 문자열에 대한 별도 bigram 색인)
+- 줄임말: '이화여대', '서울교대', '카이스트' 등 -> 원래 대학명
+- 오타/입력 중 검색: 결과가 없으면 자모 단위 3-gram 색인으로 후보를 모아
+  자모 편집 거리로 확인 ('한앙' -> 한양, 입력 중인 '한야' -> 한양)
+  후보는 겹치는 3-gram이 많고 드문 3-gram을 공유하는 순 (흔한 '대학교' 조각보다 '한양' 조각이 중요)
+- 최근 검색어 LRU 캐시 (색인은 읽기 전용이므로 모든 세션이 공유, 조건 필터가 있는 검색은 제외)
+
+결과 순서: 정확히 일치 > 앞부분 일치 > 중간 일치, 같은 단계에서는 이름이 짧을수록, 원래 순서
+(limit을 주면 순위순 색인 목록을 필요한 만큼만 읽으므로 목록이 커져도 검색 시간이 거의 일정,
+ 조건 필터(allowed)는 limit보다 먼저 적용)
+
+사용법:
+    python name_search.py 한양 ㅎㅇ 이화여대 한앙          # 실제 대학 목록으로 검색
+    python name_search.py 서울 한앙 --size 100000          # 10만 행으로 늘린 목록으로 속도 측정 (3.py와 같은 limit)
+"""
+
+import argparse
+import functools
+import itertools
+import math
+import sys
+import time
+from array import array
+from collections import namedtuple
+
+from lazy_imports import lazy_import
+from page_registry import freeze
+
+np = lazy_import("numpy")
+
+
+# ============================================================
+# 한글 자모
+# ============================================================
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ('', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ',
+             'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ')
+_CHOSEONG_SET = frozenset(CHOSEONG)
+
+
+def normalize(text):
+    """비교용 문자열 (소문자, 공백 제거)"""
+    return ''.join(str(text).lower().split())
+
+
+# 음절 -> 초성 / 자모 변환표 (str.translate 한 번으로 변환, 목록이 커도 색인 생성이 빠르도록)
+_CHOSEONG_TABLE = {
+    code: CHOSEONG[(code - HANGUL_BASE) // 588] for code in range(HANGUL_BASE, HANGUL_LAST + 1)
+}
+_JAMO_TABLE = {
+    code: CHOSEONG[(code - HANGUL_BASE) // 588]
+    + JUNGSEONG[((code - HANGUL_BASE) % 588) // 28]
+    + JONGSEONG[(code - HANGUL_BASE) % 28]
+    for code in range(HANGUL_BASE, HANGUL_LAST + 1)
+}
+
+
+def to_choseong(text):
+    """한글 음절을 초성으로 바꾼 문자열 ('한양대' -> 'ㅎㅇㄷ', 한글이 아닌 글자는 그대로)"""
+    return text.translate(_CHOSEONG_TABLE)
+
+
+def to_jamo(text):
+    """한글 음절을 자모로 풀어 쓴 문자열 ('한양' -> 'ㅎㅏㄴㅇㅑㅇ')"""
+    return text.translate(_JAMO_TABLE)
+
+
+def is_choseong_query(text):
+    """초성으로만 이루어진 검색어인지 ('ㅎㅇ')"""
+    return bool(text) and all(ch in _CHOSEONG_SET for ch in text)
+
+
+def ngrams(text, n):
+    """n글자 조각 집합 (text가 n글자보다 짧으면 빈 집합)"""
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def substring_distance(pattern, text, limit):
+    """
+    pattern과 text의 어떤 부분 문자열 사이의 최소 편집 거리 (Sellers 알고리즘)
+
+    Returns:
+        int: 거리 (limit보다 크면 limit + 1)
+    """
+    previous = [0] * (len(text) + 1)
+    for i, p in enumerate(pattern, 1):
+        current = [i]
+        for j, t in enumerate(text, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (p != t)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(min(previous), limit + 1)
+
+
+# ============================================================
+# 줄임말
+# ============================================================
+# 정식 명칭 -> 널리 쓰는 줄임말 (목록에 있는 학교만 사용)
+ALIASES = freeze({
+    '한국과학기술원': ['카이스트', 'kaist'],
+    '포항공과대학교': ['포스텍', 'postech'],
+    '울산과학기술원': ['유니스트', 'unist'],
+    '광주과학기술원': ['지스트', 'gist'],
+    '대구경북과학기술원': ['디지스트', 'dgist'],
+    '한국예술종합학교': ['한예종'],
+    '홍익대학교': ['홍대'],
+})
+
+# 이름 일부 -> 줄임 표기 (앞에서부터 처음 맞는 규칙 하나만 적용)
+ABBREVIATIONS = (
+    ('여자대학교', '여대'),
+    ('교육대학교', '교대'),
+    ('과학기술대학교', '과기대'),
+    ('외국어대학교', '외대'),
+    ('대학교', '대'),
+)
+
+
+def alias_names(name):
+    """대학명의 줄임말 목록 (정식 명칭 제외)"""
+    aliases = list(ALIASES.get(name, ()))
+    for long_form, short_form in ABBREVIATIONS:
+        if long_form in name:
+            aliases.append(name.replace(long_form, short_form, 1))
+            break
+    return aliases
+
+
+# ============================================================
+# 색인
+# ============================================================
+Matches = namedtuple('Matches', ['names', 'fuzzy'])
+
+MAX_TYPOS = 2             # 허용하는 최대 자모 편집 거리
+FUZZY_CANDIDATES = 64     # 오타 검색 결과로 쓸 최대 키 수 (편집 거리 확인을 통과한 것)
+FUZZY_CHECKS = 2048       # 오타 검색에서 편집 거리를 확인할 최대 후보 수 (후보 순위순)
+RESULT_LIMIT = 100        # 검색 결과 목록에 보여 줄 최대 이름 수 (3.py와 명령줄 측정이 같은 값 사용)
+
+
+def _typo_limit(jamo_length):
+    """검색어 길이에 따른 허용 편집 거리 (짧을수록 엄격하게)"""
+    if jamo_length < 4:
+        return 0
+    return 1 if jamo_length < 9 else MAX_TYPOS
+
+
+def _build_postings(keys, n):
+    """n-gram -> 키 번호 배열 (키 번호 순으로 정렬됨)"""
+    postings = {}
+    for key_id, key in enumerate(keys):
+        for gram in ngrams(key, n):
+            ids = postings.get(gram)
+            if ids is None:
+                postings[gram] = ids = []
+            ids.append(key_id)
+    return {gram: array('i', ids) for gram, ids in postings.items()}
+
+
+class _GramIndex:
+    """
+    키 목록 하나(대학명 또는 초성)의 bigram 색인
+    키 번호가 곧 기본 순위(짧은 이름 먼저)이므로 색인 목록을 앞에서부터 읽으면 순위순입니다.
+    """
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.grams = _build_postings(keys, 2)
+        self.exact = {}
+        self.prefixes = {}  # 앞 두 글자 -> 키 번호
+        for key_id, key in enumerate(keys):
+            self.exact.setdefault(key, array('i')).append(key_id)
+            self.prefixes.setdefault(key[:2], array('i')).append(key_id)
+
+    def matches(self, query):
+        """
+        query를 포함하는 키 번호를 순위순으로 생성 (필요한 만큼만 읽으면 되도록 generator)
+        정확히 일치 > 앞부분 일치 > 중간 일치, 같은 단계 안에서는 키 번호 순
+        """
+        keys = self.keys
+        seen = set()
+        for key_id in self.exact.get(query, ()):
+            seen.add(key_id)
+            yield key_id
+
+        if len(query) < 2:
+            # 한 글자는 bigram이 없으므로 전체 확인
+            prefix_candidates = candidates = range(len(keys))
+        else:
+            prefix_candidates = self.prefixes.get(query[:2], ())
+            # 가장 짧은 색인 목록만 읽고 나머지 조건은 실제 포함 여부로 확인
+            candidates = min((self.grams.get(gram, ()) for gram in ngrams(query, 2)), key=len)
+
+        for key_id in prefix_candidates:
+            if key_id not in seen and keys[key_id].startswith(query):
+                seen.add(key_id)
+                yield key_id
+        for key_id in candidates:
+            if key_id not in seen and query in keys[key_id]:
+                yield key_id
+
+
+class NameIndex:
+    """
+    대학명 검색 색인 (한 번 만들고 읽기만 함)
+
+    Attributes:
+        names (tuple[str]): 원래 순서의 대학명 (중복 제거)
+        size (int): 색인된 키 수 (대학명 + 줄임말)
+    """
+
+    def __init__(self, names, cache_size=256):
+        self.names = tuple(dict.fromkeys(str(name) for name in names))
+
+        # 키 번호를 (정식 명칭 길이, 원래 순서) 순으로 매겨 색인 목록이 곧 순위순이 되게 함
+        entries = []
+        for name_id, name in enumerate(self.names):
+            rank = len(normalize(name))
+            for key in dict.fromkeys(normalize(k) for k in [name, *alias_names(name)]):
+                entries.append((rank, name_id, key))
+        entries.sort(key=lambda entry: entry[:2])
+
+        self._owners = array('i', (name_id for _, name_id, _ in entries))
+        keys = tuple(key for _, _, key in entries)
+        self._jamo = tuple(to_jamo(key) for key in keys)
+        self.size = len(keys)
+
+        self._names = _GramIndex(keys)
+        self._choseong = _GramIndex(tuple(to_choseong(key) for key in keys))
+        self._jamo_postings = _build_postings(self._jamo, 3)
+
+        # 같은 검색어는 세션과 관계없이 같은 결과이므로 최근 검색어를 공유 캐시
+        self._cached = functools.lru_cache(maxsize=cache_size)(self._search)
+
+    def __len__(self):
+        return len(self.names)
+
+    # --------------------------------------------------------
+    # 검색
+    # --------------------------------------------------------
+    def search(self, query, limit=None, fuzzy=True, allowed=None):
+        """
+        검색어와 일치하는 대학명
+
+        Args:
+            query (str): 검색어 (대학명 일부, 초성, 줄임말)
+            limit (int): 최대 결과 수 (None이면 전체)
+            fuzzy (bool): 일치하는 이름이 없을 때 오타 검색 여부
+            allowed (set[str]): 이 이름만 결과에 넣음 (조건 필터, limit보다 먼저 적용, 캐시하지 않음)
+                오타 검색 여부는 거르기 전 결과로 정함 (일치하는 이름이 조건에 걸리면 빈 결과)
+
+        Returns:
+            Matches: (대학명 tuple, 오타 검색 결과인지)
+        """
+        if allowed is None:
+            return self._cached(query, limit, fuzzy)
+        return self._search(query, limit, fuzzy, allowed)
+
+    def _search(self, query, limit=None, fuzzy=True, allowed=None):
+        query = normalize(query)
+        if not query:
+            return Matches((), False)
+
+        choseong = is_choseong_query(query)
+        index = self._choseong if choseong else self._names
+        key_ids = index.matches(query)
+        first = next(key_ids, None)
+        if first is None and not choseong and fuzzy:
+            return Matches(self._collect(self._fuzzy_matches(query), limit, allowed), True)
+        if first is None:
+            return Matches((), False)
+        return Matches(self._collect(itertools.chain((first,), key_ids), limit, allowed), False)
+
+    def _fuzzy_matches(self, query):
+        """
+        자모 편집 거리가 허용 범위 안인 키 번호 (거리, 후보 순위 순)
+
+        후보 순위는 검색어와 겹치는 자모 3-gram 수, 같으면 겹치는 3-gram마다
+        log(전체 키 수 / 그 3-gram이 나오는 키 수)를 더한 점수 (드문 '한양' 조각이 흔한 '대학교' 조각보다 큼).
+        흔한 3-gram도 버리지 않고 모두 세므로 목록이 커져도 진짜 후보가 빠지지 않으며,
+        순위순으로 편집 거리를 확인해 FUZZY_CANDIDATES개를 찾거나 FUZZY_CHECKS개를 확인하면 멈춥니다.
+        """
+        jamo = to_jamo(query)
+        limit = _typo_limit(len(jamo))
+        grams = [gram for gram in ngrams(jamo, 3) if gram in self._jamo_postings]
+        if not grams:
+            return []
+        # 편집 한 번은 3-gram을 최대 3개 깨뜨리므로 이보다 적게 겹치는 키는 허용 거리 안에 들 수 없음
+        min_shared = max(1, len(ngrams(jamo, 3)) - 3 * limit)
+
+        lists = [np.frombuffer(self._jamo_postings[gram], dtype=np.int32) for gram in grams]
+        weights = [math.log((self.size + 1) / len(ids)) for ids in lists]
+        key_ids = np.concatenate(lists)
+        shared = np.bincount(key_ids, minlength=self.size)
+        scores = np.bincount(key_ids, weights=np.repeat(weights, [len(ids) for ids in lists]), minlength=self.size)
+        candidates = np.flatnonzero(shared >= min_shared)
+        candidates = candidates[np.lexsort((candidates, -scores[candidates], -shared[candidates]))]
+
+        ranked = []
+        for rank, key_id in enumerate(candidates[:FUZZY_CHECKS].tolist()):
+            distance = substring_distance(jamo, self._jamo[key_id], limit)
+            if distance <= limit:
+                ranked.append((distance, rank, key_id))
+                if len(ranked) >= FUZZY_CANDIDATES:
+                    break
+        ranked.sort()
+        return [key_id for _, _, key_id in ranked]
+
+    def _collect(self, key_ids, limit, allowed=None):
+        """
+        순위순 키 번호 -> 대학명 (줄임말과 정식 명칭이 모두 맞으면 한 번만, limit개에서 멈춤)
+        allowed가 있으면 그 안의 이름만 세므로 limit은 거른 뒤의 개수
+        """
+        seen = set()
+        kept = []
+        for key_id in key_ids:
+            name_id = self._owners[key_id]
+            if name_id in seen:
+                continue
+            seen.add(name_id)
+            if allowed is not None and self.names[name_id] not in allowed:
+                continue
+            kept.append(self.names[name_id])
+            if limit is not None and len(kept) >= limit:
+                break
+        return tuple(kept)
+
+
+# ============================================================
+# 명령줄 (검색 결과 확인 / 속도 측정)
+# ============================================================
+def _synthetic_names(names, size):
+    """대학명 x 가상 학과명으로 size행 생성 (대학x전공 목록 규모 측정용)"""
+    majors = ('경영학과', '컴퓨터공학과', '간호학과', '국어국문학과', '기계공학과', '심리학과',
+              '경제학과', '화학과', '건축학과', '유아교육과', '전자공학과', '사회복지학과')
+    out = []
+    for i in range(size):
+        name = names[i % len(names)]
+        out.append(f"{name} {majors[(i // len(names)) % len(majors)]} {i // (len(names) * len(majors))}")
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대학명 검색 색인 확인")
+    parser.add_argument("queries", nargs="+", help="검색어")
+    parser.add_argument("--size", type=int, help="가상 학과명을 붙여 늘릴 행 수")
+    parser.add_argument("--limit", type=int, default=RESULT_LIMIT + 1,
+                        help="검색 limit (기본은 3.py와 같은 RESULT_LIMIT + 1)")
+    parser.add_argument("--show", type=int, default=10, help="출력할 최대 결과 수")
+    args = parser.parse_args(argv)
+
+    import univ_cache
+
+    names = univ_cache.load()['대학명'].dropna().astype(str).tolist()
+    if args.size:
+        names = _synthetic_names(names, args.size)
+
+    start = time.perf_counter()
+    index = NameIndex(names)
+    print(f"색인 {len(index)}개 이름 / {index.size}개 키: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    for query in args.queries:
+        start = time.perf_counter()
+        matches = index._search(query, limit=args.limit)
+        cold = time.perf_counter() - start
+        index.search(query, limit=args.limit)
+        start = time.perf_counter()
+        index.search(query, limit=args.limit)
+        cached = time.perf_counter() - start
+        kind = " (오타 검색)" if matches.fuzzy else ""
+        print(f"{query}{kind}: {cold * 1000:.3f} ms, 캐시 {cached * 1000:.4f} ms, {len(matches.names)}개 "
+              f"-> {', '.join(matches.names[:args.show])}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+콜백 기반 화면 이동
+버튼을 누른 뒤 본문에서 st.session_state를 바꾸고 st.rerun()을 다시 부르면
+클릭 한 번에 스크립트가 두 번 실행됩니다. 상태 변경을 on_click/on_change 콜백으로 옮기면
+콜백이 스크립트 실행 전에 처리되므로 클릭 한 번이 실행 한 번으로 끝납니다.
+
+주소 연동:
+    ?page=riasec 처럼 페이지 ID를 쿼리 파라미터로 주면 해당 페이지에서 시작하고,
+    이동할 때마다 주소의 page 값도 함께 바뀝니다 (홈은 page 값 없음).
+
+사용법:
+    navigation.nav_button("🎨 흥미와전공", 'riasec', use_container_width=True)
+    st.button("다음 ➡️", on_click=go_next)    # 페이지 안의 상태 변경도 콜백으로
+"""
+
+import streamlit as st
+
+
+# ============================================================
+# 페이지 ID
+# ============================================================
+HOME = 'home'
+PAGE_IDS = (HOME, 'career_decision', 'riasec', 'university')
+QUERY_KEY = 'page'
+
+
+def initialize():
+    """첫 실행 때 현재 페이지 결정 (?page= 값이 올바르면 그 페이지, 아니면 홈)"""
+    if 'current_page' not in st.session_state:
+        page = st.query_params.get(QUERY_KEY)
+        st.session_state.current_page = page if page in PAGE_IDS else HOME
+
+
+def current_page():
+    return st.session_state.get('current_page', HOME)
+
+
+def _sync_query_params(page):
+    """주소의 page 값을 현재 페이지와 맞춤 (debug 등 다른 값은 유지)"""
+    if page == HOME:
+        if QUERY_KEY in st.query_params:
+            del st.query_params[QUERY_KEY]
+    elif st.query_params.get(QUERY_KEY) != page:
+        st.query_params[QUERY_KEY] = page
+
+
+# ============================================================
+# 콜백
+# ============================================================
+def go_to(page):
+    """
+    페이지 이동 콜백 (on_click에 등록)
+
+    Args:
+        page (str): PAGE_IDS 중 하나
+    """
+    if page not in PAGE_IDS:
+        raise ValueError(f"알 수 없는 페이지입니다: {page}")
+    st.session_state.current_page = page
+    _sync_query_params(page)
+
+
+def rerun_app():
+    """
+    st.fragment 조각 안의 콜백에서 전체 앱 실행으로 넘어가야 할 때 호출
+    (예: 마지막 문항 -> 결과 페이지)
+
+    조각 안 위젯의 클릭은 그 조각만 다시 실행하므로, 콜백에서 전체 실행을 요청합니다.
+    조각 실행은 본문을 그리기 전에 중단되고 전체 앱이 한 번 실행됩니다.
+    """
+    st.rerun()
+
+
+# ============================================================
+# 위젯
+# ============================================================
+def nav_button(label, page, **kwargs):
+    """
+    누르면 page로 이동하는 버튼 (현재 페이지면 primary로 표시)
+
+    Args:
+        label (str): 버튼 레이블
+        page (str): 이동할 페이지 ID
+        **kwargs: st.button에 그대로 전달 (key, use_container_width, type 등)
+    """
+    kwargs.setdefault('type', "primary" if current_page() == page else "secondary")
+    return st.button(label, on_click=go_to, args=(page,), **kwargs)
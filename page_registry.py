@@ -0,0 +1,114 @@
+"""
+페이지 레지스트리
+각 페이지 파일(jinrotool2.py, REASEC3.py, 3.py)을 프로세스당 한 번만 임포트하고,
+매 rerun에서는 모듈의 render() 진입점만 호출합니다.
+
+개발 중에는 환경변수 JINROUP_HOT_RELOAD=1 을 설정하면
+파일 수정 시간(mtime)이 바뀐 페이지만 다시 임포트합니다.
+"""
+
+import importlib.util
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+
+import metrics
+
+
+# ============================================================
+# 설정
+# ============================================================
+BASE_DIR = Path(__file__).resolve().parent
+
+# 페이지 ID -> (파일명, 모듈 이름)
+PAGES = MappingProxyType({
+    'career_decision': ("jinrotool2.py", "jinrotool2"),
+    'riasec': ("REASEC3.py", "riasec3"),
+    'university': ("3.py", "university_info"),
+})
+
+HOT_RELOAD = os.environ.get("JINROUP_HOT_RELOAD", "") == "1"
+
+# 페이지 ID -> (모듈, 임포트 당시 mtime)
+_loaded = {}
+_lock = threading.Lock()
+
+
+# ============================================================
+# 공유 상수 캐시
+# ============================================================
+def freeze(value):
+    """
+    페이지 상수(dict/list)를 읽기 전용 구조로 변환
+
+    모듈은 프로세스당 한 번만 임포트되어 모든 세션이 같은 객체를 공유하므로,
+    한 세션에서 실수로 상수를 수정하지 못하도록 dict는 MappingProxyType,
+    list는 tuple로 바꿉니다.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+# ============================================================
+# 모듈 로드
+# ============================================================
+def _import_file(file_path, module_name):
+    """파일에서 모듈을 임포트 (페이지의 main()은 실행하지 않음)"""
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    start = time.perf_counter()
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        sys.modules.pop(module_name, None)
+        raise
+    metrics.record_module_load(module_name, time.perf_counter() - start)
+    return module
+
+
+def get_page_module(page_id):
+    """
+    페이지 모듈 반환 (프로세스당 한 번만 임포트)
+
+    Args:
+        page_id (str): PAGES에 등록된 페이지 ID
+
+    Raises:
+        KeyError: 등록되지 않은 페이지 ID
+        FileNotFoundError: 페이지 파일이 없는 경우
+    """
+    file_name, module_name = PAGES[page_id]
+    file_path = BASE_DIR / file_name
+
+    cached = _loaded.get(page_id)
+    if cached is not None and not HOT_RELOAD:
+        return cached[0]
+
+    if not file_path.exists():
+        raise FileNotFoundError(file_name)
+    mtime = file_path.stat().st_mtime_ns
+
+    with _lock:
+        cached = _loaded.get(page_id)
+        if cached is not None and cached[1] == mtime:
+            return cached[0]
+        module = _import_file(file_path, module_name)
+        _loaded[page_id] = (module, mtime)
+        return module
+
+
+def render_page(page_id):
+    """페이지 모듈의 render() 진입점 호출"""
+    get_page_module(page_id).render()
+
+
+def loaded_pages():
+    """현재 프로세스에 임포트된 페이지 ID 목록"""
+    return list(_loaded.keys())
@@ -0,0 +1,392 @@
+"""
+홀랜드 코드 유사도 추천
+직업/학과 목록(catalog)의 항목마다 6차원 RIASEC 벡터를 두고, 학생의 유형별 점수 분포(프로필 모양)와
+가장 비슷한 항목을 찾습니다. 상위 3글자마다 고정 목록을 보여 주는 대신
+R/I/A/S/E/C 점수 전체의 모양을 비교하므로 목록이 수천 개여도 순위가 의미 있습니다.
+
+- cosine: 벡터에서 평균을 뺀 뒤(점수 수준이 아닌 모양만 비교) 단위 길이로 나눈 행렬과 내적
+- euclidean: 최솟값 0, 최댓값 1로 맞춘 벡터 사이 거리 (||c||²를 미리 계산, 내적 한 번)
+- 내적은 float64 행렬 곱 한 번 후 float32로 반올림 (행 수에 따라 BLAS 합 순서가 달라 생기는 ~1e-16 차이가
+  비교하는 값에 남지 않으므로 학생 한 명이든 여러 명이든 같은 순위)
+- 행렬은 종류(job/major)별로 한 번 만들어 두고, 상위 k개는 np.argpartition -> k개만 정렬
+- 결과는 (종류, k, 방식, 반올림한 점수) 키로 LRU 캐시 (같은 점수의 학생은 다시 계산하지 않음)
+- 일괄 채점은 recommend_many: 같은 점수(반올림)의 학생은 한 번만, 서로 다른 점수를 BLOCK_ROWS개씩
+  학생 x 항목 유사도 행렬로 계산하고 상위 k개는 np.partition + 경계 동점 보정 (순위 규칙은 recommend와 같음)
+- 유형 점수가 모두 같은 평평한 프로필은 모양이 없어 유사도가 모두 같으므로, fallback 홀랜드 코드
+  (결과 페이지의 상위 3유형)로 추천하거나 빈 결과를 돌려줌 (목록 앞 항목이 추천되지 않도록)
+- 결과 페이지/일괄 채점의 추천 구역은 sections: 유형별 목록만 있으면 상위 3유형마다 그 유형 목록,
+  여러 유형 점수가 붙은 목록(JINROUP_CATALOG)을 읽었을 때만 유사도 순위 목록 하나
+  (기본 목록은 한 유형짜리 벡터라 순위가 1·2위 유형 목록으로만 채워지고 3위 유형 항목이 빠짐)
+
+목록:
+    기본은 REASEC3의 JOBS_DATA / MAJORS_DATA (여러 유형에 들어 있는 항목은 유형을 합친 벡터)
+    JINROUP_CATALOG에 CSV 경로를 지정하면 그 파일을 추가로 읽음
+        열: name, kind (job 또는 major), 그리고 code (예: "IRC") 또는 R, I, A, S, E, C 점수
+
+사용법:
+    python recommend.py --bench 10000     # 가상 목록 10,000개로 추천 1회 시간 측정
+"""
+
+import argparse
+import functools
+import os
+import sys
+import time
+from collections import namedtuple
+
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+TYPES = "RIASEC"
+KINDS = ("job", "major")
+CODE_WEIGHTS = (3.0, 2.0, 1.0)   # 홀랜드 코드 1~3번째 글자의 가중치
+METRICS = ("cosine", "euclidean")
+BLOCK_ROWS = 2048                # recommend_many가 한 번에 만드는 유사도 행렬의 행 수 (메모리 ≈ 행 x 항목 수 x 12바이트)
+
+Recommendation = namedtuple("Recommendation", "name kind code similarity")
+
+
+def code_vector(code):
+    """홀랜드 코드 (예: "IRC") -> 6차원 벡터 (앞 글자일수록 큰 값)"""
+    vector = [0.0] * len(TYPES)
+    for letter, weight in zip(code.upper(), CODE_WEIGHTS):
+        vector[TYPES.index(letter)] = weight
+    return vector
+
+
+def is_flat(scores):
+    """유형별 점수(반올림)가 모두 같은지 (점수 모양으로 비교할 수 없음)"""
+    key = _score_key(scores)
+    return min(key) == max(key)
+
+
+def _score_key(scores):
+    if isinstance(scores, dict):
+        scores = [scores.get(letter, 0) for letter in TYPES]
+    return tuple(int(round(float(value))) for value in scores)
+
+
+def vector_code(vector, length=3):
+    """6차원 벡터 -> 홀랜드 코드 (값이 같으면 RIASEC 순, 0인 유형은 뺌)"""
+    order = sorted(range(len(TYPES)), key=lambda i: -vector[i])
+    return "".join(TYPES[i] for i in order[:length] if vector[i] > 0)
+
+
+# ============================================================
+# 목록
+# ============================================================
+class Catalog:
+    """
+    추천 대상 목록 (읽기 전용)
+
+    Attributes:
+        names (tuple[str]): 항목 이름
+        kinds (tuple[str]): 'job' 또는 'major'
+        vectors (ndarray): 항목 x 6 (RIASEC 순서)
+        type_lists (dict | None): 유형별 목록으로만 만든 경우 {종류: {유형: 행 번호 tuple (목록 순서)}}
+    """
+
+    def __init__(self, names, kinds, vectors, type_lists=None):
+        self.names = tuple(names)
+        self.kinds = tuple(kinds)
+        self.vectors = np.asarray(vectors, dtype="float32").reshape(len(self.names), len(TYPES))
+        self.vectors.setflags(write=False)
+        self.type_lists = type_lists
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_type_lists(cls, jobs, majors):
+        """
+        유형별 목록 ({'R': [...], ...})에서 목록 생성
+        여러 유형에 나오는 항목은 한 항목으로 합치고 해당 유형들에 같은 값을 줌
+        (벡터가 같은 항목끼리는 유사도가 같으므로 목록 순서대로 추천됨)
+        """
+        names, kinds, vectors = [], [], []
+        type_lists = {}
+        for kind, table in (("job", jobs), ("major", majors)):
+            index = {}
+            type_lists[kind] = {}
+            for letter, entries in table.items():
+                for name in entries:
+                    if name not in index:
+                        index[name] = len(names)
+                        names.append(name)
+                        kinds.append(kind)
+                        vectors.append([0.0] * len(TYPES))
+                    vectors[index[name]][TYPES.index(letter)] = 1.0
+                type_lists[kind][letter] = tuple(index[name] for name in entries)
+        return cls(names, kinds, vectors, type_lists)
+
+    @classmethod
+    def from_csv(cls, path):
+        """CSV 목록 (name, kind, code 또는 R~C 열)"""
+        frame = pd.read_csv(path, dtype={'name': str, 'kind': str})
+        if all(letter in frame.columns for letter in TYPES):
+            vectors = frame[list(TYPES)].to_numpy(dtype="float32", na_value=0.0)
+        elif 'code' in frame.columns:
+            vectors = [code_vector(str(code)) for code in frame['code'].fillna("")]
+        else:
+            raise ValueError(f"{path}: code 열 또는 {', '.join(TYPES)} 열이 필요합니다")
+        kinds = frame['kind'].str.strip().str.lower()
+        unknown = sorted(set(kinds) - set(KINDS))
+        if unknown:
+            raise ValueError(f"{path}: kind는 job 또는 major여야 합니다 ({', '.join(map(str, unknown))})")
+        return cls(frame['name'].str.strip(), kinds, vectors)
+
+    def __add__(self, other):
+        """목록 합치기 (유형별 목록이 아니게 되므로 type_lists는 None)"""
+        return Catalog(self.names + other.names, self.kinds + other.kinds,
+                       np.vstack([self.vectors, other.vectors]))
+
+
+def synthetic_catalog(size, seed=0):
+    """벤치마크용 가상 목록 (종류 반반, 유형 점수는 무작위)"""
+    rng = np.random.default_rng(seed)
+    vectors = rng.gamma(1.0, 1.0, (size, len(TYPES))).astype("float32")
+    kinds = [KINDS[i % 2] for i in range(size)]
+    return Catalog([f"{kind}-{i}" for i, kind in enumerate(kinds)], kinds, vectors)
+
+
+# ============================================================
+# 추천
+# ============================================================
+def _centered_unit(vectors):
+    centered = vectors - vectors.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(centered, axis=1, keepdims=True)
+    return np.divide(centered, norms, out=np.zeros_like(centered), where=norms > 0)
+
+
+def _dot(rows, columns):
+    """
+    rows (N x 6) · columns (6 x M, float64) -> N x M float32
+    float64로 곱한 뒤 float32로 반올림 (N에 따른 합 순서 차이는 float64 마지막 자리에만 생겨 반올림에서 사라짐)
+    """
+    return (rows.astype("float64") @ columns).astype("float32")
+
+
+def _unique_rows(values):
+    """
+    정수 값 행렬의 서로 다른 행 -> (서로 다른 행의 첫 위치, 행마다 서로 다른 행 번호)
+    값 범위가 좁으면 행을 int64 하나로 묶어 1차원 np.unique (axis=0보다 훨씬 빠름)
+    """
+    ints = values.astype("int64")
+    low = int(ints.min(initial=0))
+    base = int(ints.max(initial=0)) - low + 1
+    if base ** ints.shape[1] < 2 ** 62:
+        packed = (ints - low) @ (base ** np.arange(ints.shape[1] - 1, -1, -1, dtype="int64"))
+        _, first, inverse = np.unique(packed, return_index=True, return_inverse=True)
+    else:
+        _, first, inverse = np.unique(ints, axis=0, return_index=True, return_inverse=True)
+    return first, inverse.reshape(-1)
+
+
+def _top_k(similarity, k):
+    """
+    행마다 유사도 상위 k개 열 번호 (N x k, 유사도 순, 같으면 열 번호 순 = recommend의 lexsort와 같은 규칙)
+    전체 정렬 대신 np.argpartition으로 k개를 고르고, k번째 값과 같은 열이 남은 자리보다 많은 행만
+    그 값의 열을 앞 열부터 다시 고름 (argpartition은 동점 중 아무 열이나 고르므로)
+    """
+    part = np.argpartition(-similarity, k - 1, axis=1)
+    columns = part[:, :k]
+    kth = np.take_along_axis(similarity, part[:, k - 1, None], axis=1)
+    ties = similarity == kth
+    need = k - (similarity > kth).sum(axis=1)
+    ambiguous = np.flatnonzero(ties.sum(axis=1) > need)
+    if len(ambiguous):
+        rows = similarity[ambiguous]
+        tied = ties[ambiguous]
+        chosen = (rows > kth[ambiguous]) | (tied & (np.cumsum(tied, axis=1) <= need[ambiguous, None]))
+        columns[ambiguous] = np.nonzero(chosen)[1].reshape(len(ambiguous), k)
+    columns.sort(axis=1)
+    values = np.take_along_axis(similarity, columns, axis=1)
+    return np.take_along_axis(columns, np.argsort(-values, axis=1, kind="stable"), axis=1)
+
+
+def _min_max(vectors):
+    low = vectors.min(axis=1, keepdims=True)
+    span = vectors.max(axis=1, keepdims=True) - low
+    return np.divide(vectors - low, span, out=np.zeros_like(vectors), where=span > 0)
+
+
+class Recommender:
+    """
+    목록에 대한 유사도 추천기 (한 번 만들고 모든 세션이 공유)
+
+    Args:
+        catalog (Catalog): 추천 대상
+        cache_size (int): 결과 LRU 캐시 크기
+    """
+
+    def __init__(self, catalog, cache_size=1024):
+        self.catalog = catalog
+        self._rows = {}
+        self._unit = {}
+        self._scaled = {}
+        self._scaled_sq = {}
+        kinds = np.array(catalog.kinds)
+        for kind in KINDS:
+            rows = np.flatnonzero(kinds == kind)
+            vectors = catalog.vectors[rows]
+            self._rows[kind] = rows
+            self._unit[kind] = np.ascontiguousarray(_centered_unit(vectors).T, dtype="float64")
+            self._scaled[kind] = np.ascontiguousarray(_min_max(vectors).T, dtype="float64")
+            self._scaled_sq[kind] = (self._scaled[kind] ** 2).sum(axis=0).astype("float32")
+        self._codes = [vector_code(vector) for vector in catalog.vectors.tolist()]
+        self._top = functools.lru_cache(maxsize=cache_size)(self._top_for)
+
+    @property
+    def ranked(self):
+        """추천 구역이 유사도 순위 목록 하나인지 (유형별 목록만 있으면 False)"""
+        return self.catalog.type_lists is None
+
+    def sections(self, scores, code, kind="job", k=12, metric="cosine"):
+        """
+        결과 페이지에 보여 줄 추천 구역
+
+        Args:
+            code (str): 상위 3유형 (예: "ESI", 점수가 평평할 때 fallback으로도 사용)
+            k (int): 순위 목록이면 항목 수, 유형별 목록이면 유형마다 최대 항목 수
+
+        Returns:
+            tuple: ((유형, tuple[Recommendation]), ...)
+                유형별 목록이면 code의 유형마다 한 구역 (similarity는 None),
+                순위 목록이면 (None, recommend(...)) 한 구역
+        """
+        if self.ranked:
+            return ((None, self.recommend(scores, kind, k, metric, fallback=code)),)
+        table = self.catalog.type_lists[kind]
+        return tuple(
+            (letter, tuple(Recommendation(self.catalog.names[row], kind, self._codes[row], None)
+                           for row in table.get(letter, ())[:k]))
+            for letter in code
+        )
+
+    def recommend(self, scores, kind="job", k=12, metric="cosine", fallback=None):
+        """
+        점수 분포와 비슷한 항목 상위 k개 (비슷한 순)
+
+        Args:
+            scores (dict | sequence): 유형별 점수 ({'R': 31, ...} 또는 RIASEC 순서 6개 값)
+            kind (str): 'job' 또는 'major'
+            metric (str): 'cosine' 또는 'euclidean'
+            fallback (str): 점수가 평평할 때(is_flat) 대신 쓸 홀랜드 코드 (예: 상위 3유형 "RIA")
+
+        Returns:
+            tuple[Recommendation]: similarity는 cosine이면 -1~1, euclidean이면 1 / (1 + 거리)
+                점수가 평평하고 fallback이 없으면 빈 tuple
+        """
+        key = _score_key(scores)
+        if min(key) == max(key):
+            key = _score_key(code_vector(fallback or ""))
+            if min(key) == max(key):
+                return ()
+        return self._top(key, kind, k, metric)
+
+    def recommend_many(self, scores, kind="job", k=12, metric="cosine", fallback=None):
+        """
+        여러 학생을 한 번에 추천 (일괄 채점용, 학생마다 recommend와 같은 순서)
+
+        Args:
+            scores (ndarray): 학생 x 6 점수 (RIASEC 순서)
+            fallback (sequence[str]): 학생별 홀랜드 코드 (점수가 평평한 학생에게 사용)
+
+        Returns:
+            ndarray: 학생 x k 목록 행 번호 (catalog.names 위치, 추천이 없으면 -1)
+        """
+        profiles = np.rint(np.asarray(scores, dtype="float64")).astype("float32")
+        flat = profiles.max(axis=1) == profiles.min(axis=1)
+        if fallback is not None and flat.any():
+            profiles[flat] = [code_vector(fallback[i] or "") for i in np.flatnonzero(flat).tolist()]
+            flat = profiles.max(axis=1) == profiles.min(axis=1)
+
+        k = min(k, len(self._rows[kind]))
+        if k <= 0:
+            return np.full((len(profiles), 0), -1, dtype="int64")
+        # 같은 점수의 학생은 한 번만 계산
+        first, inverse = _unique_rows(profiles)
+        unique = profiles[first]
+        top = np.empty((len(unique), k), dtype="int64")
+        for start in range(0, len(unique), BLOCK_ROWS):
+            block = unique[start:start + BLOCK_ROWS]
+            top[start:start + len(block)] = _top_k(self._similarity(block, kind, metric), k)
+        rows = self._rows[kind][top][inverse]
+        rows[flat] = -1
+        return rows
+
+    def _similarity(self, profiles, kind, metric):
+        """점수 행렬(N x 6) -> 유사도 (N x 항목 수)"""
+        if metric == "cosine":
+            return _dot(_centered_unit(profiles), self._unit[kind])
+        if metric == "euclidean":
+            scaled = _min_max(profiles)
+            distance_sq = (self._scaled_sq[kind][None, :] - 2 * _dot(scaled, self._scaled[kind])
+                           + (scaled ** 2).sum(axis=1, keepdims=True))
+            return 1.0 / (1.0 + np.sqrt(np.maximum(distance_sq, 0.0)))
+        raise ValueError(f"metric은 {', '.join(METRICS)} 중 하나여야 합니다: {metric}")
+
+    def _top_for(self, key, kind, k, metric):
+        profile = np.asarray(key, dtype="float32")[None, :]
+        similarity = self._similarity(profile, kind, metric)[0]
+
+        k = min(k, len(similarity))
+        if k <= 0:
+            return ()
+        # k번째 유사도 이상인 후보만 정렬 (경계에서 유사도가 같은 항목은 목록 순서대로, lexsort는 마지막 키가 우선)
+        kth = similarity[np.argpartition(-similarity, k - 1)[k - 1]]
+        top = np.flatnonzero(similarity >= kth)
+        top = top[np.lexsort((top, -similarity[top]))][:k]
+        rows = self._rows[kind][top]
+        return tuple(
+            Recommendation(self.catalog.names[row], kind, self._codes[row], float(value))
+            for row, value in zip(rows.tolist(), similarity[top].tolist())
+        )
+
+    def cache_info(self):
+        return self._top.cache_info()
+
+
+def default_catalog(jobs, majors):
+    """REASEC3 목록 + JINROUP_CATALOG (지정된 경우)"""
+    catalog = Catalog.from_type_lists(jobs, majors)
+    path = os.environ.get("JINROUP_CATALOG")
+    if path:
+        catalog = catalog + Catalog.from_csv(path)
+    return catalog
+
+
+# ============================================================
+# 벤치마크
+# ============================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="홀랜드 코드 유사도 추천 속도 측정")
+    parser.add_argument("--bench", type=int, default=10000, help="가상 목록 크기")
+    parser.add_argument("--queries", type=int, default=2000, help="측정할 추천 횟수 (서로 다른 점수)")
+    parser.add_argument("-k", type=int, default=12)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    recommender = Recommender(synthetic_catalog(args.bench), cache_size=args.queries * 2)
+    print(f"목록 {args.bench:,}개 준비 {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    rng = np.random.default_rng(1)
+    profiles = rng.integers(8, 41, (args.queries, len(TYPES))).tolist()
+    for metric in METRICS:
+        start = time.perf_counter()
+        for profile in profiles:
+            recommender.recommend(profile, "job", args.k, metric)
+        miss = (time.perf_counter() - start) / args.queries
+        start = time.perf_counter()
+        for profile in profiles:
+            recommender.recommend(profile, "job", args.k, metric)
+        hit = (time.perf_counter() - start) / args.queries
+        print(f"{metric:<10} 계산 {miss * 1e6:7.1f} µs/회 · 캐시 {hit * 1e6:5.1f} µs/회")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+검사 결과 캐시
+결과는 응답만으로 정해지므로, 완료된 응답이 같으면 세션이 달라도 같은 결과 객체를 씁니다.
+(모두 '보통이다'처럼 같은 응답 벡터가 흔하고, 결과 페이지는 확장 패널·버튼 클릭마다 다시 실행됩니다)
+
+- 결과 객체: 응답 지문(문항 번호 순 bytes, 48바이트면 키도 48바이트라 충돌 없음)으로 프로세스 LRU 캐시
+  페이지가 namedtuple + freeze로 만들어 읽기 전용이므로 여러 세션이 함께 써도 안전
+- 차트: plotly Figure를 점수별로 st.cache_resource에 한 번만 생성 (모든 세션이 같은 객체 공유, 수정 금지)
+  st.plotly_chart는 dict/JSON을 받으면 Figure로 다시 검증(~10ms)하므로 JSON 대신 Figure 객체를 캐시
+  (다시 실행할 때는 Streamlit의 직렬화 ~0.7ms만 남음)
+
+캐시 크기는 JINROUP_RESULT_CACHE (기본 4096), JINROUP_FIGURE_CACHE (기본 1024)
+
+예:
+    @results.memoized
+    def compute_result(answers):
+        scores = INSTRUMENT.scores(answers)
+        return RiasecResult(freeze(scores), ...)
+
+    @results.figure_cache
+    def create_radar_chart(scores):
+        ...
+"""
+
+import functools
+import os
+
+import streamlit as st
+
+
+RESULT_CACHE_SIZE = int(os.environ.get("JINROUP_RESULT_CACHE", "4096"))
+FIGURE_CACHE_SIZE = int(os.environ.get("JINROUP_FIGURE_CACHE", "1024"))
+
+
+def fingerprint(answers):
+    """응답 지문 (bytearray/bytes/memoryview -> 해시 가능한 bytes)"""
+    return bytes(answers)
+
+
+def memoized(build):
+    """
+    결과 계산 함수를 응답 지문으로 캐시
+
+    Args:
+        build (callable): build(answers) -> 읽기 전용 결과 객체 (answers는 bytes로 전달)
+
+    Returns:
+        callable: 같은 인자를 받는 함수 (cache_info, cache_clear 포함)
+    """
+    cached = functools.lru_cache(maxsize=RESULT_CACHE_SIZE)(build)
+
+    @functools.wraps(build)
+    def lookup(answers):
+        return cached(fingerprint(answers))
+
+    lookup.cache_info = cached.cache_info
+    lookup.cache_clear = cached.cache_clear
+    return lookup
+
+
+def figure_cache(build):
+    """
+    차트 생성 함수를 인자(점수)별로 캐시
+    인자는 Streamlit이 해시할 수 있는 값(int, dict 등)이어야 합니다 (MappingProxyType은 dict로 넘김).
+    """
+    return st.cache_resource(max_entries=FIGURE_CACHE_SIZE, show_spinner=False)(build)
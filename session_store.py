@@ -0,0 +1,129 @@
+"""
+검사별 세션 상태 저장소
+검사(진로결정돕기, 흥미와전공)마다 __slots__ 객체 하나를 네임스페이스 키에 저장하고,
+응답은 문항 번호로 인덱싱하는 고정 길이 bytearray에 담습니다 (0 = 미응답, 1~5 = 응답 값).
+
+세션 수천 개가 서버 메모리에 머무르므로, 문자열 키 dict를 중첩하는 대신
+검사당 객체 1개 + 문항당 1바이트만 쓰도록 합니다.
+"""
+
+import sys
+
+import streamlit as st
+
+
+# ============================================================
+# 네임스페이스 키
+# ============================================================
+CAREER_DECISION = 'jinroup.career_decision'
+RIASEC = 'jinroup.riasec'
+
+
+class InstrumentState:
+    """검사 하나의 진행 상태"""
+    __slots__ = ('page', 'phase', 'current', 'answers', 'notice', 'order')
+
+    def __init__(self, n_items, phase=None):
+        self.page = 'intro'
+        self.phase = phase
+        self.current = 0
+        self.answers = bytearray(n_items)
+        self.notice = None  # 콜백이 남기고 다음 실행에서 한 번 표시할 안내 문구
+        self.order = None   # 적응형 검사에서 낸 문항 번호 순서 (bytearray, 고정 순서 검사는 None)
+
+    def reset(self, page='intro', phase=None):
+        """응답을 모두 지우고 처음 상태로"""
+        self.page = page
+        self.phase = phase
+        self.current = 0
+        self.answers[:] = bytes(len(self.answers))
+        self.notice = None
+        self.order = None
+
+    def answer(self, item_id):
+        """문항 응답 값 (미응답이면 None)"""
+        return self.answers[item_id] or None
+
+    def set_answer(self, item_id, value):
+        self.answers[item_id] = value
+
+    def answered_count(self):
+        return len(self.answers) - self.answers.count(0)
+
+    def pop_notice(self):
+        """안내 문구를 꺼내고 지움 (없으면 None)"""
+        notice, self.notice = self.notice, None
+        return notice
+
+
+def get_state(namespace, n_items, phase=None):
+    """
+    검사 상태 반환 (없으면 생성)
+
+    Args:
+        namespace (str): CAREER_DECISION 또는 RIASEC
+        n_items (int): 전체 문항 수
+        phase (str): 처음 단계 이름 (단계가 없는 검사는 None)
+    """
+    state = st.session_state.get(namespace)
+    if state is None or len(state.answers) != n_items:
+        state = InstrumentState(n_items, phase)
+        st.session_state[namespace] = state
+    return state
+
+
+# ============================================================
+# 위젯 키
+# ============================================================
+def widget_key(namespace, item_id):
+    """문항 응답 위젯의 키 (예: 'jinroup.riasec.q.12')"""
+    return f"{namespace}.q.{item_id}"
+
+
+def prune_widget_keys(namespace, keep=None):
+    """
+    현재 문항 외의 응답 위젯 키를 세션에서 제거
+
+    응답은 InstrumentState.answers에 저장되므로 지나간 문항의 위젯 값은 필요 없습니다.
+    """
+    prefix = f"{namespace}.q."
+    for key in [k for k in st.session_state.keys() if isinstance(k, str) and k.startswith(prefix)]:
+        if key != keep:
+            del st.session_state[key]
+
+
+# ============================================================
+# 메모리 계산
+# ============================================================
+def deep_sizeof(obj, _seen=None):
+    """객체와 그 안에 담긴 객체들의 대략적인 크기(바이트)"""
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, _seen) + deep_sizeof(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(v, _seen) for v in obj)
+    elif hasattr(obj, '__slots__'):
+        size += sum(
+            deep_sizeof(getattr(obj, name), _seen)
+            for name in obj.__slots__ if hasattr(obj, name)
+        )
+    return size
+
+
+def session_bytes():
+    """
+    현재 세션 상태가 차지하는 바이트 수
+
+    Returns:
+        tuple: (전체 바이트, {키: 바이트})
+    """
+    per_key = {}
+    for key in list(st.session_state.keys()):
+        per_key[str(key)] = deep_sizeof(key) + deep_sizeof(st.session_state[key])
+    return sum(per_key.values()), per_key
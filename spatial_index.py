@@ -0,0 +1,173 @@
+"""
+위도/경도 격자 색인
+점들을 일정한 크기(기본 0.1도, 약 11km)의 격자 칸으로 나누고 칸 번호 순으로 정렬해 두어,
+지도에 보이는 범위 / 반경 X km / 가장 가까운 N곳 질의 때 전체 행 대신 주변 칸만 확인합니다.
+
+- 칸 번호는 행 우선(row-major)이므로 같은 위도 줄의 연속한 칸은 정렬된 배열에서 한 구간
+  -> 사각형 범위는 위도 줄마다 슬라이스 하나
+- 거리 계산과 순위는 numpy로 한 번에 (haversine)
+"""
+
+import math
+
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180  # 위도 1도 ≈ 111.2km
+
+
+def haversine_km(lat, lon, lats, lons):
+    """
+    한 점에서 여러 점까지의 대원 거리 (km)
+
+    Args:
+        lat, lon (float): 기준점
+        lats, lons (ndarray): 대상 점들
+    """
+    lat1 = math.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lons) - math.radians(lon)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class GridIndex:
+    """
+    격자 색인 (한 번 만들고 읽기만 함)
+
+    질의 결과는 만들 때 넘긴 배열의 행 번호(0부터)입니다. 좌표가 없는(NaN) 행은 색인하지 않습니다.
+
+    Attributes:
+        cell_deg (float): 격자 칸 크기 (도)
+    """
+
+    def __init__(self, lats, lons, cell_deg=0.1):
+        lats = np.asarray(lats, dtype="float64")
+        lons = np.asarray(lons, dtype="float64")
+        valid = np.isfinite(lats) & np.isfinite(lons)
+
+        self.cell_deg = cell_deg
+        ids = np.flatnonzero(valid)
+        lats, lons = lats[valid], lons[valid]
+        if len(ids):
+            self._lat0, self._lon0 = float(lats.min()), float(lons.min())
+            rows = ((lats - self._lat0) // cell_deg).astype("int64")
+            cols = ((lons - self._lon0) // cell_deg).astype("int64")
+            self._n_rows, self._n_cols = int(rows.max()) + 1, int(cols.max()) + 1
+        else:
+            self._lat0 = self._lon0 = 0.0
+            rows = cols = np.zeros(0, dtype="int64")
+            self._n_rows = self._n_cols = 0
+
+        cells = rows * self._n_cols + cols
+        order = np.argsort(cells, kind="stable")
+        self._ids = ids[order]
+        self._lats = lats[order]
+        self._lons = lons[order]
+        self._cells = cells[order]
+        # 칸 c의 점들은 정렬된 배열의 [_starts[c], _starts[c + 1]) 구간
+        self._starts = np.searchsorted(self._cells, np.arange(self._n_rows * self._n_cols + 1))
+
+    def __len__(self):
+        return len(self._ids)
+
+    # --------------------------------------------------------
+    # 내부: 사각형 범위의 후보 위치
+    # --------------------------------------------------------
+    def _box_positions(self, south, west, north, east):
+        """사각형에 걸친 칸들의 점 위치 (정렬된 배열 기준, 경계 칸이 포함되므로 실제 범위 확인 필요)"""
+        if not len(self._ids):
+            return np.zeros(0, dtype="int64")
+        r0 = max(int((south - self._lat0) // self.cell_deg), 0)
+        r1 = min(int((north - self._lat0) // self.cell_deg), self._n_rows - 1)
+        c0 = max(int((west - self._lon0) // self.cell_deg), 0)
+        c1 = min(int((east - self._lon0) // self.cell_deg), self._n_cols - 1)
+        if r0 > r1 or c0 > c1:
+            return np.zeros(0, dtype="int64")
+        slices = [
+            np.arange(self._starts[r * self._n_cols + c0], self._starts[r * self._n_cols + c1 + 1])
+            for r in range(r0, r1 + 1)
+        ]
+        return np.concatenate(slices)
+
+    def _in_box(self, positions, south, west, north, east, rows=None):
+        lats, lons = self._lats[positions], self._lons[positions]
+        mask = (lats >= south) & (lats <= north) & (lons >= west) & (lons <= east)
+        if rows is not None:
+            mask &= np.isin(self._ids[positions], rows)
+        return positions[mask]
+
+    # --------------------------------------------------------
+    # 질의
+    # --------------------------------------------------------
+    def in_bounds(self, south, west, north, east, rows=None):
+        """사각형 범위 안의 행 번호 (원래 순서, rows를 주면 그 행들 중에서만)"""
+        box = (south, west, north, east)
+        positions = self._in_box(self._box_positions(*box), *box, rows=rows)
+        return np.sort(self._ids[positions])
+
+    def cell_counts(self, south, west, north, east, factor=1, rows=None):
+        """
+        사각형 범위 안의 점을 격자 칸별로 묶은 요약 (축소 지도에서 점 대신 표시)
+
+        Args:
+            factor (int): 가로세로 factor칸씩을 한 묶음으로 (축소할수록 크게)
+            rows (ndarray): 이 행들만 셈 (None이면 전체)
+
+        Returns:
+            tuple: (묶음별 평균 위도, 평균 경도, 점 개수) ndarray
+        """
+        box = (south, west, north, east)
+        positions = self._in_box(self._box_positions(*box), *box, rows=rows)
+        cells = self._cells[positions]
+        if factor > 1:
+            rows, cols = cells // self._n_cols // factor, cells % self._n_cols // factor
+            cells = rows * (self._n_cols // factor + 1) + cols
+        _, inverse, counts = np.unique(cells, return_inverse=True, return_counts=True)
+        lats = np.bincount(inverse, weights=self._lats[positions]) / counts
+        lons = np.bincount(inverse, weights=self._lons[positions]) / counts
+        return lats, lons, counts
+
+    def within_km(self, lat, lon, km):
+        """
+        기준점에서 km 안의 행 번호와 거리 (가까운 순)
+
+        Returns:
+            tuple: (행 번호 ndarray, 거리 km ndarray)
+        """
+        dlat = km / KM_PER_DEGREE
+        dlon = km / (KM_PER_DEGREE * max(math.cos(math.radians(lat)), 1e-6))
+        positions = self._box_positions(lat - dlat, lon - dlon, lat + dlat, lon + dlon)
+        distances = haversine_km(lat, lon, self._lats[positions], self._lons[positions])
+        inside = distances <= km
+        positions, distances = positions[inside], distances[inside]
+        order = np.argsort(distances, kind="stable")
+        return self._ids[positions[order]], distances[order]
+
+    def nearest(self, lat, lon, n):
+        """
+        기준점에서 가장 가까운 n곳의 행 번호와 거리 (가까운 순)
+
+        한 칸 크기의 반경부터 두 배씩 넓혀 n곳 이상이 들어오면 멈춤
+        (반경 안에 n곳이 있으면 그 n곳이 전체에서도 가장 가까움)
+        """
+        n = min(n, len(self._ids))
+        if n <= 0:
+            return np.zeros(0, dtype="int64"), np.zeros(0)
+        km = self.cell_deg * KM_PER_DEGREE
+        span_km = (self._n_rows + self._n_cols) * self.cell_deg * KM_PER_DEGREE
+        while km < 2 * span_km:
+            ids, distances = self.within_km(lat, lon, km)
+            if len(ids) >= n:
+                return ids[:n], distances[:n]
+            km *= 2
+
+        # 기준점이 격자에서 아주 먼 경우: 전체 거리 계산
+        distances = haversine_km(lat, lon, self._lats, self._lons)
+        top = np.argpartition(distances, n - 1)[:n]
+        top = top[np.argsort(distances[top], kind="stable")]
+        return self._ids[top], distances[top]
@@ -0,0 +1,65 @@
+"""
+테스트 공통 설정
+페이지/도구 모듈은 저장소 최상위에 있으므로 최상위 경로를 임포트 경로에 넣고,
+테스트 중에는 metrics 파일을 쓰지 않습니다.
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("JINROUP_METRICS", "0")
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def university_frame():
+    """대학원본.xlsx를 변환한 DataFrame (캐시 파일을 만들지 않음, 테스트마다 복사해서 사용)"""
+    import univ_cache
+    return univ_cache.read_workbook()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="session")
+def streamlit_server():
+    """
+    테스트용 `streamlit run main.py` 서버 (websockets가 없으면 건너뜀)
+
+    Returns:
+        tuple: (Popen, 포트)
+    """
+    pytest.importorskip("websockets")
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(ROOT / "main.py"),
+         "--server.headless", "true", "--server.port", str(port)],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while True:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            break
+        except OSError:
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                pytest.fail("streamlit 서버가 시작되지 않았습니다")
+            time.sleep(0.3)
+    yield process, port
+    process.terminate()
+    try:
+        process.wait(10)
+    except subprocess.TimeoutExpired:
+        process.kill()
@@ -0,0 +1,64 @@
+"""adaptive_riasec 적응형 문항 선택 / 조기 종료"""
+
+import numpy as np
+import pytest
+
+import adaptive_riasec
+import page_registry
+
+
+@pytest.fixture(scope="module")
+def riasec():
+    return page_registry.get_page_module("riasec")
+
+
+@pytest.fixture(scope="module")
+def responses(riasec):
+    instrument = riasec.INSTRUMENT
+    codes = np.array([instrument.subscales.index(item.subscale) for item in instrument.items])
+    return adaptive_riasec.synthetic_responses(len(instrument), codes, 30, seed=5)
+
+
+def test_full_answers_give_actual_scores(riasec, responses):
+    plan = adaptive_riasec.AdaptivePlan(riasec.INSTRUMENT)
+    for row in responses:
+        answers = bytes(row.tolist())
+        estimate = plan.estimate(answers)
+        scores = riasec.INSTRUMENT.scores(answers)
+        assert estimate.answered == len(riasec.INSTRUMENT)
+        assert estimate.projected == scores
+        assert list(estimate.ranking[:3]) == riasec.get_top_types(scores)
+        assert estimate.confidence == 1.0
+        assert plan.next_item(answers) is None
+
+
+def test_first_items_cover_every_type(riasec):
+    plan = adaptive_riasec.AdaptivePlan(riasec.INSTRUMENT)
+    answers = bytearray(len(riasec.INSTRUMENT))
+    asked = []
+    for _ in range(plan.min_per_subscale * len(riasec.INSTRUMENT.subscales)):
+        item_id = plan.next_item(answers)
+        assert answers[item_id] == 0
+        asked.append(riasec.INSTRUMENT.items[item_id].subscale)
+        answers[item_id] = 3
+    for subscale in riasec.INSTRUMENT.subscales:
+        assert asked.count(subscale) == plan.min_per_subscale
+
+
+def test_stops_only_when_confident(riasec, responses):
+    plan = adaptive_riasec.AdaptivePlan(riasec.INSTRUMENT, confidence=0.9)
+    n_items = len(riasec.INSTRUMENT)
+    for row in responses.tolist():
+        answers = bytearray(n_items)
+        item_id = plan.next_item(answers)
+        while item_id is not None:
+            answers[item_id] = row[item_id]
+            item_id = plan.next_item(answers)
+        estimate = plan.estimate(answers)
+        assert estimate.answered == n_items or estimate.confidence >= 0.9
+
+
+def test_full_confidence_asks_everything(riasec, responses):
+    plan = adaptive_riasec.AdaptivePlan(riasec.INSTRUMENT, confidence=1.0)
+    result = adaptive_riasec.simulate(plan, responses[:5])
+    assert result['order'] == 1.0
@@ -0,0 +1,65 @@
+"""decision_batch 일괄 채점 / 보고서"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import decision_batch
+import page_registry
+
+
+@pytest.fixture(scope="module")
+def page():
+    return page_registry.get_page_module("career_decision")
+
+
+def responses(page, ids, seed=0):
+    scorer = decision_batch.DecisionScorer()
+    rng = np.random.default_rng(seed)
+    values = np.array(page.INSTRUMENT.scale.values)
+    frame = pd.DataFrame(values[rng.integers(0, len(values), (len(ids), len(scorer.item_columns)))],
+                         columns=scorer.item_columns)
+    frame.insert(0, '학번', ids)
+    return frame
+
+
+def test_batch_matches_result_page(page):
+    frame = responses(page, [f"S{i}" for i in range(30)], seed=1)
+    scorer = decision_batch.DecisionScorer()
+    scored = scorer.score(frame, frame['학번'].to_numpy())
+    for answers, row in zip(frame[scorer.item_columns].to_numpy(dtype="uint8"), scored.to_dict("records")):
+        result = page.compute_result(bytes(answers))
+        assert row['decision_score'] == result.decision_score
+        assert row['decision_level'] == result.level
+        for factor in scorer.factors:
+            assert row[factor] == result.subfactors[factor]
+            assert row[f"{factor}_level"] == result.categories[factor]
+
+
+def test_colliding_ids_get_separate_reports(page, tmp_path):
+    source = tmp_path / "responses.csv"
+    responses(page, ["a/b", "a_b", "a_b", "c"]).to_csv(source, index=False)
+    stats = decision_batch.run(source, tmp_path / "out", chunk_size=2)
+    assert stats['renamed'] == 2
+
+    summary = pd.read_csv(tmp_path / "out" / decision_batch.SUMMARY_FILE, dtype=str)
+    assert summary['report'].tolist() == ["reports/a_b.html", "reports/a_b-2.html", "reports/a_b-3.html",
+                                          "reports/c.html"]
+    for student_id, report in zip(summary['학번'], summary['report']):
+        assert f"<b>{student_id}</b>" in (tmp_path / "out" / report).read_text(encoding="utf-8")
+
+
+def test_resumed_run_keeps_report_names(page, tmp_path):
+    source = tmp_path / "responses.csv"
+    responses(page, ["a_b", "x", "a_b", "a/b"]).to_csv(source, index=False)
+    out = tmp_path / "out"
+    decision_batch.run(source, out, chunk_size=2)
+    first = pd.read_csv(out / decision_batch.SUMMARY_FILE, dtype=str)['report'].tolist()
+
+    # 첫 청크만 끝난 상태에서 다시 실행
+    done = decision_batch.read_done(out)
+    header_and_chunk = len(b"".join((out / decision_batch.SUMMARY_FILE).read_bytes().splitlines(True)[:3]))
+    decision_batch.write_done(out, dict(done, rows=2, summary_bytes=header_and_chunk))
+    stats = decision_batch.run(source, out, chunk_size=2)
+    assert stats['rows'] == 2
+    assert pd.read_csv(out / decision_batch.SUMMARY_FILE, dtype=str)['report'].tolist() == first
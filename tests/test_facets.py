@@ -0,0 +1,124 @@
+"""facets 조건 필터 색인 (pandas 불리언 마스크와 같은 결과인지)"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import facets
+
+
+@pytest.fixture(scope="module")
+def frame(university_frame):
+    return university_frame
+
+
+@pytest.fixture(scope="module")
+def index(frame):
+    return facets.FacetIndex(frame)
+
+
+def mask_rows(frame, selection, skip=None):
+    """pandas 불리언 마스크로 조건에 맞는 행 번호 (skip 열은 조건에서 뺌)"""
+    mask = pd.Series(True, index=frame.index)
+    for column, values in selection.items():
+        if column != skip and values:
+            mask &= frame[column].isin(values).to_numpy()
+    return np.flatnonzero(mask.to_numpy())
+
+
+def mask_counts(frame, selection, column):
+    """그 열을 뺀 나머지 조건에 맞는 행의 값별 개수"""
+    rows = mask_rows(frame, selection, skip=column)
+    counts = frame[column].iloc[rows].value_counts()
+    return {value: int(counts.get(value, 0)) for value in frame[column].cat.categories}
+
+
+def random_selections(index, n, seed):
+    """열마다 0~3개 값을 무작위로 고른 조건"""
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        selection = {}
+        for column in index.columns:
+            values = index.values[column]
+            picked = rng.choice(len(values), size=rng.integers(0, 4), replace=False)
+            selection[column] = [values[i] for i in picked]
+        yield selection
+
+
+SELECTIONS = [
+    {},
+    {'지역': ['서울']},
+    {'지역': ['서울', '부산'], '설립유형': ['국립']},
+    {'지역': ['제주'], '설립유형': ['사립'], '대학 유형': ['전문대학', '일반대학']},
+    {'설립유형': ['공립'], '대학 유형': ['방송통신대학교']},  # 교집합이 빈 조합
+    {'지역': [], '대학 유형': ['교육대학']},
+    {'지역': ['서울', '없는 지역']},  # 모르는 값은 무시
+]
+
+
+def test_columns_and_values(index, frame):
+    assert index.columns == facets.FACET_COLUMNS
+    assert index.size == len(frame)
+    for column in index.columns:
+        assert index.values[column] == tuple(frame[column].cat.categories)
+
+
+@pytest.mark.parametrize("selection", SELECTIONS)
+def test_rows_match_mask(index, frame, selection):
+    rows = index.rows(selection)
+    if not index.active(selection):
+        assert rows is None
+        return
+    np.testing.assert_array_equal(rows, mask_rows(frame, selection))
+
+
+@pytest.mark.parametrize("selection", SELECTIONS)
+def test_counts_exclude_own_column(index, frame, selection):
+    counts = index.counts(selection)
+    assert tuple(counts) == index.columns
+    for column in index.columns:
+        assert dict(counts[column]) == mask_counts(frame, selection, column)
+
+
+def test_own_column_keeps_other_values(index):
+    """서울을 골라도 지역 개수는 다른 지역까지 그대로, 다른 열 개수는 서울 안에서만"""
+    everything = index.counts({})
+    seoul = index.counts({'지역': ['서울']})
+    assert dict(seoul['지역']) == dict(everything['지역'])
+    assert sum(seoul['설립유형'].values()) == everything['지역']['서울']
+    assert sum(seoul['설립유형'].values()) < sum(everything['설립유형'].values())
+
+
+def test_random_combinations(index, frame):
+    for selection in random_selections(index, 200, seed=3):
+        rows = index.rows(selection)
+        expected = mask_rows(frame, selection)
+        if rows is None:
+            assert not any(selection.values()) and len(expected) == len(frame)
+        else:
+            np.testing.assert_array_equal(rows, expected)
+        counts = index.counts(selection)
+        for column in index.columns:
+            assert dict(counts[column]) == mask_counts(frame, selection, column)
+
+
+def test_cache_key_ignores_order(index):
+    first = index.rows({'지역': ['서울', '부산'], '설립유형': ['국립']})
+    second = index.rows({'설립유형': ['국립'], '지역': ['부산', '서울']})
+    assert first is second
+    assert not first.flags.writeable
+
+
+def test_plain_columns_and_missing_values():
+    """범주형이 아닌 열, 빈 값(NaN)은 어느 값에도 세지 않음, 표에 없는 열은 빠짐"""
+    frame = pd.DataFrame({
+        '지역': ['서울', '부산', None, '서울', '부산', '서울'],
+        '설립유형': ['사립', '국립', '사립', None, '사립', '국립'],
+    })
+    index = facets.FacetIndex(frame)
+    assert index.columns == ('지역', '설립유형')
+    selection = {'지역': ['서울'], '설립유형': ['사립', '국립']}
+    np.testing.assert_array_equal(index.rows(selection), [0, 5])
+    counts = index.counts(selection)
+    assert dict(counts['지역']) == {'부산': 2, '서울': 2}
+    assert dict(counts['설립유형']) == {'국립': 1, '사립': 1}
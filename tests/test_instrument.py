@@ -0,0 +1,118 @@
+"""instrument 채점 (진로결정 검사의 옛 손 계산식과 같은 점수인지)"""
+
+import numpy as np
+import pytest
+
+import page_registry
+
+
+@pytest.fixture(scope="module")
+def page():
+    return page_registry.get_page_module("career_decision")
+
+
+# ============================================================
+# 옛 계산식 (문항별 반복, 역채점 문항은 6 - 응답)
+# ============================================================
+
+def old_decision_level_score(page, answers):
+    total = 0
+    for question, answer in zip(page.DECISION_LEVEL_QUESTIONS, answers):
+        if not answer:
+            continue
+        total += (6 - answer) if question['reverse'] else answer
+    return round(total / (len(page.DECISION_LEVEL_QUESTIONS) * 5) * 100)
+
+
+def old_subfactor_scores(page, answers):
+    scores = {}
+    start = 0
+    for factor, questions in page.SUBFACTOR_QUESTIONS.items():
+        scores[factor] = round(sum(answers[start:start + len(questions)]) / (len(questions) * 5) * 100)
+        start += len(questions)
+    return scores
+
+
+def old_scores(page, answers):
+    answers = [int(value) for value in answers]
+    count = len(page.DECISION_LEVEL_QUESTIONS)
+    return old_decision_level_score(page, answers[:count]), old_subfactor_scores(page, answers[count:])
+
+
+def random_answers(page, n, seed, missing=0.0):
+    """응답자 x 문항 uint8 (missing 비율만큼 미응답 0)"""
+    rng = np.random.default_rng(seed)
+    values = np.array(page.INSTRUMENT.scale.values, dtype="uint8")
+    answers = values[rng.integers(0, len(values), (n, page.TOTAL_QUESTIONS))]
+    answers[rng.random(answers.shape) < missing] = 0
+    return answers
+
+
+def decision_answers(page, keyed):
+    """역채점 후 값(keyed) -> 진로결정 수준 문항 응답, 하위요인은 미응답"""
+    answers = bytearray(page.TOTAL_QUESTIONS)
+    for i, (question, value) in enumerate(zip(page.DECISION_LEVEL_QUESTIONS, keyed)):
+        answers[i] = 6 - value if question['reverse'] else value
+    return bytes(answers)
+
+
+# ============================================================
+# 테스트
+# ============================================================
+
+@pytest.mark.parametrize("missing", [0.0, 0.3])
+def test_percent_scores_match_old_formulas(page, missing):
+    for answers in random_answers(page, 300, seed=7, missing=missing):
+        assert page.calculate_scores(bytes(answers)) == old_scores(page, answers)
+        assert page.calculate_scores(answers) == old_scores(page, answers)
+
+
+@pytest.mark.parametrize("missing", [0.0, 0.3])
+def test_batch_percent_scores_match_old_formulas(page, missing):
+    answers = random_answers(page, 500, seed=11, missing=missing)
+    batch = page.INSTRUMENT.batch_percent_scores(answers)
+    subscales = page.INSTRUMENT.subscales
+    assert batch.shape == (len(answers), len(subscales))
+    for row, answer in zip(batch.tolist(), answers):
+        decision_score, subfactors = old_scores(page, answer)
+        expected = dict(subfactors, **{page.DECISION_LEVEL: decision_score})
+        assert dict(zip(subscales, row)) == expected
+
+
+def test_reverse_items_score_six_minus_answer(page):
+    instrument = page.INSTRUMENT
+    reverse = [q['reverse'] for q in page.DECISION_LEVEL_QUESTIONS]
+    assert any(reverse) and not all(reverse)
+    for value in instrument.scale.values:
+        answers = bytes([value] * page.TOTAL_QUESTIONS)
+        keyed = instrument.keyed(answers)
+        expected = [6 - value if flip else value for flip in reverse]
+        assert keyed[:len(reverse)].tolist() == expected
+        assert set(keyed[len(reverse):].tolist()) == {value}  # 하위요인은 역채점 없음
+    assert not instrument.keyed(bytes(page.TOTAL_QUESTIONS)).any()  # 미응답은 0 그대로
+
+
+# 10문항 x 5점 만점이라 점수는 원점수 x 2 (짝수)뿐: 홀수 경계는 판정 함수로 직접 확인
+@pytest.mark.parametrize("keyed, score, level", [
+    ([4, 2, 2, 1, 1, 1, 1, 1, 1, 1], 30, "결정 X 편안"),
+    ([4, 2, 2, 2, 1, 1, 1, 1, 1, 1], 32, "결정 X 불편안"),
+    ([5, 5, 2, 2, 2, 2, 2, 2, 2, 1], 50, "결정 X 불편안"),
+    ([5, 5, 2, 2, 2, 2, 2, 2, 2, 2], 52, "미결정 X 불편안"),
+    ([4] * 10, 80, "미결정 X 불편안"),
+    ([5] + [4] * 9, 82, "미결정 X 편안"),
+])
+def test_decision_level_boundaries_on_answers(page, keyed, score, level):
+    answers = decision_answers(page, keyed)
+    decision_score, _ = page.calculate_scores(answers)
+    assert decision_score == score == old_decision_level_score(page, answers)
+    assert page.compute_result(answers).level == level
+
+
+@pytest.mark.parametrize("score, level", [
+    (0, "결정 X 편안"), (30, "결정 X 편안"),
+    (31, "결정 X 불편안"), (50, "결정 X 불편안"),
+    (51, "미결정 X 불편안"), (80, "미결정 X 불편안"),
+    (81, "미결정 X 편안"), (100, "미결정 X 편안"),
+])
+def test_decision_level_result_boundaries(page, score, level):
+    assert page.get_decision_level_result(score)[0] == level
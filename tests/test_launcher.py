@@ -0,0 +1,18 @@
+"""launcher 워커 세션 수"""
+
+import launcher
+
+
+def test_sessions_from_before_restart_are_not_subtracted():
+    worker = launcher.Worker(0, 0)
+    old = [worker.session_opened() for _ in range(3)]
+    worker.schedule_restart("테스트")
+    assert worker.sessions == 0
+
+    new = worker.session_opened()
+    for generation in old:
+        worker.session_closed(generation)
+    assert worker.sessions == 1
+
+    worker.session_closed(new)
+    assert worker.sessions == 0
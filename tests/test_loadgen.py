@@ -0,0 +1,46 @@
+"""loadgen 시나리오 (실제 streamlit 서버에 접속)"""
+
+import asyncio
+import random
+
+import pytest
+
+import loadgen
+from conftest import free_port
+
+
+async def repeat_scenario(port, name, times):
+    stats = loadgen.LoadStats()
+    session = loadgen.StreamlitSession(f"ws://127.0.0.1:{port}/_stcore/stream", stats)
+    think = loadgen.ThinkTime(0, 0.6, 1.0)
+    await session.connect()
+    try:
+        for _ in range(times):
+            await loadgen.SCENARIOS[name](session, random.Random(0), think)
+    finally:
+        await session.close()
+    return stats
+
+
+@pytest.mark.parametrize("scenario", ["career", "riasec"])
+def test_same_session_repeats_a_test(streamlit_server, scenario):
+    """--duration처럼 한 세션이 같은 검사를 다시 해도 시작 버튼을 찾음"""
+    _, port = streamlit_server
+    stats = asyncio.run(repeat_scenario(port, scenario, 2))
+    assert stats.errors == 0
+    assert len(stats.latencies) > 2 * 40
+
+
+def test_repeated_elements_are_sent_by_reference(streamlit_server):
+    """브라우저처럼 캐시한 메시지 해시를 보내면 다시 그린 같은 요소는 참조로만 받음"""
+    _, port = streamlit_server
+    stats = asyncio.run(repeat_scenario(port, "university", 2))
+    assert stats.errors == 0
+    assert stats.cached_messages > 0
+
+
+def test_server_pid_is_the_listening_process(streamlit_server):
+    process, port = streamlit_server
+    assert loadgen.find_server_pids("127.0.0.1", port) == [process.pid]
+    # 포트에서 LISTEN 중인 프로세스가 없으면 다른 streamlit 프로세스를 고르지 않음
+    assert loadgen.find_server_pids("127.0.0.1", free_port()) == []
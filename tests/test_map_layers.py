@@ -0,0 +1,89 @@
+"""map_layers 기본 지도/동적 레이어"""
+
+import math
+import types
+
+import pytest
+
+import map_layers
+import page_registry
+import univ_store
+
+
+@pytest.fixture
+def store_with_missing_location(university_frame):
+    """한 학교의 위도가 빈 저장소 (검사를 거치지 않은 데이터)"""
+    df = university_frame.copy()
+    df.loc[5, '위도'] = float('nan')
+    return univ_store.UniversityStore(df, version="missing-location")
+
+
+@pytest.mark.parametrize("mode", map_layers.MODES)
+def test_base_map_skips_schools_without_location(store_with_missing_location, mode):
+    store = store_with_missing_location
+    base = map_layers.BaseMap(map_layers.BUILDERS[mode](store, (37.5665, 126.978), 11), mode=mode)
+    assert base.fig is not None
+    if base.script is not None:
+        assert "NaN" not in base.script
+
+
+def test_selection_layer_without_location(store_with_missing_location):
+    school = store_with_missing_location.records[5]
+    assert math.isnan(school.lat)
+    assert map_layers.selection_layer(school) is None
+    assert map_layers.selection_layer(store_with_missing_location.records[0]) is not None
+
+
+@pytest.mark.parametrize("count", [1, 150, 400, 5000])
+def test_small_maps_default_to_circles(count):
+    assert map_layers.choose_mode(count, 7) == map_layers.CIRCLES
+
+
+def test_markers_are_opt_in(monkeypatch):
+    monkeypatch.setattr(map_layers, "MARKER_LIMIT", 200)
+    assert map_layers.choose_mode(200, 7) == map_layers.MARKERS
+    assert map_layers.choose_mode(201, 7) == map_layers.CIRCLES
+
+
+@pytest.fixture
+def fast_path_cache():
+    map_layers._fast_path_available.cache_clear()
+    yield
+    map_layers._fast_path_available.cache_clear()
+
+
+@pytest.mark.parametrize("version, expected", [((0, 27), True), ((0, 15), False), ((0, 28), False), (None, False)])
+def test_fast_path_only_on_checked_versions(monkeypatch, fast_path_cache, version, expected):
+    monkeypatch.setattr(map_layers, "_installed_version", lambda package: version)
+    assert map_layers._fast_path_available() is expected
+
+
+def test_fallback_skips_unsupported_arguments(monkeypatch):
+    calls = []
+
+    def st_folium(fig, key=None, width=500, height=700, returned_objects=None, zoom=None, center=None,
+                  feature_group_to_add=None):
+        calls.append(dict(key=key, zoom=zoom, center=center))
+        return {"zoom": zoom}
+
+    monkeypatch.setattr(map_layers, "streamlit_folium", types.SimpleNamespace(st_folium=st_folium))
+    value = map_layers._show_map_fallback(
+        types.SimpleNamespace(fig=object()), "map", (37.5, 127.0), 11, [], 600, 400, None, None,
+    )
+    assert value == {"zoom": 11}
+    assert calls == [dict(key="map", zoom=11, center=(37.5, 127.0))]
+
+
+def test_warmed_store_is_a_cache_hit(university_frame, monkeypatch):
+    page = page_registry.get_page_module("university")
+    store = univ_store.UniversityStore(university_frame, version="warm-cache-hit")
+    built = []
+    for mode, build in map_layers.BUILDERS.items():
+        monkeypatch.setitem(map_layers.BUILDERS, mode,
+                            lambda *args, build=build: built.append(args) or build(*args))
+
+    page.warm_store(store)
+    assert len(built) == 1
+    base = page.page_base_map(store, None, map_layers.remote_client())
+    assert len(built) == 1
+    assert base is page.page_base_map(store)
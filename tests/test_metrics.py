@@ -0,0 +1,28 @@
+"""metrics Prometheus 파일 쓰기"""
+
+import threading
+
+import metrics
+
+
+def test_concurrent_prometheus_writes(monkeypatch, tmp_path):
+    monkeypatch.setattr(metrics, "METRICS_DIR", tmp_path)
+    metrics.record_timing("test.concurrent", 0.01)
+    errors = []
+
+    def write():
+        try:
+            for _ in range(50):
+                metrics._maybe_write_prometheus(force=True)
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert [path.name for path in tmp_path.iterdir()] == [metrics.PROM_FILE]
+    assert "test.concurrent" in (tmp_path / metrics.PROM_FILE).read_text(encoding="utf-8")
@@ -0,0 +1,37 @@
+"""name_search 오타 검색과 조건 필터"""
+
+import pytest
+
+import name_search
+
+
+@pytest.fixture(scope="session")
+def university_names(university_frame):
+    return university_frame['대학명'].dropna().astype(str).tolist()
+
+
+@pytest.fixture(scope="session")
+def large_index(university_names):
+    """대학 x 가상 학과 10만 행 (흔한 3-gram이 진짜 후보를 밀어내던 규모)"""
+    return name_search.NameIndex(name_search._synthetic_names(university_names, 100000))
+
+
+@pytest.mark.parametrize("query", ["한앙대학교", "한앙"])
+def test_fuzzy_finds_typo_in_large_index(large_index, query):
+    matches = large_index.search(query, limit=name_search.RESULT_LIMIT + 1)
+    assert matches.fuzzy
+    assert matches.names[0].startswith("한양대학교")
+
+
+def test_limit_applies_after_filter(university_names):
+    index = name_search.NameIndex(university_names)
+    everything = index.search("대학").names
+    allowed = set(everything[-10:])
+    matches = index.search("대학", limit=5, allowed=allowed)
+    assert matches.names == tuple(name for name in everything if name in allowed)[:5]
+
+
+def test_filtered_out_exact_match_is_not_fuzzy(university_names):
+    index = name_search.NameIndex(university_names)
+    matches = index.search("한양", limit=5, allowed={"서울대학교"})
+    assert matches == name_search.Matches((), False)
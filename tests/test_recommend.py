@@ -0,0 +1,69 @@
+"""recommend 유사도 추천"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+import page_registry
+import recommend
+
+
+@pytest.fixture(scope="module")
+def recommender():
+    riasec = page_registry.get_page_module("riasec")
+    return recommend.Recommender(recommend.default_catalog(riasec.JOBS_DATA, riasec.MAJORS_DATA))
+
+
+def test_flat_profile_is_not_ranked(recommender):
+    assert recommend.is_flat({letter: 24 for letter in recommend.TYPES})
+    assert recommender.recommend([24] * 6, "job") == ()
+
+
+def test_flat_profile_uses_fallback_code(recommender):
+    flat = recommender.recommend([24] * 6, "major", fallback="SEC")
+    assert flat == recommender.recommend(recommend.code_vector("SEC"), "major")
+    assert flat[0].code.startswith("S")
+
+
+@pytest.mark.parametrize("metric", recommend.METRICS)
+@pytest.mark.parametrize("kind", recommend.KINDS)
+def test_recommend_many_matches_recommend(recommender, kind, metric):
+    rng = np.random.default_rng(0)
+    scores = rng.integers(8, 41, (200, 6))
+    scores[:3] = 20
+    fallback = ["RIA", "", "C"] + ["RIA"] * 197
+    rows = recommender.recommend_many(scores, kind, 12, metric, fallback=fallback)
+    for profile, code, expected in zip(scores.tolist(), fallback, rows.tolist()):
+        single = recommender.recommend(profile, kind, 12, metric, fallback=code)
+        assert [item.name for item in single] == [recommender.catalog.names[row] for row in expected if row >= 0]
+
+
+def test_default_catalog_keeps_every_top_type(recommender):
+    riasec = page_registry.get_page_module("riasec")
+    assert not recommender.ranked
+    scores = {'R': 12, 'I': 38, 'A': 20, 'S': 30, 'E': 33, 'C': 15}
+    for kind, table in (("job", riasec.JOBS_DATA), ("major", riasec.MAJORS_DATA)):
+        sections = recommender.sections(scores, "IES", kind, 12)
+        assert [letter for letter, _ in sections] == ["I", "E", "S"]
+        for letter, items in sections:
+            assert [item.name for item in items] == list(table[letter])
+    result = riasec.compute_result(bytes([1] * 8 + [5] * 8 + [2] * 8 + [3] * 8 + [4] * 8 + [1] * 8))
+    third = result.top_types[2]
+    assert [item.name for item in result.jobs[2][1]] == list(riasec.JOBS_DATA[third])
+
+
+@pytest.mark.parametrize("metric", recommend.METRICS)
+def test_recommend_many_blocks_and_ties(monkeypatch, metric):
+    """코드만 있는 목록은 같은 벡터/같은 유사도가 많음 (블록 경계와 동점 보정까지 recommend와 같은 순서)"""
+    monkeypatch.setattr(recommend, "BLOCK_ROWS", 16)
+    codes = ["".join(combo) for combo in itertools.permutations(recommend.TYPES, 3)] * 2
+    catalog = recommend.Catalog([f"job-{i}" for i in range(len(codes))], ["job"] * len(codes),
+                                [recommend.code_vector(code) for code in codes])
+    recommender = recommend.Recommender(catalog + recommend.synthetic_catalog(300))
+    scores = np.random.default_rng(1).integers(8, 41, (300, 6))
+    scores[100:150] = scores[:50]  # 같은 점수의 학생
+    rows = recommender.recommend_many(scores, "job", 12, metric)
+    for profile, expected in zip(scores.tolist(), rows.tolist()):
+        single = recommender.recommend(profile, "job", 12, metric)
+        assert [item.name for item in single] == [recommender.catalog.names[row] for row in expected]
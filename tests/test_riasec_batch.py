@@ -0,0 +1,83 @@
+"""riasec_batch 일괄 채점 (웹 결과 페이지와 같은 기준)"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import page_registry
+import riasec_batch
+
+
+@pytest.fixture(scope="module")
+def riasec():
+    return page_registry.get_page_module("riasec")
+
+
+@pytest.fixture(scope="module")
+def responses(riasec):
+    rng = np.random.default_rng(3)
+    n_items = len(riasec.INSTRUMENT)
+    answers = rng.integers(1, 6, (40, n_items))
+    answers[0] = 3  # 모든 응답이 같은 평평한 프로필
+    return pd.DataFrame(answers, columns=[f"q{i + 1}" for i in range(n_items)])
+
+
+def joined(sections):
+    """결과 페이지 추천 구역 -> 일괄 채점 목록 문자열 (여러 구역에 나오는 항목은 한 번)"""
+    return riasec_batch.LIST_SEPARATOR.join(dict.fromkeys(item.name for _, items in sections for item in items))
+
+
+def test_batch_matches_result_page(riasec, responses):
+    scorer = riasec_batch.Scorer()
+    scored = scorer.score(responses)
+    for answers, row in zip(responses.to_numpy(dtype="uint8"), scored.itertuples()):
+        result = riasec.compute_result(bytes(answers))
+        assert [getattr(row, letter) for letter in scorer.types] == [result.scores[t] for t in scorer.types]
+        assert row.code == "".join(result.top_types)
+        assert row.jobs == joined(result.jobs)
+        assert row.majors == joined(result.majors)
+
+
+def test_ranked_catalog_matches_sections(riasec, responses, monkeypatch, tmp_path):
+    catalog = tmp_path / "catalog.csv"
+    pd.DataFrame({
+        'name': ["데이터엔지니어", "문화기획자", "임상심리사", "물류관리자"],
+        'kind': ["job", "job", "major", "major"],
+        'code': ["ICR", "AES", "SIA", "CER"],
+    }).to_csv(catalog, index=False)
+    monkeypatch.setenv("JINROUP_CATALOG", str(catalog))
+    scorer = riasec_batch.Scorer(recommend=5)
+    assert scorer.recommender.ranked
+    scored = scorer.score(responses)
+    for row in scored.itertuples():
+        scores = [getattr(row, letter) for letter in scorer.types]
+        for kind, column in (("job", row.jobs), ("major", row.majors)):
+            assert column == joined(scorer.recommender.sections(scores, row.code, kind, 5))
+    assert scored.jobs[0] != ""  # 평평한 프로필도 상위 3유형 코드로 추천
+
+
+def test_incomplete_counts_out_of_range_answers(riasec, responses, tmp_path):
+    frame = responses.astype("float64")
+    frame.iloc[1, 0] = float("nan")   # 빈 칸
+    frame.iloc[2, 5] = 9              # 범위 밖
+    frame.iloc[3, 7] = 2.5            # 정수가 아님
+    frame.iloc[4, :] = 0              # 전부 범위 밖
+    source = tmp_path / "responses.csv"
+    frame.to_csv(source, index=False)
+    stats = riasec_batch.run(source, tmp_path / "scores.csv", chunk_size=16)
+    assert stats['rows'] == len(frame)
+    assert stats['incomplete'] == 4
+
+
+def test_default_catalog_throughput(riasec):
+    """기본 목록은 홀랜드 코드별 문자열을 미리 만들어 두므로 10만 행 채점이 1초 안 (측정값 약 0.15초)"""
+    n_items = len(riasec.INSTRUMENT)
+    frame = pd.DataFrame(np.random.default_rng(0).integers(1, 6, (100_000, n_items)),
+                         columns=[f"q{i + 1}" for i in range(n_items)])
+    scorer = riasec_batch.Scorer()
+    scorer.score(frame.head(10))
+    start = time.perf_counter()
+    scorer.score(frame)
+    assert time.perf_counter() - start < 1.0
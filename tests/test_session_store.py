@@ -0,0 +1,77 @@
+"""session_store 검사 상태 / 위젯 키 정리 / 세션 크기"""
+
+import pytest
+
+import session_store
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """st.session_state 대신 dict (세션 하나)"""
+    state = {}
+    monkeypatch.setattr(session_store.st, "session_state", state)
+    return state
+
+
+def test_answers_round_trip(session):
+    state = session_store.get_state(session_store.RIASEC, 48)
+    assert session[session_store.RIASEC] is state
+    assert state.answer(3) is None
+    state.set_answer(3, 5)
+    state.set_answer(47, 1)
+    assert (state.answer(3), state.answer(47)) == (5, 1)
+    assert state.answered_count() == 2
+    assert bytes(state.answers) == bytes(3) + b"\x05" + bytes(43) + b"\x01"
+    assert session_store.get_state(session_store.RIASEC, 48) is state  # 다시 실행해도 같은 객체
+
+
+def test_item_count_change_starts_over(session):
+    state = session_store.get_state(session_store.CAREER_DECISION, 40, phase="part1")
+    state.set_answer(0, 4)
+    fresh = session_store.get_state(session_store.CAREER_DECISION, 41, phase="part1")
+    assert fresh is not state and fresh.answered_count() == 0
+
+
+def test_restart(session):
+    state = session_store.get_state(session_store.CAREER_DECISION, 40, phase="part1")
+    answers = state.answers
+    state.page, state.phase, state.current = 'result', 'part2', 39
+    state.answers[:] = b"\x03" * 40
+    state.notice, state.order = "안내", bytearray(b"\x01\x02")
+    state.reset(phase="part1")
+    assert (state.page, state.phase, state.current, state.notice, state.order) == ('intro', 'part1', 0, None, None)
+    assert state.answers is answers and state.answered_count() == 0
+    assert state.pop_notice() is None
+
+
+def test_prune_keeps_only_current_widget(session):
+    namespace = session_store.RIASEC
+    for item_id in range(5):
+        session[session_store.widget_key(namespace, item_id)] = 3
+    session[session_store.widget_key(session_store.CAREER_DECISION, 0)] = 2
+    session["selected_name"] = "한양대학교"
+    current = session_store.widget_key(namespace, 4)
+    session_store.prune_widget_keys(namespace, keep=current)
+    assert sorted(session) == sorted([current, session_store.widget_key(session_store.CAREER_DECISION, 0),
+                                      "selected_name"])
+
+
+def test_session_bytes_smaller_than_dict_layout(session, monkeypatch):
+    # 이전 구조: 검사마다 응답 dict + 현재 문항/페이지 키 + 문항마다 남는 위젯 키
+    session.update({
+        'riasec_page': 'result',
+        'riasec_current_question': 47,
+        'riasec_answers': {i: (i % 5) + 1 for i in range(48)},
+        **{f"riasec_q{i}": "보통이다" for i in range(48)},
+    })
+    before, _ = session_store.session_bytes()
+
+    session.clear()
+    state = session_store.get_state(session_store.RIASEC, 48)
+    state.page, state.current = 'result', 47
+    for i in range(48):
+        state.set_answer(i, (i % 5) + 1)
+    session[session_store.widget_key(session_store.RIASEC, 47)] = 3
+    after, per_key = session_store.session_bytes()
+    assert set(per_key) == {session_store.RIASEC, session_store.widget_key(session_store.RIASEC, 47)}
+    assert after * 4 < before
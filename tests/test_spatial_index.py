@@ -0,0 +1,133 @@
+"""spatial_index 격자 색인 (전체 haversine 계산과 같은 결과인지)"""
+
+import numpy as np
+import pytest
+
+import spatial_index
+
+
+@pytest.fixture(scope="module")
+def points(university_frame):
+    return university_frame['위도'].to_numpy(), university_frame['경도'].to_numpy()
+
+
+@pytest.fixture(scope="module")
+def index(points):
+    return spatial_index.GridIndex(*points)
+
+
+def brute_within(lats, lons, lat, lon, km):
+    """전체 행 거리 계산 -> {행 번호: 거리}"""
+    distances = spatial_index.haversine_km(lat, lon, lats, lons)
+    return {i: d for i, d in enumerate(distances.tolist()) if d <= km}
+
+
+def assert_nearest(index, lats, lons, lat, lon, n):
+    """가까운 n곳: 거리는 전체 계산의 앞 n개와 같고, n번째보다 가까운 행은 모두 포함 (같은 거리끼리는 순서 무관)"""
+    ids, distances = index.nearest(lat, lon, n)
+    everything = spatial_index.haversine_km(lat, lon, lats, lons)
+    expected = np.sort(everything)[:n]
+    assert len(ids) == len(expected)
+    np.testing.assert_array_equal(distances, expected)
+    np.testing.assert_array_equal(everything[ids], distances)
+    assert len(set(ids.tolist())) == len(ids)
+    if len(ids):
+        closer = np.flatnonzero(everything < distances[-1])
+        assert set(closer.tolist()) <= set(ids.tolist())
+
+
+# ============================================================
+# 실제 대학 좌표
+# ============================================================
+
+QUERIES = [(37.5665, 126.9780), (35.1796, 129.0756), (36.3504, 127.3845), (33.4996, 126.5312), (38.2, 128.6)]
+
+
+@pytest.mark.parametrize("lat, lon", QUERIES)
+@pytest.mark.parametrize("km", [0.5, 3, 10, 40, 150])
+def test_within_km_matches_brute_force(index, points, lat, lon, km):
+    ids, distances = index.within_km(lat, lon, km)
+    expected = brute_within(*points, lat, lon, km)
+    assert dict(zip(ids.tolist(), distances.tolist())) == expected
+    assert len(ids) == len(expected)
+    assert (np.diff(distances) >= 0).all()
+
+
+@pytest.mark.parametrize("lat, lon", QUERIES)
+@pytest.mark.parametrize("n", [1, 5, 30, 200])
+def test_nearest_matches_brute_force(index, points, lat, lon, n):
+    assert_nearest(index, *points, lat, lon, n)
+
+
+def test_nearest_from_each_university(index, points):
+    """자기 자신(거리 0)이 첫 번째, 같은 좌표의 다른 캠퍼스가 있어도 결과 개수는 n"""
+    lats, lons = points
+    for row in range(0, len(lats), 7):
+        ids, distances = index.nearest(lats[row], lons[row], 4)
+        assert distances[0] == 0 and row in ids[distances == 0]
+        assert_nearest(index, lats, lons, lats[row], lons[row], 4)
+
+
+def test_nearest_radius_doubles(index, points):
+    """처음 반경(한 칸) 안에 점이 없는 먼 바다: 반경을 여러 번 넓혀야 함"""
+    lat, lon = 34.0, 128.0
+    first_km = index.cell_deg * spatial_index.KM_PER_DEGREE
+    assert len(index.within_km(lat, lon, first_km)[0]) == 0
+    ids, distances = index.nearest(lat, lon, 10)
+    assert distances[0] > 4 * first_km
+    assert_nearest(index, *points, lat, lon, 10)
+
+
+def test_nearest_far_outside_grid(index, points):
+    """격자에서 아주 먼 기준점은 전체 거리 계산으로"""
+    assert_nearest(index, *points, 0.0, 0.0, 3)
+
+
+def test_nearest_more_than_points(index, points):
+    lats, lons = points
+    ids, distances = index.nearest(37.5, 127.0, len(lats) + 50)
+    assert sorted(ids.tolist()) == list(range(len(lats)))
+    assert_nearest(index, lats, lons, 37.5, 127.0, len(lats) + 50)
+    assert len(index.nearest(37.5, 127.0, 0)[0]) == 0
+
+
+def test_in_bounds_matches_mask(index, points):
+    lats, lons = points
+    for south, west, north, east in [(37.4, 126.8, 37.7, 127.2), (35.0, 128.8, 35.3, 129.2), (30, 120, 40, 135)]:
+        mask = (lats >= south) & (lats <= north) & (lons >= west) & (lons <= east)
+        np.testing.assert_array_equal(index.in_bounds(south, west, north, east), np.flatnonzero(mask))
+
+
+# ============================================================
+# 칸 경계 위의 점
+# ============================================================
+
+@pytest.fixture(scope="module")
+def lattice():
+    """0.1도 격자 꼭짓점마다 점 하나 (모든 점이 칸 경계 위) + 좌표 없는 행"""
+    lat_steps, lon_steps = np.meshgrid(np.arange(6), np.arange(6), indexing="ij")
+    lats = np.append(37.0 + lat_steps.ravel() / 10, np.nan)
+    lons = np.append(127.0 + lon_steps.ravel() / 10, 127.2)
+    return lats, lons
+
+
+def test_cell_border_points(lattice):
+    lats, lons = lattice
+    index = spatial_index.GridIndex(lats, lons)
+    assert len(index) == len(lats) - 1  # NaN 행은 색인하지 않음
+    valid = np.isfinite(lats)
+    for row in np.flatnonzero(valid)[::5]:
+        lat, lon = lats[row], lons[row]
+        # 이웃 꼭짓점까지 정확히 한 칸 거리: 경계 칸의 점이 빠지면 안 됨
+        km = float(spatial_index.haversine_km(lat, lon, lats[row:row + 1] + 0.1, lons[row:row + 1])[0])
+        for radius in (km, km * 1.5, km * 3):
+            ids, distances = index.within_km(lat, lon, radius)
+            expected = {i: d for i, d in brute_within(lats, lons, lat, lon, radius).items() if valid[i]}
+            assert dict(zip(ids.tolist(), distances.tolist())) == expected
+        ids, distances = index.nearest(lat, lon, 9)
+        expected = np.sort(spatial_index.haversine_km(lat, lon, lats[valid], lons[valid]))[:9]
+        np.testing.assert_array_equal(distances, expected)
+        # 경계가 꼭짓점에 딱 맞는 사각형
+        south, west = lat - 0.1, lon - 0.1
+        mask = valid & (lats >= south) & (lats <= lat) & (lons >= west) & (lons <= lon)
+        np.testing.assert_array_equal(index.in_bounds(south, west, lat, lon), np.flatnonzero(mask))
@@ -0,0 +1,68 @@
+"""tile_server 앱 설정 (바인딩 주소, 브라우저에 넘기는 타일 주소)"""
+
+import types
+
+import pytest
+
+import map_layers
+import tile_server
+
+
+@pytest.fixture
+def started(monkeypatch):
+    """start_background 대신 넘겨받은 인자만 기록"""
+    calls = []
+    monkeypatch.setattr(tile_server, "start_background", lambda path, **kwargs: calls.append(kwargs) or True)
+    monkeypatch.setattr(tile_server, "_warned_ports", set())
+    for name in ("JINROUP_TILES", "JINROUP_TILE_URL", "JINROUP_TILE_PORT", "JINROUP_TILE_UPSTREAM"):
+        monkeypatch.delenv(name, raising=False)
+    return calls
+
+
+def test_no_settings_uses_default_tiles(started):
+    assert tile_server.map_tiles() == {}
+    assert started == []
+
+
+def test_default_url_binds_loopback_and_warns(started, monkeypatch, capsys):
+    monkeypatch.setenv("JINROUP_TILES", "tiles/")
+    monkeypatch.setenv("JINROUP_TILE_PORT", "9999")
+    assert tile_server.map_tiles()['tiles'] == "http://localhost:9999/{z}/{x}/{y}.png"
+    assert started[0]['host'] == tile_server.DEFAULT_HOST == "127.0.0.1"
+    assert "JINROUP_TILE_URL" in capsys.readouterr().out
+
+    tile_server.map_tiles()
+    assert capsys.readouterr().out == ""  # 경고는 한 번만
+
+
+def test_default_url_is_not_given_to_remote_clients(started, monkeypatch):
+    monkeypatch.setenv("JINROUP_TILES", "tiles/")
+    assert tile_server.map_tiles(remote=True) == {}
+
+
+def test_configured_url_binds_all_interfaces(started, monkeypatch):
+    monkeypatch.setenv("JINROUP_TILES", "tiles/")
+    monkeypatch.setenv("JINROUP_TILE_URL", "http://school-server:8765/{z}/{x}/{y}.png")
+    assert tile_server.map_tiles(remote=True)['tiles'] == "http://school-server:8765/{z}/{x}/{y}.png"
+    assert started[0]['host'] == tile_server.PUBLIC_HOST
+
+
+def test_make_server_defaults_to_loopback(tmp_path):
+    server = tile_server.make_server(tile_server.DirectoryTiles(tmp_path), port=0)
+    try:
+        assert server.server_address[0] == "127.0.0.1"
+    finally:
+        server.server_close()
+
+
+@pytest.mark.parametrize("address, remote", [
+    (None, False),
+    ("127.0.0.1", False),
+    ("::1", False),
+    ("::ffff:127.0.0.1", False),
+    ("192.168.0.12", True),
+    ("2001:db8::1", True),
+])
+def test_remote_client(monkeypatch, address, remote):
+    monkeypatch.setattr(map_layers, "st", types.SimpleNamespace(context=types.SimpleNamespace(ip_address=address)))
+    assert map_layers.remote_client() is remote
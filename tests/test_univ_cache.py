@@ -0,0 +1,71 @@
+"""univ_cache 형식 검사와 dataset_watcher 교체"""
+
+import pytest
+
+import dataset_watcher
+import map_layers
+import univ_cache
+import univ_store
+
+
+def write_workbook(df, path):
+    df.to_excel(path, index=False)
+    return path
+
+
+def load_store(path):
+    """3.py build_store와 같은 묶음 (캐시 파일 없이)"""
+    return univ_store.UniversityStore(univ_cache.read_workbook(path), version=univ_cache.source_digest(path))
+
+
+def render_every_mode(store):
+    for mode in map_layers.MODES:
+        map_layers.BaseMap(map_layers.BUILDERS[mode](store, (37.5665, 126.978), 11), mode=mode)
+
+
+def test_partial_missing_coordinates_reported(university_frame, tmp_path, capsys):
+    df = university_frame.copy()
+    df.loc[5, '위도'] = None
+    df.loc[7, '경도'] = None
+    source = write_workbook(df, tmp_path / "대학.xlsx")
+    loaded = univ_cache.read_workbook(source)
+    assert len(loaded) == len(df)
+    assert "학교 2곳은 지도에 표시하지 않습니다" in capsys.readouterr().err
+    assert univ_cache.missing_locations(university_frame) is None
+
+
+def test_all_missing_coordinates_rejected(university_frame):
+    df = university_frame.copy()
+    df['위도'] = float('nan')
+    with pytest.raises(univ_cache.SchemaError, match="모두 비어"):
+        univ_cache.validate_values(df)
+
+
+def test_watcher_installs_version_with_missing_coordinates(university_frame, tmp_path):
+    source = write_workbook(university_frame, tmp_path / "대학.xlsx")
+    watcher = dataset_watcher.DatasetWatcher(source, load_store, warm=render_every_mode, interval=60)
+    first = watcher.load_initial()
+
+    df = university_frame.copy()
+    df.loc[5, '위도'] = None
+    write_workbook(df, source)
+    assert watcher.reload() is True
+    store = watcher.current()
+    assert store is not first
+    school = store.records[5]
+    assert store.get(school.name) is school
+    assert not map_layers.has_location(school)
+    assert all(neighbor is not school for neighbor, _ in store.nearest(37.5665, 126.978, len(store)))
+
+
+def test_watcher_keeps_version_when_new_file_has_no_coordinates(university_frame, tmp_path):
+    source = write_workbook(university_frame, tmp_path / "대학.xlsx")
+    watcher = dataset_watcher.DatasetWatcher(source, load_store, interval=60)
+    first = watcher.load_initial()
+
+    df = university_frame.copy()
+    df['경도'] = None
+    write_workbook(df, source)
+    assert watcher.reload() is False
+    assert watcher.current() is first
+    assert watcher.last_error.startswith("SchemaError")
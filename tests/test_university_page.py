@@ -0,0 +1,28 @@
+"""3.py 대학 정보 페이지 (AppTest로 일부 구역만 실행)"""
+
+from streamlit.testing.v1 import AppTest
+
+from conftest import ROOT
+
+NEARBY_SCRIPT = f"""
+import sys
+sys.path.insert(0, {str(ROOT)!r})
+import univ_cache
+import univ_store
+import page_registry
+
+page = page_registry.get_page_module("university")
+df = univ_cache.read_workbook()
+# 서울 시청에서 가장 가까운 두 학교를 같은 이름으로
+near = df.index[((df['위도'] - 37.5665) ** 2 + (df['경도'] - 126.978) ** 2).argsort()[:2]]
+df.loc[near, '대학명'] = "같은이름대학교"
+page.initialize_session_state()
+page.show_nearby_section(univ_store.UniversityStore(df, version="duplicate-names"))
+"""
+
+
+def test_nearby_buttons_with_duplicate_names():
+    app = AppTest.from_string(NEARBY_SCRIPT, default_timeout=60).run()
+    assert not app.exception
+    labels = [button.label for button in app.button]
+    assert sum(label.startswith("같은이름대학교") for label in labels) == 2
@@ -0,0 +1,427 @@
+"""
+지도 타일 로컬 캐시 / 오프라인 타일 서버
+지도는 기본으로 OpenStreetMap 공개 타일 서버에서 배경 타일을 받는데, 학교망에서는 첫 화면이 느리고
+인터넷이 없는 실습실에서는 아예 배경이 나오지 않습니다. 앱에서 쓰는 확대 수준(11~15)의 타일을
+미리 받아 두고(디렉터리 {z}/{x}/{y}.png 또는 MBTiles 파일) 작은 HTTP 서버로 제공합니다.
+표준 라이브러리만 사용합니다.
+
+- 미리 받기: 11~12는 한국 전체, 13~15(학교를 고르면 15로 확대)는 대학 주변 타일만
+  (한국 전체의 15 수준은 수십만 장이라 공개 서버의 대량 다운로드 정책에 어긋남)
+- 공개 서버 사용 정책에 따라 User-Agent를 밝히고 한 장씩 간격을 두고 받음
+  (대량으로 받을 때는 --upstream으로 허용된 타일 제공자를 지정)
+- 앱: JINROUP_TILES를 지정하면 처음 지도를 그릴 때 백그라운드 스레드로 타일 서버를 띄우고
+  folium.Map이 그 주소를 쓰도록 함 (map_layers)
+- JINROUP_TILE_URL이 없으면 주소가 localhost라 이 컴퓨터의 브라우저만 쓸 수 있으므로 서버도 127.0.0.1에만 열고,
+  다른 컴퓨터에서 접속한 세션에는 로컬 타일 대신 기본 OpenStreetMap 타일을 씀
+  (launcher.py 뒤에서는 모든 접속이 이 컴퓨터에서 온 것으로 보이므로 JINROUP_TILE_URL을 지정)
+- JINROUP_TILE_UPSTREAM을 함께 지정하면 디렉터리에 없는 타일은 받아서 저장한 뒤 제공 (캐시)
+
+사용법:
+    python tile_server.py prefetch tiles/                 # 디렉터리로 받기
+    python tile_server.py prefetch tiles.mbtiles          # MBTiles 파일로 받기
+    python tile_server.py prefetch tiles/ --dry-run       # 받을 타일 수만 출력
+    python tile_server.py serve tiles/ --port 8765        # 타일 서버만 실행
+    JINROUP_TILES=tiles/ streamlit run main.py            # 앱 지도가 로컬 타일 사용
+
+설정 (환경 변수):
+    JINROUP_TILES           타일 디렉터리 또는 .mbtiles 파일
+    JINROUP_TILE_PORT       앱이 띄우는 타일 서버 포트 (기본 8765)
+    JINROUP_TILE_URL        브라우저가 쓸 타일 주소 템플릿 (기본 http://localhost:<포트>/{z}/{x}/{y}.png,
+                            다른 컴퓨터에서 접속하는 경우 서버 주소로 지정하면 타일 서버를 0.0.0.0에 염 /
+                            JINROUP_TILES 없이 지정하면 이미 떠 있는 다른 타일 서버를 사용)
+    JINROUP_TILE_UPSTREAM   없는 타일을 받아 올 원본 주소 템플릿 (지정하지 않으면 오프라인)
+    JINROUP_TILE_ATTR       지도 오른쪽 아래 출처 표시 (기본 OpenStreetMap)
+"""
+
+import argparse
+import math
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+OSM_URL = "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
+OSM_ATTR = '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors'
+USER_AGENT = "jinroup-tile-cache/1.0 (offline school map)"
+
+KOREA_BOUNDS = (33.0, 124.5, 38.7, 131.0)  # (남, 서, 북, 동) 제주~휴전선, 서해~울릉도
+MIN_ZOOM, MAX_ZOOM = 11, 15               # 3.py DEFAULT_ZOOM ~ 학교 선택 시 확대 수준
+DETAIL_ZOOM = 13                          # 이 수준부터는 대학 주변 타일만 받음
+DETAIL_RADIUS = 2                         # 대학 주변 가로세로 ±칸 (1000x600 지도 한 화면)
+
+REQUEST_INTERVAL = 0.5   # 공개 서버에 보내는 요청 간격(초)
+REQUEST_TIMEOUT = 15.0
+DEFAULT_PORT = 8765
+DEFAULT_HOST = "127.0.0.1"   # 기본 주소(localhost)로는 다른 컴퓨터가 접속할 수 없으므로 외부에 열지 않음
+PUBLIC_HOST = "0.0.0.0"      # JINROUP_TILE_URL로 서버 주소를 알려 준 경우
+CACHE_SECONDS = 7 * 24 * 3600
+
+_TILE_PATH = re.compile(r"^/(\d+)/(\d+)/(\d+)\.png$")
+_server_lock = threading.Lock()
+_server = None
+_warned_ports = set()
+
+
+def log(message):
+    print(f"[{time.strftime('%H:%M:%S')}] {message}", flush=True)
+
+
+# ============================================================
+# 타일 좌표 (웹 메르카토르, XYZ)
+# ============================================================
+def tile_xy(lat, lon, zoom):
+    """위도/경도가 들어 있는 타일 번호 (x, y)"""
+    n = 2 ** zoom
+    lat = max(min(lat, 85.0511), -85.0511)
+    x = int((lon + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tiles_in_bounds(bounds, zoom):
+    """사각형 범위에 걸친 타일 (z, x, y)"""
+    south, west, north, east = bounds
+    x0, y0 = tile_xy(north, west, zoom)
+    x1, y1 = tile_xy(south, east, zoom)
+    return {(zoom, x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)}
+
+
+def tiles_around(points, zoom, radius=DETAIL_RADIUS):
+    """각 점이 들어 있는 타일과 가로세로 ±radius칸 (z, x, y)"""
+    n = 2 ** zoom
+    tiles = set()
+    for lat, lon in points:
+        x, y = tile_xy(lat, lon, zoom)
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                if 0 <= x + dx < n and 0 <= y + dy < n:
+                    tiles.add((zoom, x + dx, y + dy))
+    return tiles
+
+
+def plan_tiles(points, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM, detail_zoom=DETAIL_ZOOM,
+               bounds=KOREA_BOUNDS, radius=DETAIL_RADIUS):
+    """
+    미리 받을 타일 목록 (확대 수준, x, y 순)
+
+    Args:
+        points (list): 대학 좌표 [(위도, 경도), ...]
+        detail_zoom (int): 이 수준부터는 points 주변만
+    """
+    tiles = set()
+    for zoom in range(min_zoom, max_zoom + 1):
+        if zoom < detail_zoom:
+            tiles |= tiles_in_bounds(bounds, zoom)
+        else:
+            tiles |= tiles_around(points, zoom, radius)
+    return sorted(tiles)
+
+
+def school_points():
+    """대학 정보 캐시의 좌표 목록 (좌표가 없는 학교 제외)"""
+    import univ_cache
+
+    df = univ_cache.load()
+    df = df[df['위도'].notna() & df['경도'].notna()]
+    return list(zip(df['위도'].tolist(), df['경도'].tolist()))
+
+
+# ============================================================
+# 타일 저장소
+# ============================================================
+class DirectoryTiles:
+    """{root}/{z}/{x}/{y}.png 디렉터리"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def _path(self, z, x, y):
+        return self.root / str(z) / str(x) / f"{y}.png"
+
+    def get(self, z, x, y):
+        try:
+            return self._path(z, x, y).read_bytes()
+        except OSError:
+            return None
+
+    def has(self, z, x, y):
+        return self._path(z, x, y).exists()
+
+    def put(self, z, x, y, data):
+        path = self._path(z, x, y)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)  # 서버가 쓰다 만 파일을 보내지 않도록
+
+    def close(self):
+        pass
+
+
+class MBTiles:
+    """
+    MBTiles 파일 (SQLite, 타일 행 번호는 TMS 방식이라 y를 뒤집어 저장)
+    스레드마다 연결을 따로 엶 (서버는 요청마다 스레드)
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        with self._connect() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS metadata (name TEXT, value TEXT)")
+            db.execute("CREATE TABLE IF NOT EXISTS tiles (zoom_level INTEGER, tile_column INTEGER,"
+                       " tile_row INTEGER, tile_data BLOB)")
+            db.execute("CREATE UNIQUE INDEX IF NOT EXISTS tile_index ON tiles"
+                       " (zoom_level, tile_column, tile_row)")
+            if db.execute("SELECT COUNT(*) FROM metadata").fetchone()[0] == 0:
+                db.executemany("INSERT INTO metadata VALUES (?, ?)", [
+                    ("name", "jinroup"), ("format", "png"), ("type", "baselayer"),
+                    ("minzoom", str(MIN_ZOOM)), ("maxzoom", str(MAX_ZOOM)),
+                    ("bounds", "{1},{0},{3},{2}".format(*KOREA_BOUNDS)),
+                    ("attribution", OSM_ATTR),
+                ])
+
+    def _connect(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = self._local.db = sqlite3.connect(self.path)
+        return db
+
+    def get(self, z, x, y):
+        row = self._connect().execute(
+            "SELECT tile_data FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+            (z, x, 2 ** z - 1 - y),
+        ).fetchone()
+        return row[0] if row else None
+
+    def has(self, z, x, y):
+        return self.get(z, x, y) is not None
+
+    def put(self, z, x, y, data):
+        with self._write_lock, self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?)",
+                       (z, x, 2 ** z - 1 - y, sqlite3.Binary(data)))
+
+    def close(self):
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+
+def open_tiles(path):
+    """경로가 .mbtiles이면 MBTiles, 아니면 디렉터리"""
+    path = Path(path)
+    return MBTiles(path) if path.suffix == ".mbtiles" else DirectoryTiles(path)
+
+
+def fetch_tile(url, z, x, y):
+    """원본 서버에서 타일 한 장 받기"""
+    request = urllib.request.Request(url.format(z=z, x=x, y=y, s="a"), headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+        return response.read()
+
+
+# ============================================================
+# 미리 받기
+# ============================================================
+def prefetch(tiles, plan, upstream=OSM_URL, interval=REQUEST_INTERVAL):
+    """
+    plan의 타일 중 없는 것만 받아서 저장 (중간에 끊겨도 다시 실행하면 이어서 받음)
+
+    Returns:
+        dict: {'fetched': 받은 수, 'skipped': 이미 있던 수, 'failed': 실패 수}
+    """
+    counts = {'fetched': 0, 'skipped': 0, 'failed': 0}
+    last_request = 0.0
+    for i, (z, x, y) in enumerate(plan, 1):
+        if tiles.has(z, x, y):
+            counts['skipped'] += 1
+            continue
+        wait = last_request + interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        last_request = time.monotonic()
+        try:
+            tiles.put(z, x, y, fetch_tile(upstream, z, x, y))
+            counts['fetched'] += 1
+        except (OSError, urllib.error.URLError) as e:
+            counts['failed'] += 1
+            log(f"타일 {z}/{x}/{y} 받기 실패: {e}")
+        if i % 500 == 0:
+            log(f"{i}/{len(plan)} (받음 {counts['fetched']}, 있음 {counts['skipped']}, 실패 {counts['failed']})")
+    return counts
+
+
+# ============================================================
+# 타일 서버
+# ============================================================
+class TileHandler(BaseHTTPRequestHandler):
+    """GET /{z}/{x}/{y}.png (없는 타일은 upstream이 있으면 받아서 저장, 없으면 404)"""
+
+    server_version = "JinroupTiles/1.0"
+    tiles = None
+    upstream = None
+
+    def do_GET(self):
+        match = _TILE_PATH.match(self.path.split("?", 1)[0])
+        if match is None:
+            self.send_error(404)
+            return
+        z, x, y = (int(v) for v in match.groups())
+        data = self.tiles.get(z, x, y)
+        if data is None and self.upstream:
+            try:
+                data = fetch_tile(self.upstream, z, x, y)
+                self.tiles.put(z, x, y, data)
+            except (OSError, urllib.error.URLError):
+                data = None
+        if data is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", f"public, max-age={CACHE_SECONDS}")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # 타일 요청마다 로그를 남기지 않음
+
+
+def make_server(tiles, host=DEFAULT_HOST, port=DEFAULT_PORT, upstream=None):
+    handler = type("BoundTileHandler", (TileHandler,), {'tiles': tiles, 'upstream': upstream})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_background(path, host=DEFAULT_HOST, port=DEFAULT_PORT, upstream=None):
+    """
+    타일 서버를 데몬 스레드로 시작 (프로세스당 한 번)
+
+    포트가 이미 쓰이고 있으면 같은 서버의 다른 워커(launcher.py)가 띄운 것으로 보고 그대로 씀
+
+    Returns:
+        bool: 이 프로세스에서 서버를 띄웠는지
+    """
+    global _server
+    with _server_lock:
+        if _server is not None:
+            return True
+        try:
+            server = make_server(open_tiles(path), host, port, upstream)
+        except OSError as e:
+            log(f"타일 서버를 띄우지 않음 (포트 {port}: {e}), 이미 떠 있는 서버를 사용")
+            return False
+        threading.Thread(target=server.serve_forever, name="tile-server", daemon=True).start()
+        _server = server
+        log(f"타일 서버 시작 ({path}, {host}:{port})")
+        return True
+
+
+# ============================================================
+# 앱 설정
+# ============================================================
+def _warn_local_url(port):
+    """기본 localhost 주소를 쓴다는 경고 (포트마다 한 번)"""
+    with _server_lock:
+        if port in _warned_ports:
+            return
+        _warned_ports.add(port)
+    log(f"JINROUP_TILE_URL이 없어 로컬 타일을 http://localhost:{port}로 제공합니다. "
+        "이 컴퓨터의 브라우저만 쓸 수 있고, 다른 컴퓨터에서 접속한 세션은 OpenStreetMap 타일을 씁니다.")
+
+
+def map_tiles(remote=False):
+    """
+    folium.Map에 넘길 타일 설정 {'tiles': 주소 템플릿, 'attr': 출처}
+    (설정이 없으면 빈 dict = folium 기본 OpenStreetMap)
+
+    Args:
+        remote (bool): 다른 컴퓨터에서 접속한 세션인지
+            (그 브라우저에서 localhost는 자기 자신이므로 기본 주소 대신 빈 dict)
+    """
+    source = os.environ.get("JINROUP_TILES")
+    url = os.environ.get("JINROUP_TILE_URL")
+    if not source and not url:
+        return {}
+    if source:
+        port = int(os.environ.get("JINROUP_TILE_PORT", DEFAULT_PORT))
+        host = PUBLIC_HOST if url else DEFAULT_HOST
+        start_background(source, host=host, port=port, upstream=os.environ.get("JINROUP_TILE_UPSTREAM"))
+        if not url:
+            _warn_local_url(port)
+            if remote:
+                return {}
+            url = f"http://localhost:{port}/{{z}}/{{x}}/{{y}}.png"
+    return {'tiles': url, 'attr': os.environ.get("JINROUP_TILE_ATTR", OSM_ATTR)}
+
+
+# ============================================================
+# 명령줄
+# ============================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="지도 타일 미리 받기 / 로컬 타일 서버")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    fetch = commands.add_parser("prefetch", help="앱에서 쓰는 타일 미리 받기")
+    fetch.add_argument("output", type=Path, help="타일 디렉터리 또는 .mbtiles 파일")
+    fetch.add_argument("--min-zoom", type=int, default=MIN_ZOOM)
+    fetch.add_argument("--max-zoom", type=int, default=MAX_ZOOM)
+    fetch.add_argument("--detail-zoom", type=int, default=DETAIL_ZOOM,
+                       help="이 수준부터는 대학 주변 타일만 (기본 %(default)s)")
+    fetch.add_argument("--radius", type=int, default=DETAIL_RADIUS, help="대학 주변 ±칸 수")
+    fetch.add_argument("--upstream", default=os.environ.get("JINROUP_TILE_UPSTREAM", OSM_URL),
+                       help="원본 타일 주소 템플릿")
+    fetch.add_argument("--interval", type=float, default=REQUEST_INTERVAL, help="요청 간격(초)")
+    fetch.add_argument("--dry-run", action="store_true", help="받을 타일 수만 출력")
+
+    serve = commands.add_parser("serve", help="타일 서버 실행")
+    serve.add_argument("source", type=Path, help="타일 디렉터리 또는 .mbtiles 파일")
+    serve.add_argument("--host", default=DEFAULT_HOST,
+                       help=f"다른 컴퓨터에서 받으려면 {PUBLIC_HOST} (기본 %(default)s)")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve.add_argument("--upstream", default=os.environ.get("JINROUP_TILE_UPSTREAM"),
+                       help="없는 타일을 받아 올 원본 주소 (지정하지 않으면 오프라인)")
+    args = parser.parse_args(argv)
+
+    if args.command == "prefetch":
+        plan = plan_tiles(school_points(), args.min_zoom, args.max_zoom, args.detail_zoom, radius=args.radius)
+        for zoom in range(args.min_zoom, args.max_zoom + 1):
+            print(f"  확대 {zoom:>2}: {sum(1 for z, _, _ in plan if z == zoom):>7}장")
+        print(f"  합계   : {len(plan):>7}장 (요청 간격 {args.interval}초 기준 최대 "
+              f"{len(plan) * args.interval / 3600:.1f}시간)")
+        if args.dry_run:
+            return 0
+        tiles = open_tiles(args.output)
+        try:
+            counts = prefetch(tiles, plan, args.upstream, args.interval)
+        finally:
+            tiles.close()
+        print(f"받음 {counts['fetched']}, 이미 있음 {counts['skipped']}, 실패 {counts['failed']}")
+        return 1 if counts['failed'] else 0
+
+    server = make_server(open_tiles(args.source), args.host, args.port, args.upstream)
+    log(f"타일 서버: http://{args.host}:{args.port}/{{z}}/{{x}}/{{y}}.png ({args.source})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""
+대학 정보 엑셀 -> 열 기반 캐시 파일
+openpyxl로 엑셀을 읽는 데 수백 ms가 걸리고 st.cache_data는 프로세스가 살아 있는 동안만 유효하므로,
+엑셀을 한 번 Parquet(pyarrow가 없으면 pickle) 파일로 변환해 두고 이후에는 그 파일을 읽습니다.
+
+- 캐시 파일 이름에 엑셀 내용의 sha256을 넣어, 엑셀이 바뀌면 자동으로 다시 만듦
+- 열 이름 앞뒤 공백 제거 ('홈페이지주소 ' -> '홈페이지주소')
+- '대학 유형', '지역', '설립유형'은 범주형(category), 위도/경도는 float64로 고정
+- 변환 전에 SCHEMA(필수 열, 좌표 범위 등)를 검사해 형식이 틀린 엑셀은 캐시로 만들지 않음 (SchemaError)
+- 위도/경도가 빈 학교는 거부하지 않고 경고만 출력 (검색/정보는 그대로, 지도와 가까운 대학에서만 빠짐)
+
+사용법:
+    python univ_cache.py              # 캐시 파일 생성 (배포/launcher 시작 시 실행)
+    python univ_cache.py --force      # 내용이 같아도 다시 생성
+"""
+
+import argparse
+import difflib
+import hashlib
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+
+BASE_DIR = Path(__file__).resolve().parent
+SOURCE_FILE = BASE_DIR / "대학원본.xlsx"
+CACHE_DIR = Path(os.environ.get("JINROUP_CACHE_DIR", BASE_DIR / ".cache"))
+
+# 변환 방식이 바뀌면 올려서 이전 캐시 파일을 무효화
+CACHE_VERSION = 3
+
+CATEGORICAL_COLUMNS = ('대학 유형', '지역', '설립유형')
+STRING_COLUMNS = ('대학명', '홈페이지주소', '대학 및 입시정보')
+FLOAT_COLUMNS = ('위도', '경도')
+
+# 변환 후 열 이름 -> 자료형 (엑셀에 반드시 있어야 하는 열)
+SCHEMA = {
+    **{column: "string" for column in STRING_COLUMNS},
+    **{column: "category" for column in CATEGORICAL_COLUMNS},
+    **{column: "float64" for column in FLOAT_COLUMNS},
+}
+# 좌표 허용 범위 (한국 전체를 넉넉히 포함)
+LAT_RANGE = (32.0, 39.5)
+LON_RANGE = (123.0, 132.5)
+
+
+class SchemaError(ValueError):
+    """엑셀 형식이 SCHEMA와 맞지 않음 (메시지에 문제 목록)"""
+
+
+# ============================================================
+# 형식 검사
+# ============================================================
+def validate_columns(df):
+    """필수 열이 모두 있는지 검사 (없으면 비슷한 이름의 열을 함께 알려 줌)"""
+    missing = [column for column in SCHEMA if column not in df.columns]
+    if not missing:
+        return
+    problems = []
+    for column in missing:
+        close = difflib.get_close_matches(column, [str(c) for c in df.columns], n=1, cutoff=0.6)
+        hint = f" (비슷한 열: '{close[0]}')" if close else ""
+        problems.append(f"필수 열 '{column}'이(가) 없습니다{hint}")
+    raise SchemaError("\n".join(problems))
+
+
+def validate_values(df):
+    """
+    변환이 끝난 DataFrame의 값 검사 (빈 목록, 빈 대학명, 모두 빈 좌표, 범위를 벗어난 좌표)
+    일부 학교만 좌표가 빈 것은 오류가 아님 (missing_locations로 알림)
+    """
+    problems = []
+    if df.empty:
+        problems.append("대학 목록이 비어 있습니다")
+    blank = df['대학명'].isna() | (df['대학명'] == '')
+    if blank.any():
+        problems.append(f"대학명이 빈 행이 {int(blank.sum())}개 있습니다")
+
+    lat, lon = df['위도'], df['경도']
+    if not df.empty and (lat.isna() | lon.isna()).all():
+        problems.append("위도/경도가 모두 비어 있습니다 (숫자가 아닌 값인지 확인)")
+    outside = lat.notna() & lon.notna() & ~(lat.between(*LAT_RANGE) & lon.between(*LON_RANGE))
+    if outside.any():
+        names = ", ".join(df.loc[outside, '대학명'].astype(str).head(3))
+        problems.append(f"좌표가 범위를 벗어난 행이 {int(outside.sum())}개 있습니다 (예: {names}, 위도/경도가 바뀌었는지 확인)")
+    if problems:
+        raise SchemaError("\n".join(problems))
+
+
+def missing_locations(df):
+    """
+    위도나 경도가 빈 학교 안내 (없으면 None)
+    이런 학교는 지도(map_layers.has_location)와 가까운 대학 목록에서만 빠짐
+    """
+    missing = df['위도'].isna() | df['경도'].isna()
+    if not missing.any():
+        return None
+    names = ", ".join(df.loc[missing, '대학명'].astype(str).head(3))
+    return f"위도/경도가 비어 있거나 숫자가 아닌 학교 {int(missing.sum())}곳은 지도에 표시하지 않습니다 (예: {names})"
+
+
+# ============================================================
+# 캐시 키
+# ============================================================
+def source_digest(source=SOURCE_FILE):
+    """엑셀 내용 + CACHE_VERSION의 sha256 (16진수)"""
+    h = hashlib.sha256(f"v{CACHE_VERSION}:".encode("ascii"))
+    with open(source, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _parquet_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def artifact_paths(source, digest):
+    """이 엑셀 내용에 해당하는 캐시 파일 후보 (Parquet, pickle 순)"""
+    stem = f"{Path(source).stem}-{digest[:16]}"
+    return CACHE_DIR / f"{stem}.parquet", CACHE_DIR / f"{stem}.pkl"
+
+
+# ============================================================
+# 변환
+# ============================================================
+def read_workbook(source=SOURCE_FILE):
+    """
+    엑셀을 읽어 열 이름과 자료형을 정리한 DataFrame 반환
+
+    Raises:
+        SchemaError: 필수 열이 없거나 값이 잘못된 경우
+    """
+    # URL 등이 숫자로 바뀌지 않도록 문자열 열은 str로 읽음 (열 이름 공백은 읽은 뒤 정리)
+    df = pd.read_excel(source, dtype=str)
+    df.columns = [str(c).strip() for c in df.columns]
+    validate_columns(df)
+
+    for column in FLOAT_COLUMNS:
+        df[column] = pd.to_numeric(df[column], errors="coerce").astype("float64")
+    for column in STRING_COLUMNS:
+        df[column] = df[column].str.strip()
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = df[column].str.strip().astype("category")
+    validate_values(df)
+    warning = missing_locations(df)
+    if warning:
+        print(f"경고 ({Path(source).name}): {warning}", file=sys.stderr)
+    return df
+
+
+def build(source=SOURCE_FILE, force=False):
+    """
+    캐시 파일 생성 (같은 내용의 캐시가 있으면 그대로 사용)
+
+    Returns:
+        Path: 캐시 파일 경로
+    """
+    digest = source_digest(source)
+    parquet_path, pickle_path = artifact_paths(source, digest)
+    if not force:
+        for path in (parquet_path, pickle_path):
+            if path.exists():
+                return path
+
+    df = read_workbook(source)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = parquet_path if _parquet_available() else pickle_path
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    if path.suffix == ".parquet":
+        df.to_parquet(tmp_path, index=False)
+    else:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)  # 다른 프로세스가 쓰다 만 파일을 읽지 않도록
+
+    _remove_stale(source, keep=path)
+    return path
+
+
+def _remove_stale(source, keep):
+    """같은 엑셀의 이전 내용으로 만든 캐시 파일 삭제"""
+    for path in CACHE_DIR.glob(f"{Path(source).stem}-*"):
+        if path != keep and path.suffix in (".parquet", ".pkl"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _read_artifact(path):
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def load(source=SOURCE_FILE):
+    """
+    대학 정보 DataFrame 반환 (캐시 파일이 없거나 읽을 수 없으면 만들어서 읽음)
+
+    Raises:
+        FileNotFoundError: 엑셀 파일이 없는 경우
+        SchemaError: 엑셀 형식이 잘못된 경우
+    """
+    return load_versioned(source)[0]
+
+
+def load_versioned(source=SOURCE_FILE):
+    """
+    load()와 같고 데이터 버전(엑셀 내용 해시)을 함께 반환
+
+    Returns:
+        tuple: (DataFrame, 버전 문자열)
+    """
+    digest = source_digest(source)
+    for path in artifact_paths(source, digest):
+        if path.exists():
+            try:
+                return _read_artifact(path), digest
+            except Exception:
+                break  # 깨진 캐시 -> 다시 생성
+    return _read_artifact(build(source, force=True)), digest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대학 정보 엑셀을 열 기반 캐시 파일로 변환")
+    parser.add_argument("source", nargs="?", type=Path, default=SOURCE_FILE, help="엑셀 파일")
+    parser.add_argument("--force", action="store_true", help="내용이 같아도 다시 생성")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        path = build(args.source, force=args.force)
+    except SchemaError as e:
+        print(f"엑셀 형식 오류 ({args.source}):\n{e}", file=sys.stderr)
+        return 1
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    df = load(args.source)
+    load_seconds = time.perf_counter() - start
+
+    print(f"{path} ({path.stat().st_size / 1024:.0f} KB, {len(df)}행)")
+    print(f"생성 {build_seconds * 1000:.0f} ms · 읽기 {load_seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
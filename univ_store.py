@@ -0,0 +1,191 @@
+"""
+대학 정보 저장소
+캐시 파일에서 읽은 대학 목록의 링크 URL, 버튼/링크 문구, 지도 팝업 HTML을
+한 번에(열 단위 연산으로) 계산해 두고, 대학명 -> 대학 객체 사전을 만들어 둡니다.
+
+검색 결과 버튼, 지도 중심 이동, 마커 그리기는 모두 이 저장소를 읽기만 하므로
+rerun마다 DataFrame을 훑거나 행마다 URL을 다시 계산하지 않습니다.
+"""
+
+import facets
+import name_search
+import spatial_index
+from lazy_imports import lazy_import
+from page_registry import freeze
+
+pd = lazy_import("pandas")
+
+
+# ============================================================
+# 링크 종류별 문구
+# ============================================================
+ADMISSION = 'admission'   # '대학 및 입시정보' URL
+HOMEPAGE = 'homepage'     # '홈페이지주소' URL (입시정보가 없을 때)
+NO_LINK = 'none'          # 둘 다 없음
+
+# 링크 종류 -> (검색 결과 버튼 문구, 팝업 링크 문구)
+LINK_TEXT = freeze({
+    ADMISSION: ("대학 및 입시정보", "대학 및 입시정보 열기"),
+    HOMEPAGE: ("홈페이지", "홈페이지 열기"),
+    NO_LINK: ("정보 없음", "정보 링크 없음"),
+})
+
+
+class University:
+    """대학 한 곳의 표시용 정보 (row: 저장소의 행 번호, 같은 이름의 학교가 있어도 고유)"""
+    __slots__ = ('row', 'name', 'lat', 'lon', 'final_url', 'link_kind', 'popup_html')
+
+    def __init__(self, row, name, lat, lon, final_url, link_kind, popup_html):
+        self.row = row
+        self.name = name
+        self.lat = lat
+        self.lon = lon
+        self.final_url = final_url
+        self.link_kind = link_kind
+        self.popup_html = popup_html
+
+    @property
+    def button_label(self):
+        return LINK_TEXT[self.link_kind][0]
+
+    @property
+    def help_text(self):
+        """검색 결과 버튼 도움말"""
+        if self.link_kind == ADMISSION:
+            return f"{self.name} 입시 정보로 이동합니다."
+        if self.link_kind == HOMEPAGE:
+            return f"{self.name} 홈페이지로 이동합니다."
+        return "선택된 학교의 정보 URL이 없습니다."
+
+
+# ============================================================
+# 열 단위 계산
+# ============================================================
+def resolve_links(df):
+    """
+    행마다 최종 URL과 링크 종류 계산
+
+    1. '대학 및 입시정보'가 http로 시작하면 그 URL
+    2. 아니면 '홈페이지주소'가 비어 있지 않을 때 그 URL (http가 없으면 https:// 붙임)
+    3. 둘 다 없으면 None (링크 종류는 NO_LINK)
+
+    Returns:
+        tuple: (final_url Series, link_kind Series)
+    """
+    info = df['대학 및 입시정보'].fillna('').astype(str).str.strip()
+    home = df['홈페이지주소'].fillna('').astype(str).str.strip()
+
+    has_info = info.str.startswith('http')
+    has_home = ~has_info & (home != '')
+    home_url = home.where(home.str.startswith('http'), 'https://' + home)
+
+    final_url = info.where(has_info, home_url).astype(object).where(has_info | has_home, None)
+    link_kind = pd.Series(NO_LINK, index=df.index, dtype=object)
+    link_kind[has_info] = ADMISSION
+    link_kind[has_home] = HOMEPAGE
+    return final_url, link_kind
+
+
+def popup_html(names, final_url, link_kind):
+    """지도 마커 팝업 HTML (링크가 있으면 새 창 링크, 없으면 안내 문구)"""
+    link_text = link_kind.map({kind: text[1] for kind, text in LINK_TEXT.items()})
+    anchor = '<a href="' + final_url.fillna('') + '" target="_blank">' + link_text + '</a>'
+    return '<b>' + names + '</b><br><hr>' + anchor.where(final_url.notna(), link_text)
+
+
+# ============================================================
+# 저장소
+# ============================================================
+class UniversityStore:
+    """
+    대학 목록 (한 번 만들고 읽기만 함)
+
+    Attributes:
+        frame (DataFrame): 원본 열 + final_url, link_kind, popup_html 열
+        records (tuple[University]): 행 순서의 대학 객체
+        by_name (dict): 대학명 -> University (같은 이름이 여러 행이면 첫 행)
+        name_index (NameIndex): 대학명/초성/줄임말 검색 색인
+        spatial (GridIndex): 위도/경도 격자 색인 (행 번호 = records 순서)
+        facets (FacetIndex): 지역/설립유형/대학 유형 조건 필터 색인 (행 번호 = records 순서)
+        version (str): 데이터 버전 (지도 레이어 등 파생 캐시의 키)
+    """
+
+    def __init__(self, df, version=None):
+        self.version = version
+        df = df.reset_index(drop=True)
+        final_url, link_kind = resolve_links(df)
+        names = df['대학명'].astype(str)
+        df = df.assign(
+            final_url=final_url,
+            link_kind=link_kind,
+            popup_html=popup_html(names, final_url, link_kind),
+        )
+        self.frame = df
+        self.records = tuple(
+            University(*row)
+            for row in zip(
+                range(len(df)), names.tolist(), df['위도'].tolist(), df['경도'].tolist(),
+                df['final_url'].tolist(), df['link_kind'].tolist(), df['popup_html'].tolist(),
+            )
+        )
+        self.by_name = {}
+        for record in self.records:
+            self.by_name.setdefault(record.name, record)
+        self.name_index = name_search.NameIndex(self.by_name)
+        self.spatial = spatial_index.GridIndex(df['위도'].to_numpy(), df['경도'].to_numpy())
+        self.facets = facets.FacetIndex(df)
+
+    def __len__(self):
+        return len(self.records)
+
+    def get(self, name):
+        """대학명으로 찾기 (없으면 None)"""
+        return self.by_name.get(name)
+
+    def search(self, search_term, limit=None, allowed=None):
+        """
+        검색어와 일치하는 대학명 (대학명 일부, 초성, 줄임말, 일치하는 이름이 없으면 오타 허용)
+
+        Args:
+            limit (int): 최대 결과 수 (allowed로 거른 뒤의 개수)
+            allowed (set[str]): 조건 필터에 맞는 대학명 (None이면 거르지 않음)
+
+        Returns:
+            Matches: (대학명 tuple - 순위순, 오타 검색 결과인지)
+        """
+        return self.name_index.search(search_term, limit, allowed=allowed)
+
+    def filter_names(self, selection):
+        """
+        조건 필터에 맞는 대학명 (원래 순서)
+
+        Returns:
+            tuple: 대학명 (조건이 없으면 None = 전체)
+        """
+        rows = self.facets.rows(selection)
+        if rows is None:
+            return None
+        return tuple(dict.fromkeys(self.records[i].name for i in rows))
+
+    def in_bounds(self, south, west, north, east):
+        """사각형 범위 안의 대학 (원래 순서)"""
+        return [self.records[i] for i in self.spatial.in_bounds(south, west, north, east)]
+
+    def nearest(self, lat, lon, n=5, exclude=None):
+        """
+        기준점에서 가까운 대학 n곳
+
+        Args:
+            exclude (str): 결과에서 뺄 대학명 (기준 학교 자신)
+
+        Returns:
+            list: [(University, 거리 km)] 가까운 순
+        """
+        ids, distances = self.spatial.nearest(lat, lon, n + (exclude is not None))
+        pairs = [(self.records[i], float(d)) for i, d in zip(ids, distances)]
+        return [(school, km) for school, km in pairs if school.name != exclude][:n]
+
+    def within_km(self, lat, lon, km):
+        """기준점에서 km 안의 대학 [(University, 거리 km)] 가까운 순"""
+        ids, distances = self.spatial.within_km(lat, lon, km)
+        return [(self.records[i], float(d)) for i, d in zip(ids, distances)]